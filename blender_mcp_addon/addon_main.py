@@ -131,6 +131,8 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         scene = context.scene
 
         layout.prop(scene, "blendermcp_port")
+        layout.prop(scene, "blendermcp_max_request_mb")
+        layout.prop(scene, "blendermcp_dispatch_budget_ms")
         layout.prop(scene, "blendermcp_use_polyhaven", text="Use assets from Poly Haven")
 
         layout.prop(scene, "blendermcp_use_hyper3d", text="Use Hyper3D Rodin 3D model generation")
@@ -183,7 +185,11 @@ class BLENDERMCP_OT_StartServer(bpy.types.Operator):
 
         # Create a new server instance using new modular server
         if not hasattr(bpy.types, "blendermcp_server") or not bpy.types.blendermcp_server:
-            bpy.types.blendermcp_server = BlenderMCPServer(port=scene.blendermcp_port)
+            bpy.types.blendermcp_server = BlenderMCPServer(
+                port=scene.blendermcp_port,
+                max_message_size=scene.blendermcp_max_request_mb * 1024 * 1024,
+                dispatch_budget_ms=scene.blendermcp_dispatch_budget_ms
+            )
 
         # Start the server
         bpy.types.blendermcp_server.start()
@@ -235,6 +241,22 @@ def register():
         max=65535
     )
 
+    bpy.types.Scene.blendermcp_max_request_mb = IntProperty(
+        name="Max Request Size (MB)",
+        description="Largest command the BlenderMCP server accepts from a client",
+        default=1,
+        min=1,
+        max=1024
+    )
+
+    bpy.types.Scene.blendermcp_dispatch_budget_ms = IntProperty(
+        name="Command Budget (ms)",
+        description="Main-thread time spent running queued commands before yielding to the UI",
+        default=20,
+        min=1,
+        max=1000
+    )
+
     bpy.types.Scene.blendermcp_server_running = bpy.props.BoolProperty(
         name="Server Running",
         default=False
@@ -372,6 +394,8 @@ def unregister():
 
     # Clean up scene properties
     del bpy.types.Scene.blendermcp_port
+    del bpy.types.Scene.blendermcp_max_request_mb
+    del bpy.types.Scene.blendermcp_dispatch_budget_ms
     del bpy.types.Scene.blendermcp_server_running
     del bpy.types.Scene.blendermcp_use_polyhaven
     del bpy.types.Scene.blendermcp_use_hyper3d
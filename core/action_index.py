@@ -0,0 +1,228 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+import fnmatch
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from core.scene_events import SceneChange, scene_events
+from utils.fcurve_arrays import action_fcurves
+
+_BONE_PATH = re.compile(r'^pose\.bones\["((?:[^"\\]|\\.)*)"\]')
+
+
+class ActionSummary:
+    """Metadata of one action, computed once per change of the action"""
+
+    __slots__ = ("name", "frame_start", "frame_end", "fcurves", "key_count", "bones")
+
+    def __init__(self, action):
+        self.name = action.name
+        frame_range = action.frame_range
+        self.frame_start = float(frame_range[0])
+        self.frame_end = float(frame_range[1])
+        self.fcurves: List[Tuple[str, int, int]] = []
+        bones = set()
+        for fcurve in action_fcurves(action):
+            self.fcurves.append((fcurve.data_path, fcurve.array_index, len(fcurve.keyframe_points)))
+            match = _BONE_PATH.match(fcurve.data_path)
+            if match:
+                bones.add(match.group(1).replace('\\"', '"'))
+        self.key_count = sum(count for _, _, count in self.fcurves)
+        self.bones = frozenset(bones)
+
+    def matches(self, action) -> bool:
+        """Cheap fingerprint check without walking F-curves: same channel count and frame range"""
+        if len(action_fcurves(action)) != len(self.fcurves):
+            return False
+        frame_range = action.frame_range
+        return (float(frame_range[0]), float(frame_range[1])) == (self.frame_start, self.frame_end)
+
+
+class ActionIndex:
+    """
+    Index of bpy.data.actions for fast filtered listing.
+
+    Summaries (frame range, channels, keys, animated bones) are computed
+    once and recomputed only for actions the depsgraph reports as changed.
+    Which objects use an action (as active action or in an NLA strip) is
+    tracked per object from object updates. Loads, undo and redo rebuild
+    everything; without change tracking the index is rebuilt on every
+    query. Creations, deletions and renames are found by comparing names,
+    which is cheap compared with walking F-curves, and make every object's
+    used actions be recomputed. Actions no object uses (fake user or
+    unassigned) are outside the depsgraph, so when a lookup or query
+    reaches one it is checked against a fingerprint (channel count and
+    frame range) and recomputed if that changed. Edits to such actions
+    that keep both, e.g. a renamed data path, show up once the action is
+    used again.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ActionSummary] = {}
+        self._by_bone: Dict[str, Set[str]] = {}
+        self._object_actions: Dict[str, Set[str]] = {}  # Object name -> names of actions it uses
+        self._users: Optional[Dict[str, List[str]]] = None
+        self._stale_actions: Set[str] = set()
+        self._stale_objects: Set[str] = set()
+        self._reconcile_objects = False
+        self._rebuild = True
+        self.summaries_computed = 0
+
+    def on_change(self, change: SceneChange) -> None:
+        if change.full_reset:
+            self._rebuild = True
+            return
+        for update in change.updates:
+            if update.id_type == 'ACTION':
+                self._stale_actions.add(update.name)
+            elif update.id_type == 'OBJECT':
+                self._stale_objects.add(update.name)
+            elif update.id_type in ('COLLECTION', 'SCENE'):
+                self._reconcile_objects = True
+
+    def refresh(self) -> None:
+        """Bring the index up to date with bpy.data (call from the main thread before reading)"""
+        scene_events.sync()
+        if self._rebuild or not scene_events.active:
+            self._entries.clear()
+            self._by_bone.clear()
+            for action in bpy.data.actions:
+                self._store(ActionSummary(action))
+            self._object_actions = {obj.name: self._used_actions(obj) for obj in bpy.data.objects}
+            self._stale_actions.clear()
+            self._stale_objects.clear()
+            self._reconcile_objects = False
+            self._users = None
+            self._rebuild = False
+            return
+
+        actions = bpy.data.actions
+        names = set(actions.keys())
+        known = set(self._entries)
+        if names != known:
+            # Objects refer to actions by name, so renames leave _object_actions outdated
+            self._reconcile_objects = True
+        for name in known - names:
+            self._drop(name)
+        stale = (self._stale_actions & names) | (names - known)
+        for name in stale:
+            self._store(ActionSummary(actions[name]))
+        self._stale_actions.clear()
+
+        objects = bpy.data.objects
+        if self._reconcile_objects:
+            self._object_actions = {obj.name: self._used_actions(obj) for obj in objects}
+        else:
+            for name in self._stale_objects:
+                obj = objects.get(name)
+                if obj is None:
+                    self._object_actions.pop(name, None)
+                else:
+                    self._object_actions[name] = self._used_actions(obj)
+        if self._reconcile_objects or self._stale_objects:
+            self._stale_objects.clear()
+            self._reconcile_objects = False
+            self._users = None
+
+    def _store(self, summary: ActionSummary) -> None:
+        self._drop(summary.name)
+        self._entries[summary.name] = summary
+        for bone in summary.bones:
+            self._by_bone.setdefault(bone, set()).add(summary.name)
+        self.summaries_computed += 1
+
+    def _drop(self, name: str) -> None:
+        summary = self._entries.pop(name, None)
+        if summary is None:
+            return
+        for bone in summary.bones:
+            names = self._by_bone.get(bone)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_bone[bone]
+
+    @staticmethod
+    def _used_actions(obj) -> Set[str]:
+        anim = obj.animation_data
+        if anim is None:
+            return set()
+        used = {anim.action.name} if anim.action else set()
+        for track in anim.nla_tracks:
+            for strip in track.strips:
+                if strip.action:
+                    used.add(strip.action.name)
+        return used
+
+    def users(self) -> Dict[str, List[str]]:
+        """Action name -> objects using it"""
+        if self._users is None:
+            users: Dict[str, List[str]] = {}
+            for obj_name, actions in self._object_actions.items():
+                for action_name in actions:
+                    users.setdefault(action_name, []).append(obj_name)
+            for names in users.values():
+                names.sort()
+            self._users = users
+        return self._users
+
+    def _current(self, name: str, users: Dict[str, List[str]]) -> ActionSummary:
+        """The summary of an action, re-checked first if no object uses it"""
+        summary = self._entries[name]
+        if name not in users:
+            action = bpy.data.actions.get(name)
+            if action is not None and not summary.matches(action):
+                summary = ActionSummary(action)
+                self._store(summary)
+        return summary
+
+    def get(self, name: str) -> Optional[ActionSummary]:
+        if name not in self._entries:
+            return None
+        return self._current(name, self.users())
+
+    def query(self, name_pattern: Optional[str] = None, bones: Optional[Iterable[str]] = None,
+              frame_range: Optional[Tuple[float, float]] = None, used_by: Optional[str] = None,
+              has_users: Optional[bool] = None) -> List[ActionSummary]:
+        """
+        Summaries matching every given filter, sorted by name. Unused actions
+        are fingerprinted only when the name and user filters let them through.
+        """
+        users = self.users()
+        bones = set(bones) if bones else None
+        if bones:
+            candidates = set().union(*(self._by_bone.get(bone, set()) for bone in bones))
+            # An unused action's bones may be outdated until it is checked
+            candidates |= self._entries.keys() - users.keys()
+        else:
+            candidates = self._entries.keys()
+        if used_by is not None:
+            candidates = set(candidates) & self._object_actions.get(used_by, set())
+        regex = re.compile(fnmatch.translate(name_pattern)) if name_pattern else None
+
+        result = []
+        for name in sorted(candidates):
+            if regex is not None and not regex.match(name):
+                continue
+            if has_users is not None and bool(users.get(name)) != has_users:
+                continue
+            summary = self._current(name, users)
+            if bones and not bones & summary.bones:
+                continue
+            if frame_range is not None and (summary.frame_end < frame_range[0] or summary.frame_start > frame_range[1]):
+                continue
+            result.append(summary)
+        return result
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "actions": len(self._entries),
+            "bones": len(self._by_bone),
+            "pending": len(self._stale_actions),
+            "summaries_computed": self.summaries_computed
+        }
+
+
+# Global action index instance
+action_index = ActionIndex()
+scene_events.subscribe(action_index.on_change)
@@ -0,0 +1,175 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+from core.revisions import revisions
+from core.scene_events import SceneChange, scene_events
+
+DEFAULT_MAX_ENTRIES = 100000  # Journal entries kept before old revisions need a full resync
+
+
+class _JournalEntry:
+    __slots__ = ("revision", "id_type", "name", "field")
+
+    def __init__(self, revision: int, id_type: str, name: str, field: Optional[str] = None):
+        self.revision = revision
+        self.id_type = id_type
+        self.name = name
+        self.field = field  # For objects: added, removed, transform, geometry, material, animation, data
+
+
+class SceneChangeJournal:
+    """
+    Bounded log of object, material and action changes keyed by scene revision.
+
+    Answering "what changed since revision N" walks the log backwards from
+    the newest entry, so the cost grows with the number of changes rather
+    than with the size of the scene. Object additions, removals and renames
+    are found by comparing object names only when the depsgraph reports a
+    structural change.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._journal = deque()
+        self._truncated_revision = 0  # Changes at or before this revision are unknown
+        self._last_frame_revision = 0
+        self._known: Set[str] = set()
+        self._actions: Dict[str, Optional[str]] = {}  # Object name -> assigned action name
+
+    def on_change(self, change: SceneChange) -> None:
+        revision = revisions.revision
+        if change.full_reset:
+            self._journal.clear()
+            self._truncated_revision = revision
+            self._rebuild()
+            return
+        if change.kind == "frame":
+            self._last_frame_revision = revision
+            return
+
+        structural = False
+        for update in change.updates:
+            if update.id_type == 'OBJECT':
+                if update.name not in self._known:
+                    structural = True  # Added or renamed
+                    continue
+                for field in self._object_fields(update):
+                    self._append(_JournalEntry(revision, 'OBJECT', update.name, field))
+            elif update.id_type in ('COLLECTION', 'SCENE'):
+                structural = True
+            elif update.id_type in ('MATERIAL', 'ACTION'):
+                self._append(_JournalEntry(revision, update.id_type, update.name))
+
+        if structural:
+            self._reconcile(revision)
+
+    def changes_since(self, since_revision: int) -> Optional[Dict[str, Any]]:
+        """Summarize changes after since_revision, or None if the journal no longer covers it"""
+        if since_revision < self._truncated_revision:
+            return None
+
+        last_event: Dict[str, str] = {}
+        first_event: Dict[str, str] = {}
+        modified: Dict[str, Set[str]] = {}
+        materials: Set[str] = set()
+        actions: Set[str] = set()
+        for entry in reversed(self._journal):
+            if entry.revision <= since_revision:
+                break
+            if entry.id_type == 'MATERIAL':
+                materials.add(entry.name)
+            elif entry.id_type == 'ACTION':
+                actions.add(entry.name)
+            elif entry.field in ("added", "removed"):
+                last_event.setdefault(entry.name, entry.field)
+                first_event[entry.name] = entry.field
+            else:
+                modified.setdefault(entry.name, set()).add(entry.field)
+
+        added, removed = [], []
+        for name, event in last_event.items():
+            if event == "removed":
+                # Created and deleted within the window: nothing to report
+                if first_event[name] != "added":
+                    removed.append(name)
+            else:
+                added.append(name)
+        for name in added + removed:
+            modified.pop(name, None)
+        for name in list(modified):
+            if name not in self._known:
+                del modified[name]  # Renamed or removed later; reported under its new state
+
+        return {
+            "added": sorted(added),
+            "removed": sorted(removed),
+            "modified": {name: sorted(fields) for name, fields in modified.items()},
+            "materials": sorted(materials),
+            "actions": sorted(actions),
+            "frame_changed": self._last_frame_revision > since_revision
+        }
+
+    def animated_objects(self) -> List[str]:
+        """Names of objects with an assigned action"""
+        return sorted(name for name, action in self._actions.items() if action)
+
+    def _object_fields(self, update) -> List[str]:
+        fields = []
+        if update.transform:
+            fields.append("transform")
+        if update.geometry:
+            fields.append("geometry")
+        if update.shading:
+            fields.append("material")
+        obj = bpy.data.objects.get(update.name)
+        action = self._action_name(obj)
+        if self._actions.get(update.name) != action:
+            self._actions[update.name] = action
+            fields.append("animation")
+        return fields or ["data"]
+
+    @staticmethod
+    def _action_name(obj) -> Optional[str]:
+        if obj is None or obj.animation_data is None or obj.animation_data.action is None:
+            return None
+        return obj.animation_data.action.name
+
+    def _append(self, entry: _JournalEntry) -> None:
+        self._journal.append(entry)
+        if len(self._journal) > self.max_entries:
+            dropped = self._journal.popleft()
+            self._truncated_revision = max(self._truncated_revision, dropped.revision)
+
+    def _reconcile(self, revision: int) -> None:
+        """Find added and removed objects by comparing names"""
+        current = set(bpy.data.objects.keys())
+        for name in current - self._known:
+            self._actions[name] = self._action_name(bpy.data.objects.get(name))
+            self._append(_JournalEntry(revision, 'OBJECT', name, "added"))
+        for name in self._known - current:
+            self._actions.pop(name, None)
+            self._append(_JournalEntry(revision, 'OBJECT', name, "removed"))
+        self._known = current
+
+    def _rebuild(self) -> None:
+        try:
+            self._known = set(bpy.data.objects.keys())
+            self._actions = {obj.name: self._action_name(obj) for obj in bpy.data.objects}
+        except AttributeError:
+            # bpy.data is restricted while the addon registers
+            self._known = set()
+            self._actions = {}
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._journal),
+            "max_entries": self.max_entries,
+            "oldest_revision": self._truncated_revision
+        }
+
+
+# Global change journal instance
+change_journal = SceneChangeJournal()
+scene_events.subscribe(change_journal.on_change)
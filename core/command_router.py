@@ -1,22 +1,29 @@
 # Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
 
-from typing import Dict, Optional, Type
+from typing import Any, Dict, List, Optional, Type
+import bpy
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
 from core.response_builder import ResponseBuilder
 from utils.error_handler import ErrorCode, create_error_response
 from utils.logger import logger
 
+BATCH_COMMAND = "batch"
+
 class CommandRouter:
     """Routes commands to appropriate handlers"""
     
     def __init__(self):
         self._handlers: Dict[str, BaseHandler] = {}
         self._handler_classes: Dict[str, Type[BaseHandler]] = {}
+        # Filled at registration so socket threads can look up lanes without touching handlers
+        self._priorities: Dict[str, CommandPriority] = {}
     
     def register_handler(self, handler: BaseHandler) -> None:
         """Register a handler instance"""
         command_name = handler.get_command_name()
         self._handlers[command_name] = handler
+        self._priorities[command_name] = handler.get_priority()
         logger.info(f"Registered handler for command: {command_name}")
     
     def register_handler_class(self, handler_class: Type[BaseHandler]) -> None:
@@ -24,6 +31,7 @@ class CommandRouter:
         handler_instance = handler_class()
         command_name = handler_instance.get_command_name()
         self._handler_classes[command_name] = handler_class
+        self._priorities[command_name] = handler_instance.get_priority()
         logger.info(f"Registered handler class for command: {command_name}")
     
     def route_command(self, command: Dict) -> Dict:
@@ -58,6 +66,9 @@ class CommandRouter:
                     suggestions=["Include 'type' field in command"]
                 )
             
+            if command_type == BATCH_COMMAND:
+                return self._route_batch(command.get("params", {}) or {})
+            
             # Try to get handler instance
             handler = self._handlers.get(command_type)
             
@@ -91,15 +102,97 @@ class CommandRouter:
                 suggestions=["Check command format", "Verify handler is properly registered"]
             )
     
+    def _route_batch(self, params: Dict[str, Any]) -> Dict:
+        """
+        Execute a list of sub-commands in one call, with one undo step and one
+        depsgraph update at the end. Commands that already ran are not rolled
+        back when a later one fails.
+        """
+        commands = params.get("commands")
+        stop_on_error = params.get("stop_on_error", True)
+        undo_message = params.get("undo_message", "MCP Batch")
+        
+        if not isinstance(commands, list) or not commands:
+            return ResponseBuilder.error(
+                error_code=ErrorCode.INVALID_PARAMETER.value,
+                message="commands must be a non-empty list",
+                suggestions=["Pass params.commands as a list of {\"type\": ..., \"params\": {...}} objects"]
+            )
+        
+        results: List[Dict[str, Any]] = []
+        failed = 0
+        stopped_at = None
+        for index, sub_command in enumerate(commands):
+            sub_type = sub_command.get("type") if isinstance(sub_command, dict) else None
+            if sub_type == BATCH_COMMAND:
+                response = ResponseBuilder.error(
+                    error_code=ErrorCode.INVALID_COMMAND.value,
+                    message="Batches cannot be nested"
+                )
+            else:
+                response = self.route_command(sub_command)
+            
+            entry = {"index": index, "type": sub_type, "status": response.get("status")}
+            if response.get("status") == "error":
+                entry["error"] = response.get("error")
+                failed += 1
+            else:
+                entry["result"] = response.get("result")
+            results.append(entry)
+            
+            if failed and stop_on_error:
+                stopped_at = index
+                break
+        
+        # One depsgraph update and one undo step for the whole batch
+        try:
+            bpy.context.view_layer.update()
+            bpy.ops.ed.undo_push(message=undo_message)
+        except Exception as e:
+            logger.warning(f"Could not finalize batch undo step: {str(e)}")
+        
+        summary = {
+            "results": results,
+            "total": len(commands),
+            "executed": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "stopped_at": stopped_at
+        }
+        warnings = None
+        if failed:
+            warnings = [{"message": f"{failed} of {len(results)} batched commands failed"}]
+        return ResponseBuilder.success(summary, warnings=warnings)
+    
+    def get_priority(self, command: Dict) -> CommandPriority:
+        """
+        Get the dispatcher lane for a command, defaulting to MUTATION for
+        unknown commands. Safe to call from socket threads: only the table
+        built at registration is read.
+        """
+        command_type = command.get("type") if isinstance(command, dict) else None
+        if command_type == BATCH_COMMAND:
+            # A batch runs in the lane of its most expensive sub-command
+            sub_commands = (command.get("params", {}) or {}).get("commands") or []
+            if not isinstance(sub_commands, list):
+                return CommandPriority.MUTATION
+            priorities = [
+                self.get_priority(sub) for sub in sub_commands
+                if isinstance(sub, dict) and sub.get("type") != BATCH_COMMAND
+            ]
+            return max(priorities) if priorities else CommandPriority.MUTATION
+        return self._priorities.get(command_type, CommandPriority.MUTATION)
+    
     def get_registered_commands(self) -> list:
         """Get list of all registered command names"""
         commands = list(self._handlers.keys())
         commands.extend(self._handler_classes.keys())
+        commands.append(BATCH_COMMAND)
         return sorted(set(commands))
     
     def has_handler(self, command_type: str) -> bool:
         """Check if a handler exists for a command type"""
-        return command_type in self._handlers or command_type in self._handler_classes
+        return command_type == BATCH_COMMAND or command_type in self._handlers or command_type in self._handler_classes
 
 # Global router instance
 command_router = CommandRouter()
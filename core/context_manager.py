@@ -2,7 +2,9 @@
 
 import bpy
 import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Any, Callable, Optional, Dict
+from core.dispatcher import CommandPriority, dispatcher
 from utils.logger import logger
 
 class ContextManager:
@@ -56,35 +58,45 @@ class ContextManager:
             return bpy.context.temp_override(**context_override)
         return bpy.context
     
-    def execute_in_main_thread(self, func: Callable, *args, **kwargs) -> Any:
+    def execute_in_main_thread(self, func: Callable, *args,
+                               priority: CommandPriority = CommandPriority.MUTATION, **kwargs) -> Any:
         """
         Execute a function in Blender's main thread.
         This is a blocking call that waits for execution.
+        Raises QueueFullError if the dispatcher lane is full.
         """
-        result = [None]
-        exception = [None]
-        event = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            # Already on the main thread; waiting on the dispatcher would deadlock
+            return func(*args, **kwargs)
         
-        def wrapper():
-            try:
-                result[0] = func(*args, **kwargs)
-            except Exception as e:
-                exception[0] = e
-            finally:
-                event.set()
-        
-        # Schedule execution in main thread
-        bpy.app.timers.register(wrapper, first_interval=0.0)
+        if dispatcher.running:
+            # Queue execution on the main-thread dispatcher
+            future = dispatcher.submit(
+                lambda: func(*args, **kwargs),
+                getattr(func, "__name__", "unknown"),
+                priority
+            )
+        else:
+            # No server is running the dispatcher; a one-shot timer still reaches the main thread
+            future = Future()
+            
+            def run_once():
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(func(*args, **kwargs))
+                    except Exception as e:
+                        future.set_exception(e)
+                return None
+            
+            bpy.app.timers.register(run_once, first_interval=0.0)
         
         # Wait for execution (with timeout)
         timeout = 30.0  # 30 second timeout
-        if not event.wait(timeout):
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
             raise TimeoutError(f"Operation timed out after {timeout} seconds")
-        
-        if exception[0]:
-            raise exception[0]
-        
-        return result[0]
     
     def get_viewport_area(self) -> Optional[bpy.types.Area]:
         """Get the active 3D viewport area"""
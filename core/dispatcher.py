@@ -0,0 +1,309 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Callable, Dict, Optional
+import bpy
+from utils.logger import logger
+
+DEFAULT_BUDGET_MS = 20.0     # Main-thread time spent per tick before yielding to the UI
+DEFAULT_IDLE_INTERVAL = 0.01  # Poll interval in seconds while the queue is empty
+MIN_RETRY_AFTER = 0.1         # Smallest retry delay suggested to rejected clients
+DEFAULT_MAX_WAIT = 0.5        # Seconds a lower lane waits behind busier lanes before it is served anyway
+
+
+class CommandPriority(IntEnum):
+    """Dispatcher lanes, served in ascending order"""
+    INTERACTIVE = 0  # Cheap reads such as get_object_info
+    MUTATION = 1     # Scene edits
+    HEAVY = 2        # Renders, bakes, auto-rigging and network downloads
+
+
+DEFAULT_LANE_LIMITS = {
+    CommandPriority.INTERACTIVE: 256,
+    CommandPriority.MUTATION: 256,
+    CommandPriority.HEAVY: 8,
+}
+
+
+class QueueFullError(Exception):
+    """Raised when a lane is full and the command should be retried later"""
+
+    def __init__(self, priority: CommandPriority, queue_depth: int, retry_after: float):
+        self.priority = priority
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        super().__init__(
+            f"Blender is busy: {priority.name.lower()} queue is full ({queue_depth} commands), "
+            f"retry after {retry_after:.1f}s"
+        )
+
+
+class _Task:
+    """A unit of work waiting for the main thread"""
+
+    __slots__ = ("func", "command_type", "priority", "future", "enqueued_at")
+
+    def __init__(self, func: Callable[[], Any], command_type: str, priority: CommandPriority):
+        self.func = func
+        self.command_type = command_type
+        self.priority = priority
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class MainThreadDispatcher:
+    """
+    Runs queued work in Blender's main thread from one persistent timer.
+
+    Worker threads submit callables to bounded, thread-safe priority lanes.
+    Each timer tick serves the highest-priority non-empty lane in FIFO order
+    until the millisecond budget is used up, then yields so Blender can
+    process UI events before the next batch. A heavy command always ends
+    the tick so queued reads get a turn right after it. Lanes age: once
+    the oldest command of a lower lane has waited max_wait seconds it is
+    served next, so a stream of reads cannot starve edits or heavy work.
+
+    Long-running work (see core.jobs) registers a background step instead
+    of a command. One background step runs per tick, round-robin, after
+    the queued commands, until the step reports that it is finished.
+    """
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, idle_interval: float = DEFAULT_IDLE_INTERVAL,
+                 lane_limits: Optional[Dict[CommandPriority, int]] = None, max_wait: float = DEFAULT_MAX_WAIT):
+        self.budget_ms = budget_ms
+        self.idle_interval = idle_interval
+        self.max_wait = max_wait
+        self.lane_limits = dict(lane_limits or DEFAULT_LANE_LIMITS)
+        self._lanes = {priority: deque() for priority in CommandPriority}
+        self._background: deque = deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self._timer = None
+        self._ticks = 0
+        self._max_queue_depth = 0
+        self._queued_by_type: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lane_exec_avg = {priority: 0.0 for priority in CommandPriority}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Register the dispatcher timer (call from the main thread)"""
+        if self._running:
+            return
+        self._running = True
+        # Keep one bound method so the same object can be unregistered later
+        self._timer = self._tick
+        bpy.app.timers.register(self._timer, first_interval=0.0, persistent=True)
+        logger.info(f"Main thread dispatcher started (budget: {self.budget_ms}ms per tick)")
+
+    def stop(self) -> None:
+        """Unregister the timer and fail any work that has not run yet"""
+        self._running = False
+        if self._timer is not None:
+            try:
+                if bpy.app.timers.is_registered(self._timer):
+                    bpy.app.timers.unregister(self._timer)
+            except Exception as e:
+                logger.warning(f"Could not unregister dispatcher timer: {str(e)}")
+            self._timer = None
+
+        with self._lock:
+            pending = [task for lane in self._lanes.values() for task in lane]
+            for lane in self._lanes.values():
+                lane.clear()
+            self._queued_by_type.clear()
+            self._background.clear()
+        for task in pending:
+            if task.future.set_running_or_notify_cancel():
+                task.future.set_exception(RuntimeError("Dispatcher stopped before the command ran"))
+        logger.info("Main thread dispatcher stopped")
+
+    def submit(self, func: Callable[[], Any], command_type: str = "unknown",
+               priority: CommandPriority = CommandPriority.MUTATION) -> Future:
+        """
+        Queue a zero-argument callable for the main thread and return its future.
+
+        Raises QueueFullError when the lane for `priority` is at its limit.
+        """
+        task = _Task(func, command_type, priority)
+        with self._lock:
+            lane = self._lanes[priority]
+            if len(lane) >= self.lane_limits.get(priority, 0):
+                self._rejected[command_type] = self._rejected.get(command_type, 0) + 1
+                raise QueueFullError(priority, len(lane), self._estimate_retry_after(priority))
+            lane.append(task)
+            self._queued_by_type[command_type] = self._queued_by_type.get(command_type, 0) + 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth())
+        return task.future
+
+    def add_background(self, step: Callable[[], bool], command_type: str = "background") -> None:
+        """
+        Run `step` once per tick in the main thread until it returns True.
+
+        A step should do a bounded slice of work. Exceptions are logged and
+        remove the step; callers that need to report failures catch them.
+        """
+        with self._lock:
+            self._background.append((command_type, step))
+
+    def _queue_depth(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def _estimate_retry_after(self, priority: CommandPriority) -> float:
+        """Estimate seconds until the lane drains, from the average run time of its own and higher lanes"""
+        backlog = sum(
+            len(self._lanes[lane]) * self._lane_exec_avg[lane]
+            for lane in CommandPriority if lane <= priority
+        )
+        return max(MIN_RETRY_AFTER, round(backlog, 1))
+
+    def _pop(self) -> Optional[_Task]:
+        with self._lock:
+            now = time.perf_counter()
+            chosen = None
+            for priority in CommandPriority:
+                lane = self._lanes[priority]
+                if not lane:
+                    continue
+                if chosen is None:
+                    chosen = lane
+                elif now - lane[0].enqueued_at >= self.max_wait:
+                    # Aged: kept waiting by higher lanes for too long
+                    chosen = lane
+                    break
+            if chosen is None:
+                return None
+            task = chosen.popleft()
+            self._queued_by_type[task.command_type] -= 1
+            return task
+
+    def _tick(self) -> Optional[float]:
+        """Timer callback: run queued work until the time budget is spent"""
+        if not self._running:
+            return None
+
+        self._ticks += 1
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while True:
+            task = self._pop()
+            if task is None:
+                break
+            self._run(task)
+            if task.priority == CommandPriority.HEAVY or time.perf_counter() >= deadline:
+                break
+        self._run_background()
+
+        with self._lock:
+            has_more = self._queue_depth() > 0 or len(self._background) > 0
+        # A zero interval still lets Blender handle UI events before the next batch
+        return 0.0 if has_more else self.idle_interval
+
+    def _run(self, task: _Task) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return  # Cancelled while queued
+
+        started = time.perf_counter()
+        try:
+            task.future.set_result(task.func())
+        except Exception as e:
+            logger.error(f"Error running '{task.command_type}' in main thread: {str(e)}")
+            task.future.set_exception(e)
+        finally:
+            finished = time.perf_counter()
+            self._record(task.command_type, started - task.enqueued_at, finished - started)
+            self._update_lane_average(task.priority, finished - started)
+
+    def _run_background(self) -> None:
+        """Run one slice of the next background step and requeue it unless it finished"""
+        with self._lock:
+            if not self._background:
+                return
+            command_type, step = self._background.popleft()
+
+        started = time.perf_counter()
+        try:
+            finished = step()
+        except Exception as e:
+            logger.error(f"Error running background '{command_type}' in main thread: {str(e)}")
+            finished = True
+        self._record(command_type, 0.0, time.perf_counter() - started)
+
+        if not finished:
+            with self._lock:
+                if self._running:
+                    self._background.append((command_type, step))
+
+    def _update_lane_average(self, priority: CommandPriority, execution: float) -> None:
+        """Exponential moving average of run time per lane, used for retry-after estimates"""
+        average = self._lane_exec_avg[priority]
+        self._lane_exec_avg[priority] = execution if average == 0.0 else average * 0.8 + execution * 0.2
+
+    def _record(self, command_type: str, wait: float, execution: float) -> None:
+        stats = self._stats.setdefault(command_type, {
+            "executed": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "exec_total": 0.0,
+            "exec_max": 0.0
+        })
+        stats["executed"] += 1
+        stats["wait_total"] += wait
+        stats["wait_max"] = max(stats["wait_max"], wait)
+        stats["exec_total"] += execution
+        stats["exec_max"] = max(stats["exec_max"], execution)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and execution time per command type"""
+        with self._lock:
+            queue_depth = self._queue_depth()
+            background = len(self._background)
+            queued_by_type = dict(self._queued_by_type)
+            rejected = dict(self._rejected)
+            lanes = {
+                priority.name.lower(): {
+                    "queued": len(self._lanes[priority]),
+                    "limit": self.lane_limits.get(priority, 0)
+                }
+                for priority in CommandPriority
+            }
+
+        commands = {}
+        for command_type in set(self._stats) | set(queued_by_type) | set(rejected):
+            stats = self._stats.get(command_type, {})
+            executed = stats.get("executed", 0)
+            commands[command_type] = {
+                "queued": queued_by_type.get(command_type, 0),
+                "executed": executed,
+                "rejected": rejected.get(command_type, 0),
+                "wait_ms": {
+                    "avg": round(stats["wait_total"] / executed * 1000, 3) if executed else 0.0,
+                    "max": round(stats.get("wait_max", 0.0) * 1000, 3)
+                },
+                "exec_ms": {
+                    "avg": round(stats["exec_total"] / executed * 1000, 3) if executed else 0.0,
+                    "max": round(stats.get("exec_max", 0.0) * 1000, 3)
+                }
+            }
+
+        return {
+            "running": self._running,
+            "budget_ms": self.budget_ms,
+            "max_wait_s": self.max_wait,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "lanes": lanes,
+            "background": background,
+            "ticks": self._ticks,
+            "commands": commands
+        }
+
+# Global dispatcher instance
+dispatcher = MainThreadDispatcher()
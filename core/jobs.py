@@ -0,0 +1,173 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from core.dispatcher import dispatcher
+from core.response_builder import Partial
+from core.scene_events import scene_events
+from utils.logger import logger
+from utils.validation import ValidationError
+
+DEFAULT_FRAMES_PER_TICK = 10  # Frames a bake or sample job processes per dispatcher tick
+MAX_FINISHED_JOBS = 32        # Finished jobs kept so clients can still read their result
+
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def validate_frames_per_tick(value: int) -> None:
+    """Validate a job window size"""
+    if value < 1:
+        raise ValidationError("frames_per_tick must be at least 1")
+
+
+class Job:
+    """
+    A long-running command split into slices that run one per dispatcher tick.
+
+    Subclasses implement step(), which processes one window of work,
+    advances `completed` towards `total` and returns True once the last
+    window is done, and finish(), which returns the command's result.
+    cleanup() runs after the job ends for any reason, including
+    cancellation, and should restore scene state the job changed.
+    """
+
+    def __init__(self, command: str, total: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.command = command
+        self.total = total
+        self.completed = 0
+        self.state = RUNNING
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.cancel_requested = False
+
+    def step(self) -> bool:
+        raise NotImplementedError
+
+    def finish(self) -> Any:
+        return None
+
+    def cleanup(self) -> None:
+        pass
+
+    def run(self) -> Any:
+        """Run every slice now, for callers that want the result in the same command"""
+        try:
+            while not self.step():
+                pass
+            return self.finish()
+        finally:
+            self.cleanup()
+
+    @property
+    def finished(self) -> bool:
+        return self.state != RUNNING
+
+    def to_dict(self) -> Dict[str, Any]:
+        info = {
+            "job_id": self.id,
+            "command": self.command,
+            "state": self.state,
+            "completed": self.completed,
+            "total": self.total,
+            "elapsed_s": round((self.finished_at or time.time()) - self.created_at, 3)
+        }
+        if self.error:
+            # Not "error": handlers treat a result with that key as a failed command
+            info["message"] = self.error
+        return info
+
+
+class JobManager:
+    """Starts jobs on the dispatcher and keeps their state for status queries and cancellation"""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, job: Job) -> Job:
+        """Register a job and advance it one slice per dispatcher tick (call from the main thread)"""
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        dispatcher.add_background(lambda: self._step(job), command_type=f"{job.command}:job")
+        logger.info(f"Started job {job.id} ({job.command}, {job.total} frames)")
+        return job
+
+    def _step(self, job: Job) -> bool:
+        if job.finished:
+            return True
+        if job.cancel_requested:
+            self._end(job, CANCELLED)
+            return True
+
+        try:
+            # Jobs edit the scene between commands, outside BaseHandler.handle
+            scene_events.mark_dirty()
+            if not job.step():
+                return False
+            job.result = job.finish()
+            self._end(job, COMPLETED)
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.command}) failed: {str(e)}")
+            job.error = str(e)
+            self._end(job, FAILED)
+        return True
+
+    def _end(self, job: Job, state: str) -> None:
+        try:
+            job.cleanup()
+        except Exception as e:
+            logger.warning(f"Cleanup of job {job.id} failed: {str(e)}")
+        job.state = state
+        job.finished_at = time.time()
+        logger.info(f"Job {job.id} ({job.command}) {state} after {job.completed}/{job.total} frames")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; the job stops before its next slice"""
+        job = self.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel_requested = True
+        return job
+
+    def cancel_all(self, reason: str) -> None:
+        """Mark every running job cancelled, e.g. when the server stops and no more ticks will run"""
+        with self._lock:
+            running = [job for job in self._jobs.values() if not job.finished]
+        for job in running:
+            job.error = reason
+            self._end(job, CANCELLED)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+
+# Global job manager
+jobs = JobManager()
+
+
+def run_job(job: Job, background: bool) -> Any:
+    """Run a job to completion now, or start it in the background and report its progress"""
+    if not background:
+        return job.run()
+    jobs.start(job)
+    return Partial(job.to_dict(), job.completed, job.total)
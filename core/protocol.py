@@ -0,0 +1,124 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+"""
+Wire protocol for the Blender MCP socket connection.
+
+Version 1 (legacy): every message is a bare JSON document and the receiver
+finds message boundaries by parsing the buffer.
+Version 2 (framed): every message is a 4-byte big-endian payload length
+followed by the UTF-8 JSON payload.
+Version 3 (multiplexed): version 2 framing where every request carries a
+client-assigned `id` that is echoed on its response. Clients may keep many
+requests in flight and responses may arrive in any order.
+
+Connections start in version 1. A client opts into a newer version by
+sending a `negotiate_protocol` command; once the reply has been sent both
+sides switch to the agreed framing.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List
+
+PROTOCOL_LEGACY = 1
+PROTOCOL_FRAMED = 2
+PROTOCOL_MULTIPLEXED = 3
+SUPPORTED_PROTOCOLS = (PROTOCOL_MULTIPLEXED, PROTOCOL_FRAMED, PROTOCOL_LEGACY)
+
+NEGOTIATE_COMMAND = "negotiate_protocol"
+
+DEFAULT_MAX_MESSAGE_SIZE = 1024 * 1024  # 1MB
+
+FRAME_HEADER = struct.Struct("!I")
+
+
+class ProtocolError(Exception):
+    """Raised when the peer violates the wire protocol"""
+    pass
+
+
+def encode_message(message: Dict[str, Any], protocol: int = PROTOCOL_LEGACY) -> bytes:
+    """Serialize a message using the given protocol version"""
+    payload = json.dumps(message).encode('utf-8')
+    if protocol >= PROTOCOL_FRAMED:
+        return FRAME_HEADER.pack(len(payload)) + payload
+    return payload
+
+
+def get_request_id(message: Any) -> Any:
+    """Return the client-assigned request id of a message, if any"""
+    if isinstance(message, dict):
+        return message.get("id")
+    return None
+
+
+def choose_protocol(requested: Any) -> int:
+    """Pick the highest protocol version supported by both peers"""
+    if not isinstance(requested, (list, tuple)):
+        requested = [requested]
+    for version in SUPPORTED_PROTOCOLS:
+        if version in requested:
+            return version
+    return PROTOCOL_LEGACY
+
+
+class MessageDecoder:
+    """
+    Incremental decoder that turns received bytes into messages.
+
+    In framed mode every byte is inspected once, so receiving an N-byte
+    message is linear in N. Legacy mode only attempts a parse when the
+    buffer could end a JSON object.
+    """
+
+    def __init__(self, protocol: int = PROTOCOL_LEGACY, max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE):
+        self.protocol = protocol
+        self.max_message_size = max_message_size
+        self._buffer = bytearray()
+
+    @property
+    def buffered(self) -> int:
+        """Number of bytes received but not yet decoded"""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add received bytes and return every message completed by them"""
+        self._buffer += data
+        if self.protocol >= PROTOCOL_FRAMED:
+            return self._decode_framed()
+        return self._decode_legacy()
+
+    def _decode_framed(self) -> List[Any]:
+        messages = []
+        header_size = FRAME_HEADER.size
+        while len(self._buffer) >= header_size:
+            (length,) = FRAME_HEADER.unpack_from(self._buffer)
+            if length > self.max_message_size:
+                raise ProtocolError(
+                    f"Message of {length} bytes exceeds limit of {self.max_message_size} bytes"
+                )
+            end = header_size + length
+            if len(self._buffer) < end:
+                break
+            payload = bytes(self._buffer[header_size:end])
+            del self._buffer[:end]
+            try:
+                messages.append(json.loads(payload.decode('utf-8')))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise ProtocolError(f"Invalid JSON payload in frame: {str(e)}")
+        return messages
+
+    def _decode_legacy(self) -> List[Any]:
+        if len(self._buffer) > self.max_message_size:
+            raise ProtocolError(
+                f"Buffer of {len(self._buffer)} bytes exceeds limit of {self.max_message_size} bytes"
+            )
+        # A JSON object can only be complete if the buffer ends with '}'
+        if not self._buffer.rstrip().endswith(b'}'):
+            return []
+        try:
+            message = json.loads(self._buffer.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return []
+        self._buffer.clear()
+        return [message]
@@ -5,6 +5,20 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 import bpy
 
+class NotModified:
+    """Returned by a handler when the client's if_none_match token is still current"""
+    
+    def __init__(self, etag: str):
+        self.etag = etag
+
+class Partial:
+    """Returned by a handler whose work continues after the response, e.g. a background job"""
+    
+    def __init__(self, result: Any, completed: int, total: int):
+        self.result = result
+        self.completed = completed
+        self.total = total
+
 class ResponseBuilder:
     """Builds standardized responses for MCP commands"""
     
@@ -66,6 +80,14 @@ class ResponseBuilder:
         
         return response
     
+    @staticmethod
+    def not_modified(etag: str) -> Dict[str, Any]:
+        """Build a minimal response for a conditional read whose data is unchanged"""
+        return {
+            "status": "not_modified",
+            "etag": etag
+        }
+    
     @staticmethod
     def partial(
         result: Any,
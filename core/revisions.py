@@ -0,0 +1,100 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+import re
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from core.scene_events import SceneChange, scene_events
+
+
+class SceneRevisionTracker:
+    """
+    Monotonic revision counters for ETag-style conditional reads.
+
+    The scene revision increases on every tracked change. Each object keeps
+    the revision of its last change; frame changes, loads and undo raise a
+    floor under all objects at once, since any of them may have moved.
+    Object reads include material names and mesh sizes, so changes to a
+    material or mesh also count as changes of the objects using it.
+    Tokens include a per-session id so they never match across restarts.
+    """
+
+    def __init__(self):
+        self._session = uuid.uuid4().hex[:8]
+        self._revision = 0
+        self._floor = 0
+        self._object_revisions: Dict[str, int] = {}
+
+    @property
+    def session(self) -> str:
+        return self._session
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def object_revision(self, name: str) -> int:
+        return max(self._object_revisions.get(name, 0), self._floor)
+
+    def scene_etag(self) -> str:
+        return f"{self._session}:{self._revision}"
+
+    def object_etag(self, name: str) -> str:
+        return f"{self._session}:{self.object_revision(name)}"
+
+    def on_change(self, change: SceneChange) -> None:
+        self._revision += 1
+        if change.kind != "depsgraph":
+            # Anything may have changed: raise every object's revision at once
+            self._floor = self._revision
+            if change.full_reset:
+                self._object_revisions.clear()
+            return
+        data_updates = set()
+        for update in change.updates:
+            if update.id_type == 'OBJECT':
+                self._object_revisions[update.name] = self._revision
+            elif update.id_type in ('MATERIAL', 'MESH'):
+                data_updates.add((update.id_type, update.name))
+        if data_updates:
+            for obj in bpy.data.objects:
+                if self._uses_data(obj, data_updates):
+                    self._object_revisions[obj.name] = self._revision
+
+    @staticmethod
+    def _uses_data(obj, data_updates) -> bool:
+        if obj.type == 'MESH' and obj.data is not None and ('MESH', obj.data.name) in data_updates:
+            return True
+        return any(slot.material is not None and ('MATERIAL', slot.material.name) in data_updates
+                   for slot in obj.material_slots)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "session": self._session,
+            "revision": self._revision,
+            "tracked_objects": len(self._object_revisions)
+        }
+
+
+def etag_matches(params: Dict[str, Any], etag: str) -> bool:
+    """True when a read can be answered with not_modified (only while change tracking is active)"""
+    token: Optional[str] = params.get("if_none_match")
+    return bool(token) and scene_events.active and token == etag
+
+
+def encode_cursor(offset: int) -> str:
+    """Pagination cursor for the item at offset, tied to the current scene revision"""
+    return f"{offset}@{revisions.revision}"
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """Return (offset, revision) from a cursor returned by a previous page"""
+    match = re.fullmatch(r"(\d+)@(\d+)", cursor)
+    if not match:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(match.group(1)), int(match.group(2))
+
+
+# Global revision tracker instance
+revisions = SceneRevisionTracker()
+scene_events.subscribe(revisions.on_change)
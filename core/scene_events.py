@@ -0,0 +1,172 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+from bpy.app.handlers import persistent
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Set
+from utils.cache import cache
+from utils.logger import logger
+
+
+@dataclass
+class IDUpdate:
+    """One changed data-block reported by the depsgraph"""
+    id_type: str  # bpy.types.ID.id_type, e.g. 'OBJECT', 'MATERIAL', 'SCENE'
+    name: str
+    transform: bool = False
+    geometry: bool = False
+    shading: bool = False
+
+
+@dataclass
+class SceneChange:
+    """A batch of changes delivered to subscribers"""
+    kind: str  # "depsgraph", "frame", "load", "undo", "redo" or "reset"
+    scene: Optional[str] = None
+    updates: List[IDUpdate] = field(default_factory=list)
+
+    @property
+    def full_reset(self) -> bool:
+        """Loads, undo and redo replace the whole file state"""
+        return self.kind not in ("depsgraph", "frame")
+
+    def tags(self) -> Set[str]:
+        """Cache tags touched by this change: 'OBJECT' and 'OBJECT:<name>' style"""
+        tags = set()
+        if self.kind == "frame":
+            # Animated values change without depsgraph_update_post firing
+            tags.add("FRAME")
+            tags.add(f"SCENE:{self.scene}")
+        for update in self.updates:
+            tags.add(update.id_type)
+            tags.add(f"{update.id_type}:{update.name}")
+        return tags
+
+
+class SceneEventMonitor:
+    """Turns Blender's depsgraph, load and undo handlers into SceneChange notifications"""
+
+    def __init__(self):
+        self._subscribers: List[Callable[[SceneChange], None]] = []
+        self._active = False
+        self._dirty = False
+
+    @property
+    def active(self) -> bool:
+        """True while the Blender handlers are installed"""
+        return self._active
+
+    def subscribe(self, callback: Callable[[SceneChange], None]) -> None:
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[SceneChange], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def mark_dirty(self) -> None:
+        """Note that a command may have changed data the depsgraph has not evaluated yet"""
+        self._dirty = True
+
+    def sync(self) -> None:
+        """
+        Evaluate pending changes so their depsgraph_update_post notifications
+        arrive before a cached read is served (read-your-writes).
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            bpy.context.view_layer.update()
+        except Exception as e:
+            logger.warning(f"Could not update view layer before cached read: {str(e)}")
+
+    def register(self) -> None:
+        """Install the Blender handlers"""
+        if self._active:
+            return
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+        bpy.app.handlers.frame_change_post.append(_on_frame_change)
+        bpy.app.handlers.load_post.append(_on_load)
+        bpy.app.handlers.undo_post.append(_on_undo)
+        bpy.app.handlers.redo_post.append(_on_redo)
+        self._active = True
+        # Nothing was tracked while the handlers were missing
+        self.publish(SceneChange("reset"))
+        logger.info("Scene event monitor registered")
+
+    def unregister(self) -> None:
+        """Remove the Blender handlers"""
+        if not self._active:
+            return
+        for handlers, callback in (
+            (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+            (bpy.app.handlers.frame_change_post, _on_frame_change),
+            (bpy.app.handlers.load_post, _on_load),
+            (bpy.app.handlers.undo_post, _on_undo),
+            (bpy.app.handlers.redo_post, _on_redo),
+        ):
+            if callback in handlers:
+                handlers.remove(callback)
+        self._active = False
+        logger.info("Scene event monitor unregistered")
+
+    def publish(self, change: SceneChange) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(f"Scene change subscriber {getattr(callback, '__name__', callback)} failed: {str(e)}")
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    updates = []
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", None) or update.id
+        if id_data is None:
+            continue
+        updates.append(IDUpdate(
+            id_type=id_data.id_type,
+            name=id_data.name,
+            transform=update.is_updated_transform,
+            geometry=update.is_updated_geometry,
+            shading=update.is_updated_shading
+        ))
+    if updates:
+        scene_events.publish(SceneChange("depsgraph", scene.name if scene else None, updates))
+
+
+@persistent
+def _on_frame_change(scene, *args):
+    scene_events.publish(SceneChange("frame", scene.name if scene else None))
+
+
+@persistent
+def _on_load(*args):
+    scene_events.publish(SceneChange("load"))
+
+
+@persistent
+def _on_undo(*args):
+    scene_events.publish(SceneChange("undo"))
+
+
+@persistent
+def _on_redo(*args):
+    scene_events.publish(SceneChange("redo"))
+
+
+def _invalidate_cache(change: SceneChange) -> None:
+    """Drop cached reads that depend on the changed data-blocks"""
+    if change.full_reset:
+        cache.clear()
+    else:
+        cache.invalidate_tags(change.tags())
+
+
+# Global scene event monitor instance
+scene_events = SceneEventMonitor()
+scene_events.subscribe(_invalidate_cache)
@@ -9,14 +9,32 @@ import os
 from datetime import datetime
 import bpy
 from core.command_router import command_router
+from core.dispatcher import DEFAULT_BUDGET_MS, QueueFullError, dispatcher
+from core.jobs import jobs
+from core.scene_events import scene_events
+from core.protocol import (
+    DEFAULT_MAX_MESSAGE_SIZE,
+    NEGOTIATE_COMMAND,
+    PROTOCOL_LEGACY,
+    SUPPORTED_PROTOCOLS,
+    MessageDecoder,
+    ProtocolError,
+    choose_protocol,
+    encode_message,
+    get_request_id
+)
+from utils.error_handler import ErrorCode, create_error_response
 from utils.logger import logger
 
 class BlenderMCPServer:
     """Socket server for Blender MCP communication"""
     
-    def __init__(self, host='localhost', port=9876):
+    def __init__(self, host='localhost', port=9876, max_message_size=DEFAULT_MAX_MESSAGE_SIZE,
+                 dispatch_budget_ms=DEFAULT_BUDGET_MS):
         self.host = host
         self.port = port
+        self.max_message_size = max_message_size  # Largest accepted request in bytes
+        self.dispatch_budget_ms = dispatch_budget_ms  # Main-thread time per dispatcher tick
         self.running = False
         self.socket = None
         self.server_thread = None
@@ -37,6 +55,13 @@ class BlenderMCPServer:
             self.socket.bind((self.host, self.port))
             self.socket.listen(5)  # Allow multiple connections
             
+            # Start the main-thread dispatcher that runs received commands
+            dispatcher.budget_ms = self.dispatch_budget_ms
+            dispatcher.start()
+            
+            # Track scene changes so cached reads stay valid until something changes
+            scene_events.register()
+            
             # Start server thread
             self.server_thread = threading.Thread(target=self._server_loop)
             self.server_thread.daemon = True
@@ -59,6 +84,9 @@ class BlenderMCPServer:
     def stop(self):
         """Stop the MCP server"""
         self.running = False
+        jobs.cancel_all("Server stopped")
+        dispatcher.stop()
+        scene_events.unregister()
         
         # Close all active client connections
         for client in self.active_clients[:]:
@@ -129,7 +157,8 @@ class BlenderMCPServer:
         logger.info(f"Client handler started for {address}")
         self.active_clients.append(client)
         client.settimeout(None)  # No timeout
-        buffer = b''
+        decoder = MessageDecoder(PROTOCOL_LEGACY, self.max_message_size)
+        send_lock = threading.Lock()  # Responses are sent from both the client and main threads
         
         try:
             while self.running:
@@ -140,67 +169,27 @@ class BlenderMCPServer:
                         logger.info(f"Client {address} disconnected")
                         break
                     
-                    buffer += data
                     try:
-                        # Try to parse command
-                        command = json.loads(buffer.decode('utf-8'))
-                        buffer = b''
+                        commands = decoder.feed(data)
+                    except ProtocolError as protocol_error:
+                        logger.error(f"Protocol error from {address}, closing connection: {str(protocol_error)}")
+                        break
+                    
+                    if not commands and decoder.buffered and decoder.buffered % 8192 == 0:
+                        # Log incomplete messages (but not too frequently)
+                        logger.debug(f"Incomplete message from {address}, waiting for more data (current size: {decoder.buffered} bytes)")
+                    
+                    for command in commands:
+                        if isinstance(command, dict) and command.get("type") == NEGOTIATE_COMMAND:
+                            # Reply with the current framing, then switch
+                            response = self._negotiate_protocol(command)
+                            self._send_response(client, command, response, decoder.protocol, send_lock)
+                            decoder.protocol = response["result"]["version"]
+                            logger.info(f"Client {address} using protocol version {decoder.protocol}")
+                            continue
                         
                         # Execute command in Blender's main thread
-                        def execute_wrapper():
-                            command_type = command.get("type", "unknown") if isinstance(command, dict) else "unknown"
-                            try:
-                                logger.debug(f"Executing command '{command_type}' from {address}")
-                                response = self.execute_command(command)
-                                
-                                # Log response status
-                                response_status = response.get("status", "unknown")
-                                if response_status == "error":
-                                    error_info = response.get("error", {})
-                                    logger.error(
-                                        f"Command '{command_type}' failed: {error_info.get('code', 'UNKNOWN')} - "
-                                        f"{error_info.get('message', 'No message')}"
-                                    )
-                                else:
-                                    logger.debug(f"Command '{command_type}' succeeded")
-                                
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode('utf-8'))
-                                    logger.debug(f"Response sent for command '{command_type}' to {address}")
-                                except Exception as e:
-                                    logger.error(f"Failed to send response to {address} for command '{command_type}': {str(e)}")
-                                    logger.exception("Send error details:")
-                            except Exception as e:
-                                logger.error(f"Exception executing command '{command_type}' from {address}: {str(e)}")
-                                logger.exception("Command execution error details:")
-                                try:
-                                    error_response = {
-                                        "status": "error",
-                                        "error": {
-                                            "code": "EXECUTION_ERROR",
-                                            "message": str(e)
-                                        }
-                                    }
-                                    client.sendall(json.dumps(error_response).encode('utf-8'))
-                                    logger.debug(f"Error response sent to {address}")
-                                except Exception as send_error:
-                                    logger.error(f"Failed to send error response to {address}: {str(send_error)}")
-                            return None
-                        
-                        # Schedule execution in main thread
-                        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
-                    except json.JSONDecodeError as json_error:
-                        # Incomplete data, wait for more
-                        # But limit buffer size to prevent memory issues
-                        if len(buffer) > 1024 * 1024:  # 1MB limit
-                            logger.error(f"Buffer too large from {address} ({len(buffer)} bytes), closing connection")
-                            logger.debug(f"Buffer content (first 500 chars): {buffer.decode('utf-8', errors='ignore')[:500]}")
-                            break
-                        # Log incomplete JSON attempts (but not too frequently)
-                        if len(buffer) % 8192 == 0:  # Log every 8KB
-                            logger.debug(f"Incomplete JSON from {address}, waiting for more data (current size: {len(buffer)} bytes)")
-                        pass
+                        self._schedule_command(client, address, command, decoder.protocol, send_lock)
                 except Exception as e:
                     logger.error(f"Error receiving data from {address}: {str(e)}")
                     logger.exception("Receive error details:")
@@ -217,6 +206,90 @@ class BlenderMCPServer:
                 self.active_clients.remove(client)
             logger.info(f"Client handler stopped for {address}")
     
+    def _negotiate_protocol(self, command):
+        """Agree on a wire protocol version with the client"""
+        params = command.get("params", {}) or {}
+        version = choose_protocol(params.get("versions", [PROTOCOL_LEGACY]))
+        # Built by hand: ResponseBuilder reads bpy.context, which is unsafe off the main thread
+        return {
+            "status": "success",
+            "result": {
+                "version": version,
+                "supported_versions": list(SUPPORTED_PROTOCOLS),
+                "max_message_size": self.max_message_size
+            }
+        }
+    
+    def _send_response(self, client, command, response, protocol, send_lock):
+        """Send a response, echoing the request id so pipelined clients can match it"""
+        request_id = get_request_id(command)
+        if request_id is not None:
+            response["id"] = request_id
+        data = encode_message(response, protocol)
+        with send_lock:
+            client.sendall(data)
+    
+    def _schedule_command(self, client, address, command, protocol, send_lock):
+        """Queue a command for execution in Blender's main thread"""
+        command_type = command.get("type", "unknown") if isinstance(command, dict) else "unknown"
+        
+        def execute_wrapper():
+            try:
+                logger.debug(f"Executing command '{command_type}' from {address}")
+                response = self.execute_command(command)
+                
+                # Log response status
+                response_status = response.get("status", "unknown")
+                if response_status == "error":
+                    error_info = response.get("error", {})
+                    logger.error(
+                        f"Command '{command_type}' failed: {error_info.get('code', 'UNKNOWN')} - "
+                        f"{error_info.get('message', 'No message')}"
+                    )
+                else:
+                    logger.debug(f"Command '{command_type}' succeeded")
+                
+                try:
+                    self._send_response(client, command, response, protocol, send_lock)
+                    logger.debug(f"Response sent for command '{command_type}' to {address}")
+                except Exception as e:
+                    logger.error(f"Failed to send response to {address} for command '{command_type}': {str(e)}")
+                    logger.exception("Send error details:")
+            except Exception as e:
+                logger.error(f"Exception executing command '{command_type}' from {address}: {str(e)}")
+                logger.exception("Command execution error details:")
+                try:
+                    error_response = {
+                        "status": "error",
+                        "error": {
+                            "code": "EXECUTION_ERROR",
+                            "message": str(e)
+                        }
+                    }
+                    self._send_response(client, command, error_response, protocol, send_lock)
+                    logger.debug(f"Error response sent to {address}")
+                except Exception as send_error:
+                    logger.error(f"Failed to send error response to {address}: {str(send_error)}")
+            return None
+        
+        # Queue execution on the main-thread dispatcher, rejecting it if its lane is full
+        priority = command_router.get_priority(command)
+        try:
+            dispatcher.submit(execute_wrapper, command_type, priority)
+        except QueueFullError as busy:
+            logger.warning(f"Rejected command '{command_type}' from {address}: {str(busy)}")
+            busy_response = create_error_response(
+                ErrorCode.SERVER_BUSY,
+                str(busy),
+                details={
+                    "retry_after": busy.retry_after,
+                    "priority": busy.priority.name.lower(),
+                    "queue_depth": busy.queue_depth
+                },
+                suggestions=[f"Retry after {busy.retry_after:.1f} seconds"]
+            )
+            self._send_response(client, command, busy_response, protocol, send_lock)
+    
     def execute_command(self, command):
         """Execute a command using the command router"""
         try:
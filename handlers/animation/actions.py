@@ -2,8 +2,18 @@
 # Action handlers for reusable animation blocks
 
 import bpy
+import time
+import numpy as np
 from typing import Dict, Any, List
 from handlers.base_handler import BaseHandler
+from core.action_index import action_index
+from core.dispatcher import CommandPriority
+from core.revisions import decode_cursor, encode_cursor, revisions
+from utils.bake_engine import decompose
+from utils.fcurve_arrays import action_fcurves, find_or_create_fcurve, get_fcurves, write_keyframes
+from utils.keyframe_reduction import reduce_fcurve
+from utils.retarget import Retargeter
+from utils.validation import DEFAULT_PAGE_SIZE, validate_page_size
 from utils.logger import logger
 
 
@@ -98,34 +108,34 @@ class GetActionInfoHandler(BaseHandler):
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Get information about an action"""
+        """Get information about an action from the action index"""
         action_name = params["action_name"]
 
         action = bpy.data.actions.get(action_name)
         if not action:
             raise ValueError(f"Action '{action_name}' not found")
 
-        # Get frame range
-        frame_range = action.frame_range
+        action_index.refresh()
+        summary = action_index.get(action.name)
 
         # Get FCurves info
-        fcurves = []
-        for fcurve in action.fcurves:
-            fcurves.append({
-                "data_path": fcurve.data_path,
-                "array_index": fcurve.array_index,
-                "keyframe_count": len(fcurve.keyframe_points)
-            })
+        fcurves = [
+            {"data_path": data_path, "array_index": array_index, "keyframe_count": keyframe_count}
+            for data_path, array_index, keyframe_count in summary.fcurves
+        ]
 
         return {
             "action_name": action.name,
-            "frame_start": frame_range[0],
-            "frame_end": frame_range[1],
-            "frame_count": int(frame_range[1] - frame_range[0]) + 1,
+            "frame_start": summary.frame_start,
+            "frame_end": summary.frame_end,
+            "frame_count": int(summary.frame_end - summary.frame_start) + 1,
             "fcurves": fcurves,
-            "fcurve_count": len(action.fcurves),
+            "fcurve_count": len(fcurves),
+            "key_count": summary.key_count,
+            "bones": sorted(summary.bones),
             "use_fake_user": action.use_fake_user,
-            "users": action.users
+            "users": action.users,
+            "used_by": action_index.users().get(action.name, [])
         }
 
 
@@ -136,27 +146,66 @@ class ListActionsHandler(BaseHandler):
         return "list_actions"
 
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
-        return {}
+        return {
+            "name_pattern": {"type": str, "required": False},
+            "bones": {"type": (str, list), "required": False},
+            "frame_range": {"type": list, "required": False},
+            "used_by": {"type": str, "required": False},
+            "has_users": {"type": bool, "required": False},
+            "include_bones": {"type": bool, "required": False},
+            "page_size": {"type": int, "required": False, "validator": validate_page_size},
+            "cursor": {"type": str, "required": False}
+        }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """List all actions"""
+        """List actions from the action index, filtered and one page at a time"""
+        frame_range = params.get("frame_range")
+        if frame_range is not None and len(frame_range) != 2:
+            raise ValueError("frame_range must be [start, end]")
+        bones = params.get("bones")
+        page_size = params.get("page_size", DEFAULT_PAGE_SIZE)
+        offset, cursor_revision = decode_cursor(params["cursor"]) if params.get("cursor") else (0, None)
+        include_bones = params.get("include_bones", False)
+
+        action_index.refresh()
+        matches = action_index.query(
+            name_pattern=params.get("name_pattern"),
+            bones=[bones] if isinstance(bones, str) else bones,
+            frame_range=tuple(frame_range) if frame_range is not None else None,
+            used_by=params.get("used_by"),
+            has_users=params.get("has_users")
+        )
+
+        users = action_index.users()
         actions = []
-
-        for action in bpy.data.actions:
-            frame_range = action.frame_range
-            actions.append({
-                "name": action.name,
-                "frame_start": frame_range[0],
-                "frame_end": frame_range[1],
-                "fcurve_count": len(action.fcurves),
+        for summary in matches[offset:offset + page_size]:
+            action = bpy.data.actions.get(summary.name)
+            entry = {
+                "name": summary.name,
+                "frame_start": summary.frame_start,
+                "frame_end": summary.frame_end,
+                "fcurve_count": len(summary.fcurves),
+                "key_count": summary.key_count,
+                "bone_count": len(summary.bones),
                 "use_fake_user": action.use_fake_user,
-                "users": action.users
-            })
+                "users": action.users,
+                "used_by": users.get(summary.name, [])
+            }
+            if include_bones:
+                entry["bones"] = sorted(summary.bones)
+            actions.append(entry)
 
-        return {
+        end = offset + len(actions)
+        result = {
             "actions": actions,
-            "count": len(actions)
+            "count": len(actions),
+            "total": len(matches),
+            "offset": offset,
+            "next_cursor": encode_cursor(end) if end < len(matches) else None
         }
+        if cursor_revision is not None and cursor_revision != revisions.revision:
+            result["scene_changed"] = True
+        return result
 
 
 class DuplicateActionHandler(BaseHandler):
@@ -342,3 +391,118 @@ class GetObjectActionHandler(BaseHandler):
                 "fcurve_count": fcurve_count
             }
         }
+
+
+class RetargetActionHandler(BaseHandler):
+    """Handler for retargeting a whole action from one armature onto another"""
+
+    def get_command_name(self) -> str:
+        return "retarget_action"
+
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "source_armature": {"type": str, "required": True},
+            "target_armature": {"type": str, "required": True},
+            "bone_mapping": {"type": dict, "required": False},
+            "action_name": {"type": str, "required": False},
+            "new_action_name": {"type": str, "required": False},
+            "frame_start": {"type": int, "required": False},
+            "frame_end": {"type": int, "required": False},
+            "step": {"type": (int, float), "required": False},
+            "location_bones": {"type": list, "required": False},
+            "location_scale": {"type": (int, float), "required": False},
+            "reduce_tolerance": {"type": (int, float), "required": False}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Retarget every frame of a source action into a new action on the target armature"""
+        source_name = params["source_armature"]
+        target_name = params["target_armature"]
+        step = params.get("step", 1)
+        reduce_tolerance = params.get("reduce_tolerance")
+
+        source = bpy.data.objects.get(source_name)
+        if not source or source.type != 'ARMATURE':
+            raise ValueError(f"Source armature '{source_name}' not found")
+        target = bpy.data.objects.get(target_name)
+        if not target or target.type != 'ARMATURE':
+            raise ValueError(f"Target armature '{target_name}' not found")
+        if step <= 0:
+            raise ValueError("step must be positive")
+
+        action_name = params.get("action_name")
+        if action_name:
+            source_action = bpy.data.actions.get(action_name)
+            if not source_action:
+                raise ValueError(f"Action '{action_name}' not found")
+        else:
+            source_action = source.animation_data.action if source.animation_data else None
+            if not source_action:
+                raise ValueError(f"Armature '{source_name}' has no action to retarget")
+
+        frame_start = params.get("frame_start", int(source_action.frame_range[0]))
+        frame_end = params.get("frame_end", int(source_action.frame_range[1]))
+        if frame_end < frame_start:
+            raise ValueError("frame_end must not be before frame_start")
+        frames = np.arange(frame_start, frame_end + step * 0.5, step, dtype=np.float64)
+
+        # If no mapping, use same bone names
+        bone_mapping = params.get("bone_mapping") or {
+            pb.name: pb.name for pb in source.pose.bones if target.pose.bones.get(pb.name)
+        }
+
+        start = time.perf_counter()
+        retargeter = Retargeter(source, target, bone_mapping,
+                                params.get("location_bones"), params.get("location_scale"))
+        bases = retargeter.retarget(action_fcurves(source_action), frames)
+        compute_ms = (time.perf_counter() - start) * 1000
+
+        # Write into a new action so the source action and any previous target action stay untouched
+        anim = target.animation_data or target.animation_data_create()
+        previous_action = anim.action.name if anim.action else None
+        new_action = bpy.data.actions.new(name=params.get("new_action_name", f"{source_action.name}_{target_name}"))
+        anim.action = new_action
+        _, fcurves = get_fcurves(target, create=True)
+
+        start = time.perf_counter()
+        location_targets = retargeter.location_targets
+        keys_written = 0
+        for bone_name, matrices in bases.items():
+            rotation_mode = target.pose.bones[bone_name].rotation_mode
+            channels = decompose(matrices, rotation_mode)
+            names = [name for name in channels if name.startswith("rotation")]
+            if bone_name in location_targets:
+                names.append("location")
+            for name in names:
+                values = channels[name]
+                for index in range(values.shape[1]):
+                    fcurve = find_or_create_fcurve(fcurves, f'pose.bones["{bone_name}"].{name}', index, bone_name)
+                    write_keyframes(fcurve, frames, values[:, index], replace=True)
+                    if reduce_tolerance is not None:
+                        keys_written += reduce_fcurve(fcurve, reduce_tolerance)["kept_keys"]
+                    else:
+                        keys_written += len(frames)
+        new_action.update_tag()
+        write_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(f"Retargeted '{source_action.name}' onto {len(bases)} bones of '{target_name}' "
+                    f"over {len(frames)} frames (compute {compute_ms:.1f}ms, write {write_ms:.1f}ms)")
+
+        return {
+            "retargeted": True,
+            "source_armature": source_name,
+            "target_armature": target_name,
+            "source_action": source_action.name,
+            "new_action": new_action.name,
+            "previous_action": previous_action,
+            "frame_start": frame_start,
+            "frame_end": frame_end,
+            "frames": len(frames),
+            "keys_written": keys_written,
+            **retargeter.summary(),
+            "compute_ms": round(compute_ms, 2),
+            "write_ms": round(write_ms, 2)
+        }
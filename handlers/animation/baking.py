@@ -2,17 +2,93 @@
 # Animation baking handlers for converting constraints to keyframes
 
 import bpy
-from typing import Dict, Any, List
+import time
+import numpy as np
+from typing import Dict, Any, List, Callable, Optional
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
+from core.jobs import DEFAULT_FRAMES_PER_TICK, Job, run_job, validate_frames_per_tick
+from utils.bake_engine import BAKE_TYPES, BakeEngine
+from utils.fcurve_arrays import data_path_matcher, evaluate_fcurve, get_fcurves, write_keyframes
+from utils.keyframe_reduction import reduce_fcurve
 from utils.logger import logger
 
 
+class _TransformBakeJob(Job):
+    """Captures a window of frames per slice with the bake engine and writes all keys at the end"""
+
+    def __init__(self, command: str, engine: BakeEngine, window: int, reduce_tolerance: Optional[float],
+                 report: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        super().__init__(command, len(engine.frames))
+        self.engine = engine
+        self.window = window
+        self.reduce_tolerance = reduce_tolerance
+        self.report = report
+
+    def step(self) -> bool:
+        self.engine.capture(max_frames=self.window)
+        self.completed = self.engine.next_index
+        return self.engine.done
+
+    def finish(self) -> Any:
+        result = self.engine.write(self.reduce_tolerance)
+        logger.info(f"Baked {len(result['channels'])} channels over {result['frames_baked']} frames "
+                    f"(capture {result['capture_ms']}ms, write {result['write_ms']}ms)")
+        return self.report(result)
+
+
+class _SampleJob(Job):
+    """Evaluates F-curves one window of frames per slice and writes every sample at the end"""
+
+    def __init__(self, action, fcurves: List[Any], frames: np.ndarray, window: int,
+                 report: Callable[[int], Dict[str, Any]]):
+        super().__init__("sample_animation", len(frames))
+        self.action = action
+        self.fcurves = fcurves
+        self.frames = frames
+        self.window = window
+        self.report = report
+        self.values = np.empty((len(fcurves), len(frames)))
+
+    def step(self) -> bool:
+        window = slice(self.completed, min(self.completed + self.window, self.total))
+        if window.stop > window.start:
+            for row, fcurve in enumerate(self.fcurves):
+                self.values[row, window] = evaluate_fcurve(fcurve, self.frames[window])[0]
+        self.completed = window.stop
+        return self.completed >= self.total
+
+    def finish(self) -> Any:
+        # Nothing is written until every frame was sampled, so new keys cannot bend later samples
+        for fcurve, values in zip(self.fcurves, self.values):
+            write_keyframes(fcurve, self.frames, values)
+        self.action.update_tag()
+        return self.report(len(self.fcurves) * len(self.frames))
+
+
+def _validate_frame_range(frame_start: int, frame_end: int, step: int) -> None:
+    if frame_end < frame_start:
+        raise ValueError("frame_end must not be before frame_start")
+    if step < 1:
+        raise ValueError("step must be at least 1")
+
+
+def _job_window(params: Dict[str, Any], frame_count: int) -> int:
+    """Frames per slice: the configured window in the background, everything at once otherwise"""
+    if params.get("background", False):
+        return params.get("frames_per_tick", DEFAULT_FRAMES_PER_TICK)
+    return max(frame_count, 1)
+
+
 class BakeAnimationHandler(BaseHandler):
     """Handler for baking animation (converting constraints/drivers to keyframes)"""
 
     def get_command_name(self) -> str:
         return "bake_animation"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "object_name": {"type": str, "required": True},
@@ -23,11 +99,13 @@ class BakeAnimationHandler(BaseHandler):
             "visual_keying": {"type": bool, "required": False},
             "clear_constraints": {"type": bool, "required": False},
             "clear_parents": {"type": bool, "required": False},
-            "bake_types": {"type": list, "required": False}
+            "bake_types": {"type": list, "required": False},
+            "background": {"type": bool, "required": False},
+            "frames_per_tick": {"type": int, "required": False, "validator": validate_frames_per_tick}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Bake object animation"""
+        """Bake object animation, optionally as a background job that bakes a window of frames per tick"""
         object_name = params["object_name"]
         frame_start = params["frame_start"]
         frame_end = params["frame_end"]
@@ -37,21 +115,54 @@ class BakeAnimationHandler(BaseHandler):
         clear_constraints = params.get("clear_constraints", False)
         clear_parents = params.get("clear_parents", False)
         bake_types = params.get("bake_types", ['LOCATION', 'ROTATION', 'SCALE'])
+        background = params.get("background", False)
 
         obj = bpy.data.objects.get(object_name)
         if not obj:
             raise ValueError(f"Object '{object_name}' not found")
+        _validate_frame_range(frame_start, frame_end, step)
+
+        def report(**extra) -> Dict[str, Any]:
+            # Count keyframes created
+            keyframe_count = 0
+            if obj.animation_data and obj.animation_data.action:
+                for fcurve in obj.animation_data.action.fcurves:
+                    keyframe_count += len(fcurve.keyframe_points)
+
+            logger.info(f"Baked animation for '{object_name}' from frame {frame_start} to {frame_end}")
+
+            return {
+                "baked": True,
+                "object_name": object_name,
+                "frame_start": frame_start,
+                "frame_end": frame_end,
+                "frame_count": frame_end - frame_start + 1,
+                "keyframes_created": keyframe_count,
+                "clear_constraints": clear_constraints,
+                "clear_parents": clear_parents,
+                **extra
+            }
+
+        if background:
+            # The bake operator keys into the action it reads, so a bake split into windows would
+            # see the keys of earlier windows; the bake engine captures every frame before writing
+            bone_names = None
+            if obj.type == 'ARMATURE' and only_selected:
+                bone_names = {obj.name: [bone.name for bone in obj.pose.bones if bone.bone.select]}
+            engine = BakeEngine(
+                bpy.context.scene, [obj], np.arange(frame_start, frame_end + 1, step),
+                bone_names=bone_names, bake_types=bake_types, clear_parents=clear_parents,
+                clear_constraints=clear_constraints, visual_keying=visual_keying
+            )
+            job = _TransformBakeJob(self.get_command_name(), engine, _job_window(params, len(engine.frames)), None,
+                                    lambda result: report(keys_written=result["keys_written"]))
+            return run_job(job, background)
 
         # Select object
         bpy.ops.object.select_all(action='DESELECT')
         obj.select_set(True)
         bpy.context.view_layer.objects.active = obj
 
-        # Convert bake_types to set for the operator
-        do_location = 'LOCATION' in bake_types
-        do_rotation = 'ROTATION' in bake_types
-        do_scale = 'SCALE' in bake_types
-
         # Bake animation
         bpy.ops.nla.bake(
             frame_start=frame_start,
@@ -64,25 +175,7 @@ class BakeAnimationHandler(BaseHandler):
             use_current_action=True,
             bake_types={'OBJECT'} if obj.type != 'ARMATURE' else {'POSE'}
         )
-
-        # Count keyframes created
-        keyframe_count = 0
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                keyframe_count += len(fcurve.keyframe_points)
-
-        logger.info(f"Baked animation for '{object_name}' from frame {frame_start} to {frame_end}")
-
-        return {
-            "baked": True,
-            "object_name": object_name,
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "frame_count": frame_end - frame_start + 1,
-            "keyframes_created": keyframe_count,
-            "clear_constraints": clear_constraints,
-            "clear_parents": clear_parents
-        }
+        return report()
 
 
 class BakeArmatureAnimationHandler(BaseHandler):
@@ -91,6 +184,9 @@ class BakeArmatureAnimationHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "bake_armature_animation"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "armature_name": {"type": str, "required": True},
@@ -99,11 +195,13 @@ class BakeArmatureAnimationHandler(BaseHandler):
             "step": {"type": int, "required": False},
             "bone_names": {"type": list, "required": False},
             "visual_keying": {"type": bool, "required": False},
-            "clear_constraints": {"type": bool, "required": False}
+            "clear_constraints": {"type": bool, "required": False},
+            "background": {"type": bool, "required": False},
+            "frames_per_tick": {"type": int, "required": False, "validator": validate_frames_per_tick}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Bake armature pose animation"""
+        """Bake armature pose animation, optionally as a background job that bakes a window of frames per tick"""
         armature_name = params["armature_name"]
         frame_start = params["frame_start"]
         frame_end = params["frame_end"]
@@ -116,6 +214,48 @@ class BakeArmatureAnimationHandler(BaseHandler):
         if not armature or armature.type != 'ARMATURE':
             raise ValueError(f"Armature '{armature_name}' not found")
 
+        _validate_frame_range(frame_start, frame_end, step)
+
+        def report(**extra) -> Dict[str, Any]:
+            # Count results
+            keyframe_count = 0
+            bones_baked = []
+            if armature.animation_data and armature.animation_data.action:
+                for fcurve in armature.animation_data.action.fcurves:
+                    keyframe_count += len(fcurve.keyframe_points)
+                    # Extract bone name from data path
+                    if 'pose.bones' in fcurve.data_path:
+                        bone_name = fcurve.data_path.split('"')[1]
+                        if bone_name not in bones_baked:
+                            bones_baked.append(bone_name)
+
+            logger.info(f"Baked {len(bones_baked)} bones for '{armature_name}'")
+
+            return {
+                "baked": True,
+                "armature_name": armature_name,
+                "frame_start": frame_start,
+                "frame_end": frame_end,
+                "bones_baked": bones_baked,
+                "bone_count": len(bones_baked),
+                "keyframes_created": keyframe_count,
+                **extra
+            }
+
+        if params.get("background", False):
+            # Captured in windows and keyed once at the end, see BakeAnimationHandler
+            selected = None
+            if bone_names:
+                selected = [name for name in bone_names if armature.pose.bones.get(name)]
+            engine = BakeEngine(
+                bpy.context.scene, [armature], np.arange(frame_start, frame_end + 1, step),
+                bone_names={armature_name: selected}, clear_constraints=clear_constraints,
+                visual_keying=visual_keying
+            )
+            job = _TransformBakeJob(self.get_command_name(), engine, _job_window(params, len(engine.frames)), None,
+                                    lambda result: report(keys_written=result["keys_written"]))
+            return run_job(job, True)
+
         # Select armature and enter pose mode
         bpy.ops.object.select_all(action='DESELECT')
         armature.select_set(True)
@@ -151,30 +291,71 @@ class BakeArmatureAnimationHandler(BaseHandler):
         finally:
             bpy.ops.object.mode_set(mode='OBJECT')
 
-        # Count results
-        keyframe_count = 0
-        bones_baked = []
-        if armature.animation_data and armature.animation_data.action:
-            for fcurve in armature.animation_data.action.fcurves:
-                keyframe_count += len(fcurve.keyframe_points)
-                # Extract bone name from data path
-                if 'pose.bones' in fcurve.data_path:
-                    bone_name = fcurve.data_path.split('"')[1]
-                    if bone_name not in bones_baked:
-                        bones_baked.append(bone_name)
+        return report()
+
 
-        logger.info(f"Baked {len(bones_baked)} bones for '{armature_name}'")
+class BakeTransformsHandler(BaseHandler):
+    """Handler for baking visual transforms of objects and pose bones without the bake operator"""
 
+    def get_command_name(self) -> str:
+        return "bake_transforms"
+
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
-            "baked": True,
-            "armature_name": armature_name,
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "bones_baked": bones_baked,
-            "bone_count": len(bones_baked),
-            "keyframes_created": keyframe_count
+            "object_names": {"type": list, "required": True},
+            "frame_start": {"type": int, "required": True},
+            "frame_end": {"type": int, "required": True},
+            "step": {"type": (int, float), "required": False},
+            "bone_names": {"type": dict, "required": False},
+            "bake_types": {"type": list, "required": False},
+            "clear_parents": {"type": bool, "required": False},
+            "clear_constraints": {"type": bool, "required": False},
+            "reduce_tolerance": {"type": (int, float), "required": False},
+            "background": {"type": bool, "required": False},
+            "frames_per_tick": {"type": int, "required": False, "validator": validate_frames_per_tick}
         }
 
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Bake objects (world/visual transform) and armatures (pose bones) into keyframes, now or as a background job"""
+        object_names = params["object_names"]
+        frame_start = params["frame_start"]
+        frame_end = params["frame_end"]
+        step = params.get("step", 1)
+        reduce_tolerance = params.get("reduce_tolerance")
+
+        if frame_end < frame_start:
+            raise ValueError("frame_end must not be before frame_start")
+        if step <= 0:
+            raise ValueError("step must be positive")
+
+        missing = [name for name in object_names if not bpy.data.objects.get(name)]
+        if missing:
+            raise ValueError(f"Objects not found: {', '.join(missing)}")
+
+        engine = BakeEngine(
+            bpy.context.scene,
+            [bpy.data.objects[name] for name in object_names],
+            np.arange(frame_start, frame_end + step * 0.5, step),
+            bone_names=params.get("bone_names"),
+            bake_types=params.get("bake_types", BAKE_TYPES),
+            clear_parents=params.get("clear_parents", False),
+            clear_constraints=params.get("clear_constraints", False)
+        )
+        job = _TransformBakeJob(
+            self.get_command_name(), engine, _job_window(params, len(engine.frames)), reduce_tolerance,
+            lambda result: {
+                "baked": True,
+                "object_names": object_names,
+                "frame_start": frame_start,
+                "frame_end": frame_end,
+                **result
+            }
+        )
+        return run_job(job, params.get("background", False))
+
 
 class SampleAnimationHandler(BaseHandler):
     """Handler for sampling animation at regular intervals"""
@@ -182,62 +363,63 @@ class SampleAnimationHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "sample_animation"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "object_name": {"type": str, "required": True},
             "frame_start": {"type": int, "required": False},
             "frame_end": {"type": int, "required": False},
-            "sample_rate": {"type": int, "required": False}
+            "sample_rate": {"type": int, "required": False},
+            "background": {"type": bool, "required": False},
+            "frames_per_tick": {"type": int, "required": False, "validator": validate_frames_per_tick}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Sample animation at regular intervals (adds keyframes)"""
+        """Sample animation at regular intervals (adds keyframes), optionally as a background job"""
         object_name = params["object_name"]
         frame_start = params.get("frame_start")
         frame_end = params.get("frame_end")
         sample_rate = params.get("sample_rate", 1)
 
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be at least 1")
+
         obj = bpy.data.objects.get(object_name)
         if not obj:
             raise ValueError(f"Object '{object_name}' not found")
 
-        if not obj.animation_data or not obj.animation_data.action:
+        action, fcurves = get_fcurves(obj)
+        if action is None:
             raise ValueError("Object has no animation data")
 
-        action = obj.animation_data.action
-
         # Use action frame range if not specified
         if frame_start is None:
             frame_start = int(action.frame_range[0])
         if frame_end is None:
             frame_end = int(action.frame_range[1])
 
-        keyframes_added = 0
-
-        # Sample each fcurve
-        for fcurve in action.fcurves:
-            for frame in range(frame_start, frame_end + 1, sample_rate):
-                # Evaluate curve at this frame
-                value = fcurve.evaluate(frame)
+        frames = np.arange(frame_start, frame_end + 1, sample_rate, dtype=np.float64)
 
-                # Add keyframe
-                fcurve.keyframe_points.insert(frame, value)
-                keyframes_added += 1
+        def report(keyframes_added: int) -> Dict[str, Any]:
+            logger.info(f"Sampled animation for '{object_name}' at rate {sample_rate}")
 
-        logger.info(f"Sampled animation for '{object_name}' at rate {sample_rate}")
+            return {
+                "sampled": True,
+                "object_name": object_name,
+                "frame_start": frame_start,
+                "frame_end": frame_end,
+                "sample_rate": sample_rate,
+                "keyframes_added": keyframes_added
+            }
 
-        return {
-            "sampled": True,
-            "object_name": object_name,
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "sample_rate": sample_rate,
-            "keyframes_added": keyframes_added
-        }
+        job = _SampleJob(action, list(fcurves or ()), frames, _job_window(params, len(frames)), report)
+        return run_job(job, params.get("background", False))
 
 
 class CleanKeyframesHandler(BaseHandler):
-    """Handler for cleaning up redundant keyframes"""
+    """Handler for reducing keyframes with error-bounded curve simplification"""
 
     def get_command_name(self) -> str:
         return "clean_keyframes"
@@ -245,49 +427,48 @@ class CleanKeyframesHandler(BaseHandler):
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "object_name": {"type": str, "required": True},
-            "threshold": {"type": (int, float), "required": False}
+            "threshold": {"type": (int, float), "required": False},
+            "data_paths": {"type": list, "required": False}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Clean up redundant keyframes"""
+        """Remove keyframes while keeping every curve within threshold of its original values"""
         object_name = params["object_name"]
         threshold = params.get("threshold", 0.001)
+        matches = data_path_matcher(params.get("data_paths"))
+
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
 
         obj = bpy.data.objects.get(object_name)
         if not obj:
             raise ValueError(f"Object '{object_name}' not found")
 
-        if not obj.animation_data or not obj.animation_data.action:
+        action, fcurves = get_fcurves(obj)
+        if not fcurves:
             raise ValueError("Object has no animation data")
 
-        action = obj.animation_data.action
-        keyframes_removed = 0
-
-        for fcurve in action.fcurves:
-            # Get keyframes to potentially remove
-            keyframes_to_remove = []
-
-            points = list(fcurve.keyframe_points)
-            for i in range(1, len(points) - 1):
-                prev_val = points[i-1].co[1]
-                curr_val = points[i].co[1]
-                next_val = points[i+1].co[1]
-
-                # Check if this keyframe can be interpolated from neighbors
-                expected = (prev_val + next_val) / 2
-                if abs(curr_val - expected) < threshold:
-                    keyframes_to_remove.append(points[i])
-
-            # Remove redundant keyframes
-            for kf in keyframes_to_remove:
-                fcurve.keyframe_points.remove(kf)
-                keyframes_removed += 1
+        start = time.perf_counter()
+        channels = []
+        for fcurve in fcurves:
+            if fcurve.lock or not matches(fcurve):
+                continue
+            channels.append(reduce_fcurve(fcurve, threshold))
+        action.update_tag()
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        logger.info(f"Cleaned {keyframes_removed} redundant keyframes from '{object_name}'")
+        original = sum(c["original_keys"] for c in channels)
+        kept = sum(c["kept_keys"] for c in channels)
+        keyframes_removed = original - kept
+        logger.info(f"Cleaned {keyframes_removed} of {original} keyframes from '{object_name}' in {elapsed_ms:.1f}ms")
 
         return {
             "cleaned": True,
             "object_name": object_name,
             "keyframes_removed": keyframes_removed,
-            "threshold": threshold
+            "threshold": threshold,
+            "compression_ratio": round(original / kept, 3) if kept else 1.0,
+            "max_error": max((c["max_error"] for c in channels), default=0.0),
+            "channels": channels,
+            "elapsed_ms": round(elapsed_ms, 2)
         }
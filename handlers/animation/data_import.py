@@ -0,0 +1,115 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Handlers for importing motion data files into actions
+
+import bpy
+from typing import Dict, Any
+from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
+from core.jobs import Job, run_job, validate_frames_per_tick
+from utils.animation_import import DEFAULT_CHUNK_FRAMES, AnimationImporter, detect_format, open_source
+from utils.logger import logger
+
+
+class _ImportJob(Job):
+    """Reads one window of rows per slice and writes the keys after the last one"""
+
+    def __init__(self, importer: AnimationImporter, window: int, report: Dict[str, Any]):
+        super().__init__("import_animation_data", importer.source.rows_total)
+        self.importer = importer
+        self.window = window
+        self.report = report
+
+    def step(self) -> bool:
+        self.importer.step(self.window)
+        self.completed = self.importer.rows_read
+        return self.importer.done
+
+    def finish(self) -> Any:
+        result = {**self.report, **self.importer.finish()}
+        logger.info(f"Imported {result['frames_imported']} frames into {result['channels']} channels "
+                    f"from '{result['filepath']}'")
+        return result
+
+    def cleanup(self) -> None:
+        self.importer.close()
+
+
+class ImportAnimationDataHandler(BaseHandler):
+    """Handler for streaming motion data from CSV, NPY or BVH files into F-curves"""
+
+    def get_command_name(self) -> str:
+        return "import_animation_data"
+
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "filepath": {"type": str, "required": True},
+            "format": {"type": str, "required": False},
+            "mapping": {"type": list, "required": False},
+            "armature_name": {"type": str, "required": False},
+            "bone_map": {"type": dict, "required": False},
+            "scale": {"type": (int, float), "required": False},
+            "frame_start": {"type": (int, float), "required": False},
+            "frame_step": {"type": (int, float), "required": False},
+            "frame_column": {"type": (str, int), "required": False},
+            "delimiter": {"type": str, "required": False},
+            "has_header": {"type": bool, "required": False},
+            "replace": {"type": bool, "required": False},
+            "background": {"type": bool, "required": False},
+            "frames_per_tick": {"type": int, "required": False, "validator": validate_frames_per_tick}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """
+        Import a motion data file window by window.
+
+        CSV and NPY columns are written to the channels listed in mapping:
+        [{"column": "tx", "object": "Cube", "data_path": "location", "index": 0}],
+        with "bone" to target a pose bone. BVH joints are mapped by name onto
+        the pose bones of armature_name. frames_per_tick rows are read and
+        converted at a time, also without background; every F-curve is then
+        written once when the whole file has been read.
+        """
+        filepath = bpy.path.abspath(params["filepath"])
+        file_format = detect_format(filepath, params.get("format"))
+        mapping = params.get("mapping") or []
+        armature_name = params.get("armature_name")
+        frame_step = params.get("frame_step", 1)
+
+        if frame_step <= 0:
+            raise ValueError("frame_step must be positive")
+        if file_format == "BVH" and not armature_name:
+            raise ValueError("BVH import needs armature_name")
+        if file_format != "BVH" and not mapping:
+            raise ValueError(f"{file_format} import needs a mapping from columns to channels")
+
+        armature = None
+        if armature_name:
+            armature = bpy.data.objects.get(armature_name)
+            if not armature or armature.type != 'ARMATURE':
+                raise ValueError(f"Armature '{armature_name}' not found")
+
+        source = open_source(filepath, file_format, params.get("delimiter", ","), params.get("has_header", True))
+        try:
+            importer = AnimationImporter(
+                source,
+                frame_start=params.get("frame_start", 1),
+                frame_step=frame_step,
+                frame_column=params.get("frame_column"),
+                replace=params.get("replace", False)
+            )
+            importer.map_columns(bpy.data.objects, mapping)
+            if armature is not None and file_format == "BVH":
+                importer.map_bvh(armature, params.get("bone_map"), params.get("scale", 1.0))
+        except Exception:
+            source.close()
+            raise
+
+        report = {"imported": True, "filepath": filepath, "format": file_format}
+        if file_format == "BVH":
+            report["frame_time"] = source.frame_time
+
+        job = _ImportJob(importer, params.get("frames_per_tick", DEFAULT_CHUNK_FRAMES), report)
+        return run_job(job, params.get("background", False))
@@ -2,8 +2,14 @@
 # F-curve handlers for advanced animation control
 
 import bpy
+import time
+import numpy as np
 from typing import Dict, Any, List
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
+from utils.fcurve_arrays import (
+    data_path_matcher, encode_array, evaluate_fcurve, get_fcurves, interpolation_names, read_keyframe_arrays
+)
 from utils.logger import logger
 
 
@@ -413,3 +419,164 @@ class SmoothFCurveHandler(BaseHandler):
             "fcurves_smoothed": fcurves_smoothed,
             "iterations": iterations
         }
+
+
+class QueryKeyframesHandler(BaseHandler):
+    """Handler for reading keyframes of many F-curves as parallel arrays"""
+
+    def get_command_name(self) -> str:
+        return "query_keyframes"
+
+    def get_priority(self) -> CommandPriority:
+        # A pure read with one foreach_get per F-curve
+        return CommandPriority.INTERACTIVE
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "object_names": {"type": list, "required": True},
+            "data_paths": {"type": list, "required": False},
+            "frame_range": {"type": list, "required": False},
+            "include_handles": {"type": bool, "required": False},
+            "encoding": {"type": str, "required": False}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Get frames, values, handles and interpolation per F-curve in columnar form"""
+        object_names = params["object_names"]
+        frame_range = params.get("frame_range")
+        include_handles = params.get("include_handles", True)
+        encoding = params.get("encoding", "json").lower()
+        matches = data_path_matcher(params.get("data_paths"))
+
+        if encoding not in ("json", "base64"):
+            raise ValueError(f"Unknown encoding '{encoding}'. Use 'json' or 'base64'")
+        if frame_range is not None and len(frame_range) != 2:
+            raise ValueError("frame_range must be [start, end]")
+
+        missing = [name for name in object_names if not bpy.data.objects.get(name)]
+        if missing:
+            raise ValueError(f"Objects not found: {', '.join(missing)}")
+
+        objects = {}
+        total_keys = 0
+        for object_name in object_names:
+            action, fcurves = get_fcurves(bpy.data.objects[object_name])
+            channels = []
+            for fcurve in fcurves or ():
+                if not matches(fcurve):
+                    continue
+
+                arrays = read_keyframe_arrays(fcurve, include_handles)
+                if frame_range is not None:
+                    frames = arrays["frames"]
+                    mask = (frames >= frame_range[0]) & (frames <= frame_range[1])
+                    arrays = {key: column[mask] for key, column in arrays.items()}
+
+                count = len(arrays["frames"])
+                total_keys += count
+                channel = {
+                    "data_path": fcurve.data_path,
+                    "array_index": fcurve.array_index,
+                    "count": count
+                }
+                for key, column in arrays.items():
+                    channel[key] = encode_array(column) if encoding == "base64" else column.tolist()
+                channels.append(channel)
+
+            objects[object_name] = {
+                "action_name": action.name if action else None,
+                "fcurves": channels
+            }
+
+        return {
+            "objects": objects,
+            "total_keys": total_keys,
+            "encoding": encoding,
+            "interpolation_names": interpolation_names()
+        }
+
+
+class EvaluateFCurvesHandler(BaseHandler):
+    """Handler for sampling many F-curves at many frames without changing the scene frame"""
+
+    MAX_SAMPLES = 5_000_000  # frames x channels
+
+    def get_command_name(self) -> str:
+        return "evaluate_fcurves"
+
+    def get_priority(self) -> CommandPriority:
+        # Up to MAX_SAMPLES values per call
+        return CommandPriority.HEAVY
+
+    def modifies_scene(self) -> bool:
+        return False
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "object_names": {"type": list, "required": True},
+            "data_paths": {"type": list, "required": False},
+            "frames": {"type": list, "required": False},
+            "frame_start": {"type": (int, float), "required": False},
+            "frame_end": {"type": (int, float), "required": False},
+            "step": {"type": (int, float), "required": False},
+            "encoding": {"type": str, "required": False}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Return a frames x channels matrix of evaluated F-curve values"""
+        object_names = params["object_names"]
+        encoding = params.get("encoding", "json").lower()
+        matches = data_path_matcher(params.get("data_paths"))
+
+        if encoding not in ("json", "base64"):
+            raise ValueError(f"Unknown encoding '{encoding}'. Use 'json' or 'base64'")
+
+        if params.get("frames") is not None:
+            frames = np.asarray(params["frames"], dtype=np.float64)
+        else:
+            scene = bpy.context.scene
+            frame_start = params.get("frame_start", scene.frame_start)
+            frame_end = params.get("frame_end", scene.frame_end)
+            step = params.get("step", 1)
+            if step <= 0:
+                raise ValueError("step must be positive")
+            frames = np.arange(frame_start, frame_end + step * 0.5, step, dtype=np.float64)
+
+        missing = [name for name in object_names if not bpy.data.objects.get(name)]
+        if missing:
+            raise ValueError(f"Objects not found: {', '.join(missing)}")
+
+        curves = []
+        for object_name in object_names:
+            _, fcurves = get_fcurves(bpy.data.objects[object_name])
+            curves.extend((object_name, fcurve) for fcurve in fcurves or () if matches(fcurve))
+
+        if len(frames) * len(curves) > self.MAX_SAMPLES:
+            raise ValueError(f"Too many samples ({len(frames)} frames x {len(curves)} channels); "
+                             f"the limit is {self.MAX_SAMPLES}. Use a larger step or fewer channels")
+
+        start = time.perf_counter()
+        matrix = np.empty((len(frames), len(curves)), dtype=np.float64)
+        channels = []
+        vectorized_count = 0
+        for column, (object_name, fcurve) in enumerate(curves):
+            matrix[:, column], vectorized = evaluate_fcurve(fcurve, frames)
+            vectorized_count += vectorized
+            channels.append({
+                "object_name": object_name,
+                "data_path": fcurve.data_path,
+                "array_index": fcurve.array_index,
+                "vectorized": vectorized
+            })
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(f"Evaluated {len(curves)} F-curves at {len(frames)} frames in {elapsed_ms:.1f}ms")
+        return {
+            "frames": encode_array(frames) if encoding == "base64" else frames.tolist(),
+            "channels": channels,
+            "values": encode_array(matrix.astype(np.float32)) if encoding == "base64" else matrix.tolist(),
+            "shape": [len(frames), len(curves)],
+            "vectorized_channels": vectorized_count,
+            "fallback_channels": len(curves) - vectorized_count,
+            "elapsed_ms": round(elapsed_ms, 2)
+        }
@@ -2,9 +2,13 @@
 # Version: 2.0.2 - Completely rewritten to avoid fcurves issues
 
 import bpy
+import time
 from typing import Dict, Any, List, Optional
 from handlers.base_handler import BaseHandler
 from utils.error_handler import ErrorCode
+from utils.fcurve_arrays import (
+    decode_array, find_or_create_fcurve, get_fcurves, interpolation_codes, write_keyframes
+)
 from utils.validation import OBJECT_NAME_SCHEMA, FRAME_SCHEMA, DATA_PATH_SCHEMA, validate_frame
 from utils.logger import logger
 
@@ -263,3 +267,75 @@ class BatchKeyframesHandler(BaseHandler):
                 results.append({"success": False, "error": str(e)})
         
         return {"operations": results, "total": len(operations)}
+
+
+class BulkInsertKeyframesHandler(BaseHandler):
+    """Handler for writing many keyframes per channel from arrays, without frame changes"""
+    
+    def get_command_name(self) -> str:
+        return "bulk_insert_keyframes"
+    
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            **OBJECT_NAME_SCHEMA,
+            "channels": {
+                "type": list,
+                "required": True
+            },
+            "replace": {
+                "type": bool,
+                "required": False
+            }
+        }
+    
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """
+        Write keys for several F-curves. Each channel is
+        {"data_path", "index", "frames", "values", "interpolation", "group"};
+        frames and values are lists or base64 arrays, interpolation is one
+        name or one per key.
+        """
+        object_name = params["object_name"]
+        channels = params["channels"]
+        replace = params.get("replace", False)
+        
+        obj = bpy.data.objects.get(object_name)
+        if not obj:
+            raise ValueError(f"Object not found: {object_name}")
+        
+        # Decode and check every channel before touching the action
+        decoded = []
+        for i, channel in enumerate(channels):
+            if not isinstance(channel, dict) or "data_path" not in channel:
+                raise ValueError(f"Channel {i} must be an object with a data_path")
+            frames = decode_array(channel.get("frames", []), name=f"channels[{i}].frames")
+            values = decode_array(channel.get("values", []), name=f"channels[{i}].values")
+            if len(frames) != len(values):
+                raise ValueError(f"Channel {i}: {len(frames)} frames but {len(values)} values")
+            if channel.get("interpolation") is not None:
+                interpolation_codes(channel["interpolation"], len(frames))
+            decoded.append((channel, frames, values))
+        
+        start = time.perf_counter()
+        action, fcurves = get_fcurves(obj, create=True)
+        results = []
+        for channel, frames, values in decoded:
+            data_path = channel["data_path"]
+            index = channel.get("index", 0)
+            fcurve = find_or_create_fcurve(fcurves, data_path, index, channel.get("group"))
+            counts = write_keyframes(fcurve, frames, values, channel.get("interpolation"), replace)
+            results.append({"data_path": data_path, "index": index, **counts})
+        
+        # Let the depsgraph re-evaluate the animation once for all channels
+        action.update_tag()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        keys_written = sum(r["added"] + r["updated"] for r in results)
+        logger.info(f"Bulk inserted {keys_written} keys on {len(results)} channels of {object_name} in {elapsed_ms:.1f}ms")
+        return {
+            "object_name": object_name,
+            "action_name": action.name,
+            "channels": results,
+            "keys_written": keys_written,
+            "elapsed_ms": round(elapsed_ms, 2)
+        }
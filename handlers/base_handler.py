@@ -3,7 +3,9 @@
 from typing import Any, Dict, Optional, List
 from abc import ABC, abstractmethod
 from core.context_manager import context_manager
-from core.response_builder import ResponseBuilder
+from core.dispatcher import CommandPriority
+from core.response_builder import NotModified, Partial, ResponseBuilder
+from core.scene_events import scene_events
 from utils.error_handler import handle_error, ErrorCode, create_error_response
 from utils.validation import ParameterValidator, ValidationError
 from utils.logger import logger
@@ -31,6 +33,16 @@ class BaseHandler(ABC):
         """Execute the command with given parameters"""
         pass
     
+    def get_priority(self) -> CommandPriority:
+        """Return the dispatcher lane for this command (reads are interactive by default)"""
+        if self.get_command_name().startswith(("get_", "list_")):
+            return CommandPriority.INTERACTIVE
+        return CommandPriority.MUTATION
+    
+    def modifies_scene(self) -> bool:
+        """Return whether the command may change data (reads on a slower lane override this)"""
+        return self.get_priority() != CommandPriority.INTERACTIVE
+    
     def validate_params(self, params: Dict[str, Any]) -> List[str]:
         """Validate parameters against schema"""
         schema = self.get_parameter_schema()
@@ -51,9 +63,19 @@ class BaseHandler(ABC):
                 )
             
             # Execute command
+            if self.modifies_scene():
+                # Cached reads must see this command's changes
+                scene_events.mark_dirty()
+            
             logger.info(f"Executing command: {self.get_command_name()}")
             result = self.execute(params)
             
+            if isinstance(result, NotModified):
+                return self.response_builder.not_modified(result.etag)
+            
+            if isinstance(result, Partial):
+                return self.response_builder.partial(result.result, result.completed, result.total)
+            
             # Check if result contains an error (for handlers that return {"error": "..."} format)
             if isinstance(result, dict) and "error" in result:
                 error_msg = result.get("error", "Unknown error")
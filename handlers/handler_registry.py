@@ -16,13 +16,20 @@ from handlers.scene.object_ops import (
     ExecuteCodeHandler
 )
 from handlers.scene.project_setup import SetupProjectHandler
+from handlers.scene.scene_changes import GetSceneChangesHandler
+from handlers.scene.list_objects import ListObjectsHandler
+
+# System handlers
+from handlers.system.server_stats import GetServerStatsHandler
+from handlers.system.jobs import GetJobStatusHandler, CancelJobHandler, ListJobsHandler
 
 # Animation handlers - Core
 from handlers.animation.keyframes import (
     CreateKeyframeHandler,
     DeleteKeyframeHandler,
     GetKeyframesHandler,
-    BatchKeyframesHandler
+    BatchKeyframesHandler,
+    BulkInsertKeyframesHandler
 )
 from handlers.animation.timeline import (
     SetCurrentFrameHandler,
@@ -48,7 +55,9 @@ from handlers.animation.fcurves import (
     SetFCurveHandlesHandler,
     AddFCurveModifierHandler,
     RemoveFCurveModifierHandler,
-    SmoothFCurveHandler
+    SmoothFCurveHandler,
+    QueryKeyframesHandler,
+    EvaluateFCurvesHandler
 )
 from handlers.animation.actions import (
     CreateActionHandler,
@@ -58,14 +67,18 @@ from handlers.animation.actions import (
     DuplicateActionHandler,
     DeleteActionHandler,
     PushDownActionHandler,
-    GetObjectActionHandler
+    GetObjectActionHandler,
+    RetargetActionHandler
 )
 from handlers.animation.baking import (
     BakeAnimationHandler,
     BakeArmatureAnimationHandler,
+    BakeTransformsHandler,
     SampleAnimationHandler,
     CleanKeyframesHandler
 )
+from handlers.animation.data_import import ImportAnimationDataHandler
+from handlers.animation.motion import GenerateMotionHandler
 
 # Rigging handlers - Core
 from handlers.rigging.armatures import (
@@ -87,7 +100,9 @@ from handlers.rigging.weights import (
     CreateVertexGroupHandler,
     SetVertexWeightsHandler,
     GetVertexWeightsHandler,
+    GetWeightMatrixHandler,
     NormalizeWeightsHandler,
+    CleanWeightsHandler,
     TransferWeightsHandler,
     GetVertexGroupsHandler
 )
@@ -267,12 +282,21 @@ def register_all_handlers():
     command_router.register_handler(GetViewportScreenshotHandler())
     command_router.register_handler(ExecuteCodeHandler())
     command_router.register_handler(SetupProjectHandler())
+    command_router.register_handler(GetSceneChangesHandler())
+    command_router.register_handler(ListObjectsHandler())
+
+    # System handlers
+    command_router.register_handler(GetServerStatsHandler())
+    command_router.register_handler(GetJobStatusHandler())
+    command_router.register_handler(CancelJobHandler())
+    command_router.register_handler(ListJobsHandler())
 
     # Animation handlers - Core
     command_router.register_handler(CreateKeyframeHandler())
     command_router.register_handler(DeleteKeyframeHandler())
     command_router.register_handler(GetKeyframesHandler())
     command_router.register_handler(BatchKeyframesHandler())
+    command_router.register_handler(BulkInsertKeyframesHandler())
     command_router.register_handler(SetCurrentFrameHandler())
     command_router.register_handler(GetTimelineInfoHandler())
     command_router.register_handler(SetFrameRangeHandler())
@@ -291,6 +315,8 @@ def register_all_handlers():
     command_router.register_handler(AddFCurveModifierHandler())
     command_router.register_handler(RemoveFCurveModifierHandler())
     command_router.register_handler(SmoothFCurveHandler())
+    command_router.register_handler(QueryKeyframesHandler())
+    command_router.register_handler(EvaluateFCurvesHandler())
 
     # Animation handlers - Actions
     command_router.register_handler(CreateActionHandler())
@@ -301,12 +327,16 @@ def register_all_handlers():
     command_router.register_handler(DeleteActionHandler())
     command_router.register_handler(PushDownActionHandler())
     command_router.register_handler(GetObjectActionHandler())
+    command_router.register_handler(RetargetActionHandler())
 
     # Animation handlers - Baking
     command_router.register_handler(BakeAnimationHandler())
     command_router.register_handler(BakeArmatureAnimationHandler())
+    command_router.register_handler(BakeTransformsHandler())
     command_router.register_handler(SampleAnimationHandler())
     command_router.register_handler(CleanKeyframesHandler())
+    command_router.register_handler(ImportAnimationDataHandler())
+    command_router.register_handler(GenerateMotionHandler())
 
     # Rigging handlers - Core
     command_router.register_handler(CreateArmatureHandler())
@@ -323,7 +353,9 @@ def register_all_handlers():
     command_router.register_handler(CreateVertexGroupHandler())
     command_router.register_handler(SetVertexWeightsHandler())
     command_router.register_handler(GetVertexWeightsHandler())
+    command_router.register_handler(GetWeightMatrixHandler())
     command_router.register_handler(NormalizeWeightsHandler())
+    command_router.register_handler(CleanWeightsHandler())
     command_router.register_handler(TransferWeightsHandler())
     command_router.register_handler(GetVertexGroupsHandler())
 
@@ -12,6 +12,7 @@ import tempfile
 import os
 import zipfile
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
 from utils.logger import logger
 
 # Try to import requests, fallback to urllib if not available
@@ -113,6 +114,9 @@ class SearchSketchfabModelsHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "search_sketchfab_models"
     
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+    
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "query": {
@@ -206,6 +210,9 @@ class GetSketchfabModelPreviewHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "get_sketchfab_model_preview"
     
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+    
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "uid": {
@@ -313,6 +320,9 @@ class DownloadSketchfabModelHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "download_sketchfab_model"
     
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+    
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "uid": {
@@ -9,6 +9,7 @@ from typing import Any, Dict
 import bpy
 import os
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
 from utils.logger import logger
 
 
@@ -203,6 +204,9 @@ class RenderImageHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "render_image"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "filepath": {"type": str, "required": False},
@@ -275,6 +279,9 @@ class RenderAnimationHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "render_animation"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "filepath": {"type": str, "required": False},
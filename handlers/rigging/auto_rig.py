@@ -5,11 +5,31 @@ import bpy
 from mathutils import Vector
 from typing import Dict, Any, List, Tuple
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
 from utils.validation import validate_object_exists
+from utils.distance_skinning import DEFAULT_MAX_INFLUENCES, check_parameters, distance_skin
 from utils.logger import logger
 
 HANDLER_VERSION = "1.0.0"
 
+SKINNING_METHODS = ("AUTO", "DISTANCE")
+
+
+def _parent_and_skin(mesh_obj, armature, skinning: str, max_influences: int) -> Dict[str, Any]:
+    """
+    Parent the mesh to the armature and weight it with Blender's bone heat
+    (AUTO) or the distance backend (DISTANCE, whose timings are returned)
+    """
+    bpy.ops.object.select_all(action='DESELECT')
+    mesh_obj.select_set(True)
+    armature.select_set(True)
+    bpy.context.view_layer.objects.active = armature
+    if skinning == "AUTO":
+        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        return {}
+    bpy.ops.object.parent_set(type='ARMATURE')
+    return distance_skin(mesh_obj, armature, max_influences=max_influences)
+
 
 class RigHandHandler(BaseHandler):
     """Handler for automatically rigging a hand mesh"""
@@ -17,6 +37,9 @@ class RigHandHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "rig_hand"
     
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+    
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {
@@ -39,6 +62,14 @@ class RigHandHandler(BaseHandler):
             "auto_position": {
                 "type": bool,
                 "required": False
+            },
+            "skinning": {
+                "type": str,
+                "required": False
+            },
+            "max_influences": {
+                "type": int,
+                "required": False
             }
         }
     
@@ -139,10 +170,15 @@ class RigHandHandler(BaseHandler):
         bone_scale = params.get("bone_scale", 1.0)
         finger_count = params.get("finger_count", 4)
         auto_position = params.get("auto_position", True)
+        skinning = params.get("skinning", "AUTO").upper()  # AUTO or DISTANCE
+        max_influences = params.get("max_influences", DEFAULT_MAX_INFLUENCES)
         
         mesh_obj = bpy.data.objects.get(mesh_name)
         if not mesh_obj or mesh_obj.type != 'MESH':
             raise ValueError(f"Mesh '{mesh_name}' not found")
+        if skinning not in SKINNING_METHODS:
+            raise ValueError(f"Unknown skinning '{skinning}'. Use one of {list(SKINNING_METHODS)}")
+        check_parameters(max_influences=max_influences)
         
         # Unparent mesh if already parented
         if mesh_obj.parent:
@@ -161,11 +197,7 @@ class RigHandHandler(BaseHandler):
         self._create_hand_bones(armature, geometry, finger_count, bone_scale)
         
         # Parent mesh to armature with automatic weights
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh_obj.select_set(True)
-        armature.select_set(True)
-        bpy.context.view_layer.objects.active = armature
-        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        skinning_stats = _parent_and_skin(mesh_obj, armature, skinning, max_influences)
         
         bone_count = len(armature.data.bones)
         vertex_group_count = len(mesh_obj.vertex_groups) if mesh_obj.vertex_groups else 0
@@ -176,7 +208,9 @@ class RigHandHandler(BaseHandler):
             "armature_name": armature_name,
             "bone_count": bone_count,
             "vertex_groups_created": vertex_group_count,
-            "finger_count": finger_count
+            "finger_count": finger_count,
+            "skinning": skinning,
+            **skinning_stats
         }
 
 
@@ -186,6 +220,9 @@ class RigBodyHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "rig_body"
     
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+    
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {
@@ -216,6 +253,14 @@ class RigBodyHandler(BaseHandler):
             "ik_legs": {
                 "type": bool,
                 "required": False
+            },
+            "skinning": {
+                "type": str,
+                "required": False
+            },
+            "max_influences": {
+                "type": int,
+                "required": False
             }
         }
     
@@ -370,10 +415,15 @@ class RigBodyHandler(BaseHandler):
         include_toes = params.get("include_toes", True)
         ik_arms = params.get("ik_arms", False)
         ik_legs = params.get("ik_legs", False)
+        skinning = params.get("skinning", "AUTO").upper()  # AUTO or DISTANCE
+        max_influences = params.get("max_influences", DEFAULT_MAX_INFLUENCES)
         
         mesh_obj = bpy.data.objects.get(mesh_name)
         if not mesh_obj or mesh_obj.type != 'MESH':
             raise ValueError(f"Mesh '{mesh_name}' not found")
+        if skinning not in SKINNING_METHODS:
+            raise ValueError(f"Unknown skinning '{skinning}'. Use one of {list(SKINNING_METHODS)}")
+        check_parameters(max_influences=max_influences)
         
         # Unparent mesh if already parented
         if mesh_obj.parent:
@@ -395,11 +445,7 @@ class RigBodyHandler(BaseHandler):
         # This would require additional constraint handlers
         
         # Parent mesh to armature with automatic weights
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh_obj.select_set(True)
-        armature.select_set(True)
-        bpy.context.view_layer.objects.active = armature
-        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        skinning_stats = _parent_and_skin(mesh_obj, armature, skinning, max_influences)
         
         bone_count = len(armature.data.bones)
         vertex_group_count = len(mesh_obj.vertex_groups) if mesh_obj.vertex_groups else 0
@@ -413,5 +459,7 @@ class RigBodyHandler(BaseHandler):
             "include_fingers": include_fingers,
             "include_toes": include_toes,
             "ik_arms": ik_arms,
-            "ik_legs": ik_legs
+            "ik_legs": ik_legs,
+            "skinning": skinning,
+            **skinning_stats
         }
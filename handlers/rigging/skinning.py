@@ -4,10 +4,16 @@
 import bpy
 from typing import Dict, Any
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
 from utils.validation import validate_object_exists
+from utils.distance_skinning import (
+    DEFAULT_FALLOFF, DEFAULT_MAX_INFLUENCES, DEFAULT_SMOOTH_FACTOR, DEFAULT_SMOOTH_ITERATIONS, check_parameters,
+    distance_skin
+)
 from utils.logger import logger
 
 HANDLER_VERSION = "1.0.0"
+WEIGHT_METHODS = ("ENVELOPE", "HEAT", "DISTANCE")
 
 
 class AutoWeightAssignHandler(BaseHandler):
@@ -16,6 +22,9 @@ class AutoWeightAssignHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "auto_weight_assign"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {
@@ -35,16 +44,40 @@ class AutoWeightAssignHandler(BaseHandler):
             "remove_unused_vertex_groups": {
                 "type": bool,
                 "required": False
+            },
+            "falloff": {
+                "type": (int, float),
+                "required": False
+            },
+            "smooth_iterations": {
+                "type": int,
+                "required": False
+            },
+            "smooth_factor": {
+                "type": (int, float),
+                "required": False
+            },
+            "max_influences": {
+                "type": int,
+                "required": False
             }
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Assign automatic weights to a mesh from an armature"""
+        """
+        Assign automatic weights to a mesh from an armature. DISTANCE skips
+        the weight paint operators: weights come from distances to the bone
+        segments, smoothed over the mesh, which also works on non-manifold
+        meshes and in background mode.
+        """
         mesh_name = params["mesh_name"]
         armature_name = params["armature_name"]
-        method = params.get("method", "ENVELOPE")  # ENVELOPE or HEAT
+        method = params.get("method", "ENVELOPE").upper()  # ENVELOPE, HEAT or DISTANCE
         remove_unused = params.get("remove_unused_vertex_groups", True)
 
+        if method not in WEIGHT_METHODS:
+            raise ValueError(f"Unknown method '{method}'. Use one of {list(WEIGHT_METHODS)}")
+
         mesh_obj = bpy.data.objects.get(mesh_name)
         armature_obj = bpy.data.objects.get(armature_name)
 
@@ -58,6 +91,9 @@ class AutoWeightAssignHandler(BaseHandler):
         if mesh_obj.parent != armature_obj:
             raise ValueError(f"Mesh '{mesh_name}' must be parented to armature '{armature_name}' first")
 
+        if method == "DISTANCE":
+            return self._assign_by_distance(mesh_obj, armature_obj, params, remove_unused)
+
         # Store current selection
         previous_selection = [obj for obj in bpy.context.selected_objects]
         previous_active = bpy.context.view_layer.objects.active
@@ -115,3 +151,31 @@ class AutoWeightAssignHandler(BaseHandler):
                 obj.select_set(True)
             if previous_active:
                 bpy.context.view_layer.objects.active = previous_active
+
+    def _assign_by_distance(self, mesh_obj, armature_obj, params: Dict[str, Any], remove_unused: bool) -> Dict[str, Any]:
+        """Weights from distances to bone segments, without operators or mode changes"""
+        settings = {
+            "falloff": params.get("falloff", DEFAULT_FALLOFF),
+            "smooth_iterations": params.get("smooth_iterations", DEFAULT_SMOOTH_ITERATIONS),
+            "smooth_factor": params.get("smooth_factor", DEFAULT_SMOOTH_FACTOR),
+            "max_influences": params.get("max_influences", DEFAULT_MAX_INFLUENCES)
+        }
+        check_parameters(**settings)
+
+        stats = distance_skin(mesh_obj, armature_obj, **settings)
+
+        if remove_unused:
+            bone_names = {bone.name for bone in armature_obj.data.bones}
+            for vg in [vg for vg in mesh_obj.vertex_groups if vg.name not in bone_names]:
+                mesh_obj.vertex_groups.remove(vg)
+
+        logger.info(f"Distance-skinned {mesh_obj.name} to {stats['bones']} bones in {stats['elapsed_ms']}ms")
+
+        return {
+            "weights_assigned": True,
+            "mesh_name": mesh_obj.name,
+            "armature_name": armature_obj.name,
+            "method": "DISTANCE",
+            "vertex_groups_count": len(mesh_obj.vertex_groups),
+            **stats
+        }
@@ -2,9 +2,19 @@
 # Weight painting and skinning handlers for rigging workflow
 
 import bpy
+import time
+import numpy as np
 from typing import Dict, Any, List
 from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
+from core.revisions import decode_cursor, encode_cursor, revisions
+from utils.fcurve_arrays import encode_array
 from utils.logger import logger
+from utils.validation import DEFAULT_VERTEX_PAGE_SIZE, validate_vertex_page_size
+from utils.vertex_weights import WEIGHT_MODES, WeightEngine, add_weights, decode_weights, read_weight_matrix
+from utils.weight_transfer import (
+    DEFAULT_NEIGHBOURS, TRANSFER_METHODS, get_source_index, source_groups, world_coordinates
+)
 
 
 class ParentToArmatureHandler(BaseHandler):
@@ -13,6 +23,9 @@ class ParentToArmatureHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "parent_to_armature"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {"type": str, "required": True},
@@ -124,51 +137,88 @@ class SetVertexWeightsHandler(BaseHandler):
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {"type": str, "required": True},
-            "vertex_group_name": {"type": str, "required": True},
-            "weights": {"type": dict, "required": True},
-            "mode": {"type": str, "required": False}
+            "vertex_group_name": {"type": str, "required": False},
+            "weights": {"type": (dict, list, int, float), "required": False},
+            "indices": {"type": (list, dict), "required": False},
+            "groups": {"type": list, "required": False},
+            "mode": {"type": str, "required": False},
+            "quantize": {"type": int, "required": False}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Set vertex weights for a vertex group"""
+        """
+        Set vertex weights for one or more vertex groups.
+
+        weights is a {vertex_index: weight} object, or an array (JSON list
+        or base64 float32) parallel to indices (JSON list or base64 int32),
+        or one number for all indices. groups writes several vertex groups
+        in one call: [{"vertex_group_name", "indices", "weights", "mode"}].
+        Vertices sharing a weight are written with a single add() call.
+        """
         mesh_name = params["mesh_name"]
-        group_name = params["vertex_group_name"]
-        weights = params["weights"]  # {vertex_index: weight}
-        mode = params.get("mode", "REPLACE")  # REPLACE, ADD
+        mode = params.get("mode", "REPLACE").upper()  # REPLACE, ADD, SUBTRACT, REMOVE
+        quantize = params.get("quantize")
 
         mesh_obj = bpy.data.objects.get(mesh_name)
         if not mesh_obj or mesh_obj.type != 'MESH':
             raise ValueError(f"Mesh '{mesh_name}' not found")
+        if quantize is not None and quantize < 1:
+            raise ValueError("quantize must be at least 1")
+
+        requests = list(params.get("groups") or [])
+        if params.get("vertex_group_name"):
+            requests.insert(0, {
+                "vertex_group_name": params["vertex_group_name"],
+                "indices": params.get("indices"),
+                "weights": params.get("weights")
+            })
+        if not requests:
+            raise ValueError("Give vertex_group_name with weights, or groups")
+
+        # Decode and check everything before changing any group
+        vertex_count = len(mesh_obj.data.vertices)
+        decoded = []
+        for i, request in enumerate(requests):
+            if not isinstance(request, dict) or not request.get("vertex_group_name"):
+                raise ValueError(f"groups[{i}] must be an object with a vertex_group_name")
+            group_mode = request.get("mode", mode).upper()
+            if group_mode not in WEIGHT_MODES:
+                raise ValueError(f"Unknown mode '{group_mode}'. Use one of {list(WEIGHT_MODES)}")
+            weights = request.get("weights")
+            if weights is None and group_mode == "REMOVE":
+                weights = 0.0
+            elif weights is None:
+                raise ValueError(f"No weights for vertex group '{request['vertex_group_name']}'")
+            indices, values = decode_weights(request.get("indices"), weights, vertex_count)
+            decoded.append((request["vertex_group_name"], group_mode, indices, values))
+
+        start = time.perf_counter()
+        results = []
+        for group_name, group_mode, indices, values in decoded:
+            vg = mesh_obj.vertex_groups.get(group_name)
+            if not vg:
+                # Create the group if it doesn't exist
+                vg = mesh_obj.vertex_groups.new(name=group_name)
+            counts = add_weights(vg, indices, values, group_mode, quantize)
+            results.append({
+                "vertex_group_name": vg.name,
+                "vertices_affected": counts["vertices"],
+                "add_calls": counts["calls"],
+                "mode": group_mode
+            })
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        vg = mesh_obj.vertex_groups.get(group_name)
-        if not vg:
-            # Create the group if it doesn't exist
-            vg = mesh_obj.vertex_groups.new(name=group_name)
-
-        vertices_set = 0
-
-        for vertex_idx, weight in weights.items():
-            vertex_idx = int(vertex_idx)
-            weight = float(weight)
-
-            # Clamp weight to 0-1
-            weight = max(0.0, min(1.0, weight))
-
-            if mode == "ADD":
-                vg.add([vertex_idx], weight, 'ADD')
-            else:
-                vg.add([vertex_idx], weight, 'REPLACE')
-
-            vertices_set += 1
-
-        logger.info(f"Set {vertices_set} vertex weights on {group_name}")
+        vertices_set = sum(result["vertices_affected"] for result in results)
+        logger.info(f"Set {vertices_set} vertex weights on {len(results)} groups of {mesh_name} in {elapsed_ms:.1f}ms")
 
         return {
             "weights_set": True,
             "mesh_name": mesh_name,
-            "vertex_group_name": group_name,
+            "vertex_group_name": results[0]["vertex_group_name"],
             "vertices_affected": vertices_set,
-            "mode": mode
+            "mode": results[0]["mode"],
+            "groups": results,
+            "elapsed_ms": round(elapsed_ms, 2)
         }
 
 
@@ -178,6 +228,13 @@ class GetVertexWeightsHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "get_vertex_weights"
 
+    def get_priority(self) -> CommandPriority:
+        # Without vertex_indices every vertex is read, too long for the interactive lane
+        return CommandPriority.HEAVY
+
+    def modifies_scene(self) -> bool:
+        return False
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "mesh_name": {"type": str, "required": True},
@@ -202,21 +259,20 @@ class GetVertexWeightsHandler(BaseHandler):
         weights = {}
         mesh_data = mesh_obj.data
 
-        # Get indices to check
+        # Read group memberships directly instead of vg.weight(), which raises for every non-member
         if vertex_indices:
-            indices = vertex_indices
+            vertices = mesh_data.vertices
+            vertex_count = len(vertices)
+            for idx in vertex_indices:
+                # Indices outside the mesh are skipped, as vg.weight() lookups used to be
+                if not isinstance(idx, int) or not 0 <= idx < vertex_count:
+                    continue
+                for element in vertices[idx].groups:
+                    if element.group == vg.index and element.weight > 0:
+                        weights[idx] = element.weight
         else:
-            indices = range(len(mesh_data.vertices))
-
-        # Get weights
-        for idx in indices:
-            try:
-                weight = vg.weight(idx)
-                if weight > 0:
-                    weights[idx] = weight
-            except RuntimeError:
-                # Vertex not in group
-                pass
+            matrix = read_weight_matrix(mesh_data, len(mesh_obj.vertex_groups))
+            weights = {idx: weight for idx, weight in matrix.column(vg.index).items() if weight > 0}
 
         return {
             "mesh_name": mesh_name,
@@ -226,6 +282,84 @@ class GetVertexWeightsHandler(BaseHandler):
         }
 
 
+class GetWeightMatrixHandler(BaseHandler):
+    """Handler for exporting all vertex weights of a mesh as a sparse matrix"""
+
+    def get_command_name(self) -> str:
+        return "get_weight_matrix"
+
+    def get_priority(self) -> CommandPriority:
+        # A page reads up to a million vertices, too long for the interactive lane
+        return CommandPriority.HEAVY
+
+    def modifies_scene(self) -> bool:
+        return False
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "mesh_name": {"type": str, "required": True},
+            "group_names": {"type": list, "required": False},
+            "page_size": {"type": int, "required": False, "validator": validate_vertex_page_size},
+            "cursor": {"type": str, "required": False},
+            "encoding": {"type": str, "required": False}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """
+        Get the weights of a page of vertices in CSR form: the weights of
+        vertex vertex_start + i are weights[indptr[i]:indptr[i + 1]], in the
+        vertex groups group_indices[indptr[i]:indptr[i + 1]] (indices into
+        groups). encoding "base64" packs the arrays as binary.
+        """
+        mesh_name = params["mesh_name"]
+        group_names = params.get("group_names")
+        page_size = params.get("page_size", DEFAULT_VERTEX_PAGE_SIZE)
+        offset, cursor_revision = decode_cursor(params["cursor"]) if params.get("cursor") else (0, None)
+        encoding = params.get("encoding", "json").lower()
+
+        if encoding not in ("json", "base64"):
+            raise ValueError(f"Unknown encoding '{encoding}'. Use 'json' or 'base64'")
+
+        mesh_obj = bpy.data.objects.get(mesh_name)
+        if not mesh_obj or mesh_obj.type != 'MESH':
+            raise ValueError(f"Mesh '{mesh_name}' not found")
+
+        vertex_groups = mesh_obj.vertex_groups
+        if group_names is not None:
+            missing = [name for name in group_names if name not in vertex_groups]
+            if missing:
+                raise ValueError(f"Vertex groups not found: {', '.join(missing)}")
+
+        start = time.perf_counter()
+        vertex_count = len(mesh_obj.data.vertices)
+        matrix = read_weight_matrix(mesh_obj.data, len(vertex_groups), offset, offset + page_size)
+        if group_names is not None:
+            wanted = np.array([vertex_groups[name].index for name in group_names], dtype=np.int32)
+            matrix = matrix.select(np.isin(matrix.groups, wanted))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        arrays = {
+            "indptr": matrix.indptr.astype(np.int32),
+            "group_indices": matrix.groups,
+            "weights": matrix.weights
+        }
+        end = offset + matrix.vertex_count
+        result = {
+            "mesh_name": mesh_name,
+            "groups": [vg.name for vg in vertex_groups],
+            "vertex_count": vertex_count,
+            "vertex_start": offset,
+            "vertex_end": end,
+            "nnz": matrix.nnz,
+            **{key: encode_array(array) if encoding == "base64" else array.tolist() for key, array in arrays.items()},
+            "next_cursor": encode_cursor(end) if end < vertex_count else None,
+            "elapsed_ms": round(elapsed_ms, 2)
+        }
+        if cursor_revision is not None and cursor_revision != revisions.revision:
+            result["scene_changed"] = True
+        return result
+
+
 class NormalizeWeightsHandler(BaseHandler):
     """Handler for normalizing vertex weights"""
 
@@ -236,42 +370,126 @@ class NormalizeWeightsHandler(BaseHandler):
         return {
             "mesh_name": {"type": str, "required": True},
             "mode": {"type": str, "required": False},
-            "lock_active": {"type": bool, "required": False}
+            "lock_active": {"type": bool, "required": False},
+            "group_names": {"type": list, "required": False}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Normalize vertex weights"""
+        """
+        Normalize vertex weights in NumPy, without operators or mode changes.
+        ALL makes every vertex's weights sum to 1 (locked groups keep their
+        weights), ACTIVE scales the active group so its largest weight is 1.
+        """
         mesh_name = params["mesh_name"]
-        mode = params.get("mode", "ALL")  # ALL or ACTIVE
+        mode = params.get("mode", "ALL").upper()  # ALL or ACTIVE
         lock_active = params.get("lock_active", False)
 
         mesh_obj = bpy.data.objects.get(mesh_name)
         if not mesh_obj or mesh_obj.type != 'MESH':
             raise ValueError(f"Mesh '{mesh_name}' not found")
+        if mode not in ("ALL", "ACTIVE"):
+            raise ValueError(f"Unknown mode '{mode}'. Use 'ALL' or 'ACTIVE'")
 
-        # Select and make active
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh_obj.select_set(True)
-        bpy.context.view_layer.objects.active = mesh_obj
-
-        # Enter weight paint mode
-        bpy.ops.object.mode_set(mode='WEIGHT_PAINT')
+        active = mesh_obj.vertex_groups.active
+        if active is None and (mode == "ACTIVE" or lock_active):
+            raise ValueError(f"Mesh '{mesh_name}' has no active vertex group")
 
-        try:
-            if mode.upper() == "ALL":
-                bpy.ops.object.vertex_group_normalize_all(lock_active=lock_active)
-            else:
-                bpy.ops.object.vertex_group_normalize()
+        if mode == "ACTIVE" and active.lock_weight:
+            raise ValueError(f"Vertex group '{active.name}' is locked")
 
-            logger.info(f"Normalized weights on {mesh_name}")
+        start = time.perf_counter()
+        if mode == "ALL":
+            engine = WeightEngine(mesh_obj, params.get("group_names"), [active.index] if lock_active else ())
+            engine.normalize()
+        else:
+            engine = WeightEngine(mesh_obj)
+            engine.normalize_group(active.index)
+        counts = engine.write()
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        finally:
-            bpy.ops.object.mode_set(mode='OBJECT')
+        logger.info(f"Normalized weights on {mesh_name} in {elapsed_ms:.1f}ms")
 
         return {
             "normalized": True,
             "mesh_name": mesh_name,
-            "mode": mode
+            "mode": mode,
+            **counts,
+            "elapsed_ms": round(elapsed_ms, 2)
+        }
+
+
+class CleanWeightsHandler(BaseHandler):
+    """Handler for clamping, pruning, limiting and normalizing vertex weights in one pass"""
+
+    def get_command_name(self) -> str:
+        return "clean_weights"
+
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "mesh_name": {"type": str, "required": True},
+            "group_names": {"type": list, "required": False},
+            "clamp": {"type": list, "required": False},
+            "prune_threshold": {"type": (int, float), "required": False},
+            "max_influences": {"type": int, "required": False},
+            "normalize": {"type": bool, "required": False},
+            "lock_active": {"type": bool, "required": False}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """
+        Run the requested steps in order: clamp to [min, max], remove weights
+        at or below prune_threshold, keep the max_influences largest weights
+        per vertex (e.g. 4 for game engines), then normalize. Locked groups
+        are never changed. The mesh weights are read and written once.
+        """
+        mesh_name = params["mesh_name"]
+        clamp = params.get("clamp")
+        prune_threshold = params.get("prune_threshold")
+        max_influences = params.get("max_influences")
+        normalize = params.get("normalize", False)
+        lock_active = params.get("lock_active", False)
+
+        mesh_obj = bpy.data.objects.get(mesh_name)
+        if not mesh_obj or mesh_obj.type != 'MESH':
+            raise ValueError(f"Mesh '{mesh_name}' not found")
+        if clamp is not None and (len(clamp) != 2 or clamp[0] > clamp[1]):
+            raise ValueError("clamp must be [min, max]")
+        if max_influences is not None and max_influences < 1:
+            raise ValueError("max_influences must be at least 1")
+        if clamp is None and prune_threshold is None and max_influences is None and not normalize:
+            raise ValueError("Nothing to do: give clamp, prune_threshold, max_influences or normalize")
+
+        active = mesh_obj.vertex_groups.active
+        if lock_active and active is None:
+            raise ValueError(f"Mesh '{mesh_name}' has no active vertex group")
+
+        start = time.perf_counter()
+        engine = WeightEngine(mesh_obj, params.get("group_names"), [active.index] if lock_active else ())
+        steps = {}
+        if clamp is not None:
+            steps["clamped"] = engine.clamp(clamp[0], clamp[1])
+        if prune_threshold is not None:
+            steps["pruned"] = engine.prune(prune_threshold)
+        if max_influences is not None:
+            steps["limited"] = engine.limit(max_influences)
+        if normalize:
+            steps["vertices_normalized"] = engine.normalize()
+        counts = engine.write()
+        influences = engine.influence_counts()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(f"Cleaned weights on {mesh_name}: {steps} in {elapsed_ms:.1f}ms")
+
+        return {
+            "cleaned": True,
+            "mesh_name": mesh_name,
+            **steps,
+            **counts,
+            "max_influences_found": int(influences.max()) if len(influences) else 0,
+            "elapsed_ms": round(elapsed_ms, 2)
         }
 
 
@@ -281,29 +499,125 @@ class TransferWeightsHandler(BaseHandler):
     def get_command_name(self) -> str:
         return "transfer_weights"
 
+    def get_priority(self) -> CommandPriority:
+        return CommandPriority.HEAVY
+
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
         return {
             "source_mesh": {"type": str, "required": True},
-            "target_mesh": {"type": str, "required": True},
+            "target_mesh": {"type": str, "required": False},
+            "target_meshes": {"type": list, "required": False},
             "vertex_group": {"type": str, "required": False},
-            "mix_mode": {"type": str, "required": False}
+            "vertex_groups": {"type": list, "required": False},
+            "mix_mode": {"type": str, "required": False},
+            "method": {"type": str, "required": False},
+            "neighbours": {"type": int, "required": False},
+            "min_weight": {"type": (int, float), "required": False},
+            "quantize": {"type": int, "required": False}
         }
 
     def execute(self, params: Dict[str, Any]) -> Any:
-        """Transfer weights from source to target mesh"""
+        """
+        Transfer weights from a source mesh to one or more target meshes.
+
+        SURFACE (default) blends the corners of the closest source triangle,
+        NEAREST copies the closest source vertex and INVERSE_DISTANCE blends
+        the nearest neighbours, all in world space. The source's spatial
+        index is cached until the source changes, so further targets and
+        calls reuse it. MODIFIER applies a DATA_TRANSFER modifier instead.
+        """
         source_name = params["source_mesh"]
-        target_name = params["target_mesh"]
-        vertex_group = params.get("vertex_group")  # None = all groups
-        mix_mode = params.get("mix_mode", "REPLACE")
+        target_names = list(params.get("target_meshes") or [])
+        if params.get("target_mesh"):
+            target_names.insert(0, params["target_mesh"])
+        group_names = list(params.get("vertex_groups") or [])
+        if params.get("vertex_group"):
+            group_names.insert(0, params["vertex_group"])
+        mix_mode = params.get("mix_mode", "REPLACE").upper()
+        method = params.get("method", "SURFACE").upper()
+        neighbours = params.get("neighbours", DEFAULT_NEIGHBOURS)
+        min_weight = params.get("min_weight", 0.0)
 
         source_obj = bpy.data.objects.get(source_name)
         if not source_obj or source_obj.type != 'MESH':
             raise ValueError(f"Source mesh '{source_name}' not found")
+        if not target_names:
+            raise ValueError("Give target_mesh or target_meshes")
+        targets = []
+        for target_name in target_names:
+            target_obj = bpy.data.objects.get(target_name)
+            if not target_obj or target_obj.type != 'MESH':
+                raise ValueError(f"Target mesh '{target_name}' not found")
+            targets.append(target_obj)
+        if method not in TRANSFER_METHODS + ("MODIFIER",):
+            raise ValueError(f"Unknown method '{method}'. Use one of {list(TRANSFER_METHODS + ('MODIFIER',))}")
+        if mix_mode not in ("REPLACE", "ADD", "SUBTRACT"):
+            raise ValueError(f"Unknown mix_mode '{mix_mode}'. Use 'REPLACE', 'ADD' or 'SUBTRACT'")
+        if neighbours < 1:
+            raise ValueError("neighbours must be at least 1")
+
+        if method == "MODIFIER":
+            for target_obj in targets:
+                self._transfer_with_modifier(source_obj, target_obj, group_names[0] if group_names else None)
+            return {
+                "transferred": True,
+                "source_mesh": source_name,
+                "method": method,
+                "vertex_group": group_names[0] if group_names else "ALL",
+                "targets": [
+                    {"target_mesh": obj.name, "target_groups": [vg.name for vg in obj.vertex_groups]}
+                    for obj in targets
+                ]
+            }
+
+        start = time.perf_counter()
+        index, cached = get_source_index(source_obj)
+        groups = source_groups(index, group_names or None)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        results = []
+        for target_obj in targets:
+            target_start = time.perf_counter()
+            weights = index.transfer(world_coordinates(target_obj), list(groups.values()), method, neighbours)
+            weights_written = 0
+            for column, group_name in enumerate(groups):
+                values = weights[:, column]
+                members = np.flatnonzero(values > min_weight)
+                vg = target_obj.vertex_groups.get(group_name)
+                if vg is None:
+                    if not len(members):
+                        continue
+                    vg = target_obj.vertex_groups.new(name=group_name)
+                if mix_mode == "REPLACE":
+                    vg.remove(list(range(len(values))))
+                    add_weights(vg, members, values[members], "REPLACE", params.get("quantize"))
+                else:
+                    add_weights(vg, members, values[members], mix_mode, params.get("quantize"))
+                weights_written += len(members)
+            results.append({
+                "target_mesh": target_obj.name,
+                "vertices": len(weights),
+                "weights_written": weights_written,
+                "elapsed_ms": round((time.perf_counter() - target_start) * 1000, 2)
+            })
+        elapsed_ms = (time.perf_counter() - start) * 1000
 
-        target_obj = bpy.data.objects.get(target_name)
-        if not target_obj or target_obj.type != 'MESH':
-            raise ValueError(f"Target mesh '{target_name}' not found")
+        logger.info(f"Transferred {len(groups)} groups from {source_name} to {len(targets)} meshes "
+                    f"({method}, index {'cached' if cached else 'built'}) in {elapsed_ms:.1f}ms")
 
+        return {
+            "transferred": True,
+            "source_mesh": source_name,
+            "method": method,
+            "vertex_groups": list(groups),
+            "source_index_cached": cached,
+            "index_ms": round(index_ms, 2),
+            "targets": results,
+            "elapsed_ms": round(elapsed_ms, 2)
+        }
+
+    def _transfer_with_modifier(self, source_obj, target_obj, vertex_group) -> None:
+        """Transfer through a DATA_TRANSFER modifier applied with the operator"""
         # Deselect all, then select target and source
         bpy.ops.object.select_all(action='DESELECT')
         source_obj.select_set(True)
@@ -327,15 +641,7 @@ class TransferWeightsHandler(BaseHandler):
         # Apply modifier
         bpy.ops.object.modifier_apply(modifier=modifier.name)
 
-        logger.info(f"Transferred weights from {source_name} to {target_name}")
-
-        return {
-            "transferred": True,
-            "source_mesh": source_name,
-            "target_mesh": target_name,
-            "vertex_group": vertex_group if vertex_group else "ALL",
-            "target_groups": [vg.name for vg in target_obj.vertex_groups]
-        }
+        logger.info(f"Transferred weights from {source_obj.name} to {target_obj.name}")
 
 
 class GetVertexGroupsHandler(BaseHandler):
@@ -0,0 +1,148 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+import fnmatch
+import re
+import numpy as np
+from typing import Dict, Any, List, Tuple
+from handlers.base_handler import BaseHandler
+from core.revisions import decode_cursor, encode_cursor, revisions
+from core.scene_events import scene_events
+from utils.cache import cache, NEVER_EXPIRE
+from utils.validation import DEFAULT_PAGE_SIZE, validate_page_size
+from utils.logger import logger
+
+def _cache_tags(scene) -> List[str]:
+    return [f"SCENE:{scene.name}", "OBJECT", "COLLECTION", "FRAME"]
+
+class ListObjectsHandler(BaseHandler):
+    """Handler for listing every object in the scene, one page at a time"""
+
+    def get_command_name(self) -> str:
+        return "list_objects"
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "object_type": {
+                "type": (str, list),
+                "required": False
+            },
+            "collection": {
+                "type": str,
+                "required": False
+            },
+            "name_pattern": {
+                "type": str,
+                "required": False
+            },
+            "page_size": {
+                "type": int,
+                "required": False,
+                "validator": validate_page_size
+            },
+            "cursor": {
+                "type": str,
+                "required": False
+            }
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """List objects with their transforms, filtered before serialization"""
+        scene = bpy.context.scene
+        page_size = params.get("page_size", DEFAULT_PAGE_SIZE)
+        offset, cursor_revision = decode_cursor(params["cursor"]) if params.get("cursor") else (0, None)
+
+        scene_events.sync()
+        names, transforms = self._get_table(scene)
+        indices = self._get_matches(scene, names, params)
+
+        page = indices[offset:offset + page_size]
+        page_transforms = transforms[page].round(5).tolist()
+        objects = []
+        for index, values in zip(page.tolist(), page_transforms):
+            obj = scene.objects.get(names[index])
+            if obj is None:
+                continue
+            objects.append({
+                "name": obj.name,
+                "type": obj.type,
+                "location": values[0:3],
+                "rotation": values[3:6],
+                "scale": values[6:9],
+                "visible": obj.visible_get(),
+                "parent": obj.parent.name if obj.parent else None,
+            })
+
+        end = offset + len(page)
+        result = {
+            "scene": scene.name,
+            "total": len(indices),
+            "offset": offset,
+            "count": len(objects),
+            "objects": objects,
+            "next_cursor": encode_cursor(end) if end < len(indices) else None,
+        }
+        if cursor_revision is not None and cursor_revision != revisions.revision:
+            # Objects were added, removed or moved since the first page
+            result["scene_changed"] = True
+
+        logger.info(f"Listed {len(objects)} of {len(indices)} objects (offset {offset})")
+        return result
+
+    def _get_table(self, scene) -> Tuple[List[str], np.ndarray]:
+        """Names and an (N, 9) location/rotation/scale array for every object in the scene"""
+        cache_key = f"object_table:{scene.name}"
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
+        objects = scene.objects
+        count = len(objects)
+        names = objects.keys()
+        transforms = np.empty((count, 9), dtype=np.float32)
+        buffer = np.empty(count * 3, dtype=np.float32)
+        for column, prop in ((0, "location"), (3, "rotation_euler"), (6, "scale")):
+            objects.foreach_get(prop, buffer)
+            transforms[:, column:column + 3] = buffer.reshape(count, 3)
+
+        table = (names, transforms)
+        self._cache(cache_key, table, scene)
+        return table
+
+    def _get_matches(self, scene, names: List[str], params: Dict[str, Any]) -> np.ndarray:
+        """Indices of objects that pass the type, collection and name filters"""
+        object_type = params.get("object_type")
+        collection_name = params.get("collection")
+        pattern = params.get("name_pattern")
+        if not (object_type or collection_name or pattern):
+            return np.arange(len(names))
+
+        types = sorted({object_type} if isinstance(object_type, str) else set(object_type or ()))
+        cache_key = f"object_table:{scene.name}:{','.join(types)}:{collection_name or ''}:{pattern or ''}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        mask = np.ones(len(names), dtype=bool)
+        if pattern:
+            regex = re.compile(fnmatch.translate(pattern))
+            mask &= np.fromiter((regex.match(name) is not None for name in names), dtype=bool, count=len(names))
+        if collection_name:
+            collection = bpy.data.collections.get(collection_name)
+            if collection is None:
+                raise ValueError(f"Collection not found: {collection_name}")
+            members = set(collection.all_objects.keys())
+            mask &= np.fromiter((name in members for name in names), dtype=bool, count=len(names))
+        if types:
+            # Enum properties cannot be read with foreach_get
+            wanted = {t.upper() for t in types}
+            mask &= np.fromiter((obj.type in wanted for obj in scene.objects), dtype=bool, count=len(names))
+
+        indices = np.flatnonzero(mask)
+        self._cache(cache_key, indices, scene)
+        return indices
+
+    def _cache(self, key: str, value: Any, scene) -> None:
+        # Same lifetime as get_scene_info: until objects or collections change
+        ttl = NEVER_EXPIRE if scene_events.active else 5
+        cache.set(key, value, ttl=ttl, tags=_cache_tags(scene))
@@ -4,6 +4,9 @@ import bpy
 import mathutils
 from typing import Dict, Any, Optional
 from handlers.base_handler import BaseHandler
+from core.response_builder import NotModified
+from core.revisions import etag_matches, revisions
+from core.scene_events import scene_events
 from utils.error_handler import ErrorCode, create_error_response
 from utils.validation import OBJECT_NAME_SCHEMA, validate_object_exists
 from utils.logger import logger
@@ -20,6 +23,10 @@ class GetObjectInfoHandler(BaseHandler):
                 "type": str,
                 "required": True,
                 "validator": validate_object_exists
+            },
+            "if_none_match": {
+                "type": str,
+                "required": False
             }
         }
     
@@ -31,6 +38,11 @@ class GetObjectInfoHandler(BaseHandler):
         if not obj:
             raise ValueError(f"Object not found: {name}")
         
+        scene_events.sync()
+        etag = revisions.object_etag(name)
+        if etag_matches(params, etag):
+            return NotModified(etag)
+        
         # Basic object info
         obj_info = {
             "name": obj.name,
@@ -40,6 +52,7 @@ class GetObjectInfoHandler(BaseHandler):
             "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
             "visible": obj.visible_get(),
             "materials": [],
+            "etag": etag,
         }
         
         if obj.type == "MESH":
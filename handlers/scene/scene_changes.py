@@ -0,0 +1,114 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import bpy
+from typing import Dict, Any, Iterable
+from handlers.base_handler import BaseHandler
+from core.change_journal import change_journal
+from core.revisions import revisions
+from core.scene_events import scene_events
+from utils.validation import ValidationError
+from utils.logger import logger
+
+def validate_revision(value: int) -> None:
+    """Validate a scene revision number"""
+    if value < 0:
+        raise ValidationError("Revision must be a non-negative integer")
+
+class GetSceneChangesHandler(BaseHandler):
+    """Handler for getting what changed in the scene since a revision"""
+
+    def get_command_name(self) -> str:
+        return "get_scene_changes"
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "since_revision": {
+                "type": int,
+                "required": True,
+                "validator": validate_revision
+            },
+            "session": {
+                "type": str,
+                "required": False
+            },
+            "include_values": {
+                "type": bool,
+                "required": False
+            }
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Return added, removed and modified objects since a revision"""
+        since = params["since_revision"]
+        session = params.get("session")
+        include_values = params.get("include_values", True)
+
+        scene_events.sync()
+        result = {
+            "session": revisions.session,
+            "revision": revisions.revision,
+            "since_revision": since,
+            "full_resync": False
+        }
+
+        # The client must re-read everything when the journal cannot answer
+        reason = None
+        if since == 0:
+            reason = "First call: read the scene once, then pass this revision"
+        elif not scene_events.active:
+            reason = "Scene change tracking is not active"
+        elif session is not None and session != revisions.session:
+            reason = "Revision belongs to a different server session"
+        elif since > revisions.revision:
+            reason = "Revision is newer than the current scene revision"
+
+        changes = None if reason else change_journal.changes_since(since)
+        if changes is None:
+            result["full_resync"] = True
+            result["reason"] = reason or "Revision is older than the change journal (file loaded, undo, or too many changes)"
+            return result
+
+        result.update(changes)
+        if changes["frame_changed"]:
+            # Every animated object may have moved without a depsgraph update
+            result["animated_objects"] = change_journal.animated_objects()
+            result["frame_current"] = bpy.context.scene.frame_current
+
+        if include_values:
+            objects = {}
+            for name in changes["added"]:
+                objects[name] = self._object_values(name, ("type", "transform", "geometry", "material", "animation"))
+            for name, fields in changes["modified"].items():
+                objects[name] = self._object_values(name, fields)
+            result["objects"] = {name: values for name, values in objects.items() if values is not None}
+
+        logger.info(f"Scene changes since revision {since}: {len(changes['added'])} added, "
+                    f"{len(changes['removed'])} removed, {len(changes['modified'])} modified")
+        return result
+
+    def _object_values(self, name: str, fields: Iterable[str]) -> Any:
+        """Current values of the changed fields of one object"""
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            return None
+
+        values = {}
+        for field in fields:
+            if field == "type":
+                values["type"] = obj.type
+            elif field == "transform":
+                values["location"] = list(obj.location)
+                values["rotation"] = list(obj.rotation_euler)
+                values["scale"] = list(obj.scale)
+                values["parent"] = obj.parent.name if obj.parent else None
+            elif field == "geometry" and obj.type == "MESH" and obj.data:
+                values["vertices"] = len(obj.data.vertices)
+                values["polygons"] = len(obj.data.polygons)
+            elif field == "material":
+                values["materials"] = [slot.material.name for slot in obj.material_slots if slot.material]
+            elif field == "animation":
+                action = obj.animation_data.action if obj.animation_data else None
+                values["action"] = action.name if action else None
+                if action:
+                    values["frame_range"] = list(action.frame_range)
+        return values
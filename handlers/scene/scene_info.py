@@ -3,7 +3,10 @@
 import bpy
 from typing import Dict, Any
 from handlers.base_handler import BaseHandler
-from utils.cache import cache
+from core.response_builder import NotModified
+from core.revisions import etag_matches, revisions
+from core.scene_events import scene_events
+from utils.cache import cache, NEVER_EXPIRE
 from utils.logger import logger
 
 class GetSceneInfoHandler(BaseHandler):
@@ -13,16 +16,29 @@ class GetSceneInfoHandler(BaseHandler):
         return "get_scene_info"
     
     def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
-        return {}  # No parameters required
+        return {
+            "if_none_match": {
+                "type": str,
+                "required": False
+            }
+        }
     
     def execute(self, params: Dict[str, Any]) -> Any:
         """Get information about the current Blender scene"""
         try:
+            # Let pending edits report their changes before trusting the cache
+            scene_events.sync()
+            
+            etag = revisions.scene_etag()
+            if etag_matches(params, etag):
+                return NotModified(etag)
+            
             # Check cache first
-            cache_key = f"scene_info_{bpy.context.scene.name}"
+            cache_key = f"scene_info:{bpy.context.scene.name}"
             cached = cache.get(cache_key)
             if cached:
-                return cached
+                # Unchanged since it was cached, so it is current as of this revision
+                return {**cached, "etag": etag}
             
             logger.info("Getting scene info...")
             scene = bpy.context.scene
@@ -38,6 +54,7 @@ class GetSceneInfoHandler(BaseHandler):
                 "frame_start": scene.frame_start,
                 "frame_end": scene.frame_end,
                 "fps": scene.render.fps,
+                "etag": etag,
             }
             
             # Collect minimal object information (limit to first 20 objects)
@@ -57,8 +74,12 @@ class GetSceneInfoHandler(BaseHandler):
                 }
                 scene_info["objects"].append(obj_info)
             
-            # Cache the result
-            cache.set(cache_key, scene_info, ttl=5)  # 5 second cache
+            # Cache the result until the scene, its objects, materials or collections change.
+            # Without scene change tracking, fall back to a short TTL.
+            ttl = NEVER_EXPIRE if scene_events.active else 5
+            cache.set(cache_key, scene_info, ttl=ttl, tags=[
+                f"SCENE:{scene.name}", "OBJECT", "MATERIAL", "COLLECTION", "FRAME"
+            ])
             
             logger.info(f"Scene info collected: {len(scene_info['objects'])} objects")
             return scene_info
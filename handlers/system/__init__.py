@@ -0,0 +1 @@
+# System handlers module
@@ -0,0 +1,71 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+from typing import Dict, Any
+from handlers.base_handler import BaseHandler
+from core.dispatcher import CommandPriority
+from core.jobs import CANCELLED, COMPLETED, FAILED, jobs
+from core.response_builder import Partial
+
+def _get_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise ValueError(f"Job '{job_id}' not found (finished jobs are kept for a limited time)")
+    return job
+
+class GetJobStatusHandler(BaseHandler):
+    """Handler for polling a background job started with background=True"""
+
+    def get_command_name(self) -> str:
+        return "get_job_status"
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "job_id": {"type": str, "required": True}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Report progress while the job runs, and its result once it completed"""
+        job = _get_job(params["job_id"])
+        if job.state == FAILED:
+            raise RuntimeError(f"Job '{job.id}' ({job.command}) failed: {job.error}")
+        if job.state == COMPLETED:
+            return {**job.to_dict(), "result": job.result}
+        if job.state == CANCELLED:
+            return job.to_dict()
+        return Partial(job.to_dict(), job.completed, job.total)
+
+class CancelJobHandler(BaseHandler):
+    """Handler for cancelling a background job"""
+
+    def get_command_name(self) -> str:
+        return "cancel_job"
+
+    def get_priority(self) -> CommandPriority:
+        # Must not wait behind the work it is meant to stop
+        return CommandPriority.INTERACTIVE
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "job_id": {"type": str, "required": True}
+        }
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Stop a job before its next slice; work already done by earlier slices is kept"""
+        job = jobs.cancel(_get_job(params["job_id"]).id)
+        return {
+            **job.to_dict(),
+            "cancel_requested": job.cancel_requested
+        }
+
+class ListJobsHandler(BaseHandler):
+    """Handler for listing running and recently finished background jobs"""
+
+    def get_command_name(self) -> str:
+        return "list_jobs"
+
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """List jobs with their state and progress"""
+        return {"jobs": jobs.list()}
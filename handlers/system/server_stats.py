@@ -0,0 +1,30 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+from typing import Dict, Any
+from handlers.base_handler import BaseHandler
+from core.action_index import action_index
+from core.change_journal import change_journal
+from core.dispatcher import dispatcher
+from core.jobs import jobs
+from core.revisions import revisions
+from utils.cache import cache
+
+class GetServerStatsHandler(BaseHandler):
+    """Handler for getting server runtime statistics"""
+    
+    def get_command_name(self) -> str:
+        return "get_server_stats"
+    
+    def get_parameter_schema(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+    
+    def execute(self, params: Dict[str, Any]) -> Any:
+        """Get dispatcher queue/timing, cache, scene revision and background job statistics"""
+        return {
+            "dispatcher": dispatcher.get_stats(),
+            "cache": cache.get_stats(),
+            "revisions": revisions.get_state(),
+            "change_journal": change_journal.get_state(),
+            "action_index": action_index.get_state(),
+            "jobs": jobs.list()
+        }
@@ -0,0 +1,45 @@
+"""Client side of the Blender socket wire protocol (see core/protocol.py in the addon)"""
+
+import json
+import socket
+import struct
+from typing import Any, Dict
+
+PROTOCOL_LEGACY = 1   # Bare JSON documents, boundaries found by parsing
+PROTOCOL_FRAMED = 2   # 4-byte big-endian length prefix + JSON payload
+PROTOCOL_MULTIPLEXED = 3  # Framed, with request ids echoed on out-of-order responses
+SUPPORTED_PROTOCOLS = [PROTOCOL_MULTIPLEXED, PROTOCOL_FRAMED, PROTOCOL_LEGACY]
+
+NEGOTIATE_COMMAND = "negotiate_protocol"
+
+FRAME_HEADER = struct.Struct("!I")
+MAX_RESPONSE_SIZE = 512 * 1024 * 1024  # Refuse frames above 512MB
+
+
+def encode_message(message: Dict[str, Any], protocol: int) -> bytes:
+    """Serialize a message using the given protocol version"""
+    payload = json.dumps(message).encode('utf-8')
+    if protocol >= PROTOCOL_FRAMED:
+        return FRAME_HEADER.pack(len(payload)) + payload
+    return payload
+
+
+def recv_exactly(sock: socket.socket, size: int) -> bytearray:
+    """Read exactly `size` bytes into a preallocated buffer"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], min(size - received, 65536))
+        if count == 0:
+            raise ConnectionError(f"Connection closed after {received} of {size} bytes")
+        received += count
+    return buffer
+
+
+def recv_frame(sock: socket.socket) -> bytearray:
+    """Read one length-prefixed frame and return its payload"""
+    (length,) = FRAME_HEADER.unpack(recv_exactly(sock, FRAME_HEADER.size))
+    if length > MAX_RESPONSE_SIZE:
+        raise ConnectionError(f"Frame of {length} bytes exceeds limit of {MAX_RESPONSE_SIZE} bytes")
+    return recv_exactly(sock, length)
@@ -3,16 +3,30 @@ from mcp.server.fastmcp import FastMCP, Context, Image
 import socket
 import json
 import asyncio
+import itertools
 import logging
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Tuple
 import os
 from pathlib import Path
 import base64
 from urllib.parse import urlparse
 
+from .protocol import (
+    NEGOTIATE_COMMAND,
+    PROTOCOL_LEGACY,
+    PROTOCOL_FRAMED,
+    PROTOCOL_MULTIPLEXED,
+    SUPPORTED_PROTOCOLS,
+    encode_message,
+    recv_frame
+)
+
 # Import telemetry
 from .telemetry import record_startup, get_telemetry
 from .telemetry_decorator import telemetry_tool
@@ -25,12 +39,19 @@ logger = logging.getLogger("BlenderMCPServer")
 # Default configuration
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
+BUSY_RETRIES = 3  # Resubmissions of a command rejected with SERVER_BUSY
+MAX_CONDITIONAL_READS = 256  # Payloads kept for ETag revalidation
 
 @dataclass
 class BlenderConnection:
     host: str
     port: int
     sock: socket.socket = None  # Changed from 'socket' to 'sock' to avoid naming conflict
+    protocol_version: int = PROTOCOL_LEGACY
+    _send_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _pending_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _pending: Dict[int, Future] = field(default_factory=dict, repr=False)
+    _request_ids: itertools.count = field(default_factory=lambda: itertools.count(1), repr=False)
     
     def connect(self) -> bool:
         """Connect to the Blender addon socket server"""
@@ -41,12 +62,34 @@ class BlenderConnection:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.connect((self.host, self.port))
             logger.info(f"Connected to Blender at {self.host}:{self.port}")
+            self.protocol_version = PROTOCOL_LEGACY
+            self._negotiate_protocol()
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Blender: {str(e)}")
             self.sock = None
             return False
     
+    def _negotiate_protocol(self):
+        """Ask the addon for length-prefixed framing, falling back to legacy JSON framing"""
+        command = {
+            "type": NEGOTIATE_COMMAND,
+            "params": {"versions": SUPPORTED_PROTOCOLS}
+        }
+        self.sock.sendall(encode_message(command, PROTOCOL_LEGACY))
+        response = json.loads(self.receive_full_response(self.sock).decode('utf-8'))
+        
+        # Older addons answer with an "unknown command" error and keep legacy framing
+        if response.get("status") == "success":
+            self.protocol_version = response.get("result", {}).get("version", PROTOCOL_LEGACY)
+        logger.info(f"Using Blender protocol version {self.protocol_version}")
+        
+        if self.protocol_version >= PROTOCOL_MULTIPLEXED:
+            # Responses are matched by id on a dedicated reader thread
+            self.sock.settimeout(None)
+            reader = threading.Thread(target=self._read_responses, args=(self.sock,), daemon=True)
+            reader.start()
+    
     def disconnect(self):
         """Disconnect from the Blender addon"""
         if self.sock:
@@ -75,6 +118,10 @@ class BlenderConnection:
                     
                     chunks.append(chunk)
                     
+                    # A complete JSON object must end with '}', so skip parsing otherwise
+                    if not chunk.rstrip().endswith(b'}'):
+                        continue
+                    
                     # Check if we've received a complete JSON object
                     try:
                         data = b''.join(chunks)
@@ -115,9 +162,137 @@ class BlenderConnection:
 
     def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a command to Blender and return the response"""
+        return self.send_commands([(command_type, params)])[0]
+    
+    def send_commands(self, commands: List[Tuple[str, Dict[str, Any]]],
+                      return_exceptions: bool = False) -> List[Dict[str, Any]]:
+        """
+        Send several independent commands and return their results in order.
+        
+        On a multiplexed connection every command is written before any response
+        is awaited, so N commands share one network round trip. With
+        return_exceptions, a command that fails to send or fails in Blender
+        puts its exception in the list instead of failing the whole call.
+        """
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Blender")
         
+        def collect(call, *args):
+            if not return_exceptions:
+                return call(*args)
+            try:
+                return call(*args)
+            except Exception as e:
+                return e
+        
+        if self.protocol_version < PROTOCOL_MULTIPLEXED:
+            with self._send_lock:
+                return [collect(self._send_command_sync, command_type, params) for command_type, params in commands]
+        
+        pending = []
+        for command_type, params in commands:
+            submitted = collect(self._submit_command, command_type, params)
+            pending.append(submitted if isinstance(submitted, Exception) else (command_type, params, *submitted))
+        return [request if isinstance(request, Exception) else collect(self._wait_for_response, *request)
+                for request in pending]
+    
+    def _submit_command(self, command_type: str, params: Dict[str, Any] = None) -> Tuple[int, Future]:
+        """Write one request on a multiplexed connection without waiting for its response"""
+        sock = self.sock
+        if sock is None:
+            raise Exception("Connection to Blender lost")
+        
+        request_id = next(self._request_ids)
+        future = Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
+        
+        command = {
+            "id": request_id,
+            "type": command_type,
+            "params": params or {}
+        }
+        logger.info(f"Sending command #{request_id}: {command_type} with params: {params}")
+        try:
+            with self._send_lock:
+                sock.sendall(encode_message(command, self.protocol_version))
+        except (ConnectionError, BrokenPipeError, ConnectionResetError, OSError) as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            logger.error(f"Socket connection error: {str(e)}")
+            self.disconnect()
+            raise Exception(f"Connection to Blender lost: {str(e)}")
+        return request_id, future
+    
+    def _wait_for_response(self, command_type: str, params: Dict[str, Any], request_id: int, future: Future) -> Dict[str, Any]:
+        """Wait for the response matching a request id and unwrap its result"""
+        for attempt in range(BUSY_RETRIES + 1):
+            try:
+                response = future.result(timeout=180.0)  # Match the addon's timeout
+            except FutureTimeoutError:
+                with self._pending_lock:
+                    self._pending.pop(request_id, None)
+                logger.error(f"Timeout waiting for response to command #{request_id} ({command_type})")
+                raise Exception("Timeout waiting for Blender response - try simplifying your request")
+            
+            # Blender rejects commands when its queue is full; honour the suggested delay
+            error_obj = response.get("error")
+            if attempt < BUSY_RETRIES and isinstance(error_obj, dict) and error_obj.get("code") == "SERVER_BUSY":
+                retry_after = error_obj.get("details", {}).get("retry_after", 1.0)
+                logger.warning(f"Blender is busy, retrying {command_type} in {retry_after}s")
+                time.sleep(retry_after)
+                request_id, future = self._submit_command(command_type, params)
+                continue
+            break
+        return self._unwrap_response(response)
+    
+    def _read_responses(self, sock: socket.socket):
+        """Reader thread: route responses on a multiplexed connection to their waiting requests"""
+        try:
+            while True:
+                response = json.loads(recv_frame(sock).decode('utf-8'))
+                with self._pending_lock:
+                    future = self._pending.pop(response.get("id"), None)
+                if future is None:
+                    logger.warning(f"Dropping response with unknown id: {response.get('id')}")
+                    continue
+                future.set_result(response)
+        except Exception as e:
+            if self.sock is sock:
+                logger.error(f"Connection to Blender lost: {str(e)}")
+                self.sock = None
+            error = Exception(f"Connection to Blender lost: {str(e)}")
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(error)
+    
+    def _unwrap_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the result of a response, raising if Blender reported an error"""
+        logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+        
+        if response.get("status") == "not_modified":
+            return {"not_modified": True, "etag": response.get("etag")}
+        
+        if response.get("status") == "error":
+            # Handle both old format {"status": "error", "message": "..."} 
+            # and new format {"status": "error", "error": {"message": "..."}}
+            error_obj = response.get("error", {})
+            if isinstance(error_obj, dict):
+                error_message = error_obj.get("message", response.get("message", "Unknown error from Blender"))
+            else:
+                error_message = response.get("message", "Unknown error from Blender")
+            logger.error(f"Blender error: {error_message}")
+            raise Exception(error_message)
+        
+        if response.get("status") == "partial":
+            # A background job was started or is still running
+            return {**response.get("result", {}), "progress": response.get("progress")}
+        
+        return response.get("result", {})
+    
+    def _send_command_sync(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a command and block until its response arrives (protocol versions 1 and 2)"""
         command = {
             "type": command_type,
             "params": params or {}
@@ -128,31 +303,22 @@ class BlenderConnection:
             logger.info(f"Sending command: {command_type} with params: {params}")
             
             # Send the command
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
+            self.sock.sendall(encode_message(command, self.protocol_version))
             logger.info(f"Command sent, waiting for response...")
             
             # Set a timeout for receiving - use the same timeout as in receive_full_response
             self.sock.settimeout(180.0)  # Match the addon's timeout
             
-            # Receive the response using the improved receive_full_response method
-            response_data = self.receive_full_response(self.sock)
+            if self.protocol_version == PROTOCOL_FRAMED:
+                # Length-prefixed frames are read in a single linear pass
+                response_data = recv_frame(self.sock)
+            else:
+                # Receive the response using the improved receive_full_response method
+                response_data = self.receive_full_response(self.sock)
             logger.info(f"Received {len(response_data)} bytes of data")
             
             response = json.loads(response_data.decode('utf-8'))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
-            
-            if response.get("status") == "error":
-                # Handle both old format {"status": "error", "message": "..."} 
-                # and new format {"status": "error", "error": {"message": "..."}}
-                error_obj = response.get("error", {})
-                if isinstance(error_obj, dict):
-                    error_message = error_obj.get("message", response.get("message", "Unknown error from Blender"))
-                else:
-                    error_message = response.get("message", "Unknown error from Blender")
-                logger.error(f"Blender error: {error_message}")
-                raise Exception(error_message)
-            
-            return response.get("result", {})
+            return self._unwrap_response(response)
         except socket.timeout:
             logger.error("Socket timeout while waiting for response from Blender")
             # Don't try to reconnect here - let the get_blender_connection handle reconnection
@@ -257,6 +423,36 @@ def get_blender_connection():
     
     return _blender_connection
 
+# Last payload per conditional read, reused when Blender answers not_modified
+_conditional_reads: Dict[str, Tuple[str, Any]] = {}
+
+def conditional_params(command_type: str, params: Dict[str, Any] = None) -> Tuple[str, Dict[str, Any]]:
+    """Return the storage key and the params with the stored ETag attached as if_none_match"""
+    params = params or {}
+    key = f"{command_type}:{json.dumps(params, sort_keys=True)}"
+    stored = _conditional_reads.get(key)
+    if stored:
+        params = {**params, "if_none_match": stored[0]}
+    return key, params
+
+def resolve_conditional(key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reuse the stored payload for a not_modified result, otherwise store the new one"""
+    stored = _conditional_reads.get(key)
+    if result.get("not_modified") and stored:
+        return stored[1]
+    etag = result.get("etag")
+    if etag:
+        _conditional_reads.pop(key, None)
+        _conditional_reads[key] = (etag, result)
+        if len(_conditional_reads) > MAX_CONDITIONAL_READS:
+            _conditional_reads.pop(next(iter(_conditional_reads)))
+    return result
+
+def send_conditional_command(blender: BlenderConnection, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Send a read with the last ETag, reusing the stored payload if Blender reports no change"""
+    key, params = conditional_params(command_type, params)
+    return resolve_conditional(key, blender.send_command(command_type, params))
+
 
 @telemetry_tool("get_scene_info")
 @mcp.tool()
@@ -264,7 +460,7 @@ def get_scene_info(ctx: Context) -> str:
     """Get detailed information about the current Blender scene"""
     try:
         blender = get_blender_connection()
-        result = blender.send_command("get_scene_info")
+        result = send_conditional_command(blender, "get_scene_info")
 
         # Just return the JSON representation of what Blender sent us
         return json.dumps(result, indent=2)
@@ -272,6 +468,42 @@ def get_scene_info(ctx: Context) -> str:
         logger.error(f"Error getting scene info from Blender: {str(e)}")
         return f"Error getting scene info: {str(e)}"
 
+@telemetry_tool("list_objects")
+@mcp.tool()
+def list_objects(
+    ctx: Context,
+    object_type: List[str] = None,
+    collection: str = None,
+    name_pattern: str = None,
+    page_size: int = 200,
+    cursor: str = None
+) -> str:
+    """
+    List all objects in the current scene with their transforms, one page at a time.
+    Unlike get_scene_info, this is not limited to the first 20 objects.
+    
+    Parameters:
+    - object_type: Only list objects of these types, e.g. ["MESH", "ARMATURE"]
+    - collection: Only list objects in this collection (including child collections)
+    - name_pattern: Only list objects whose name matches this glob, e.g. "Tree_*"
+    - page_size: Number of objects per page (default: 200, max: 5000)
+    - cursor: The "next_cursor" returned by the previous page; omit for the first page
+    
+    Returns name, type, location, rotation, scale, visibility and parent for each object.
+    """
+    try:
+        blender = get_blender_connection()
+        params = {"page_size": page_size}
+        for key, value in (("object_type", object_type), ("collection", collection),
+                           ("name_pattern", name_pattern), ("cursor", cursor)):
+            if value:
+                params[key] = value
+        result = blender.send_command("list_objects", params)
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error listing objects from Blender: {str(e)}")
+        return f"Error listing objects: {str(e)}"
+
 @telemetry_tool("get_object_info")
 @mcp.tool()
 def get_object_info(ctx: Context, object_name: str) -> str:
@@ -283,7 +515,7 @@ def get_object_info(ctx: Context, object_name: str) -> str:
     """
     try:
         blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {"name": object_name})
+        result = send_conditional_command(blender, "get_object_info", {"name": object_name})
         
         # Just return the JSON representation of what Blender sent us
         return json.dumps(result, indent=2)
@@ -291,6 +523,128 @@ def get_object_info(ctx: Context, object_name: str) -> str:
         logger.error(f"Error getting object info from Blender: {str(e)}")
         return f"Error getting object info: {str(e)}"
 
+@telemetry_tool("get_objects_info")
+@mcp.tool()
+def get_objects_info(ctx: Context, object_names: List[str]) -> str:
+    """
+    Get detailed information about several objects in the Blender scene at once.
+    
+    Parameters:
+    - object_names: The names of the objects to get information about
+    
+    Returns {"objects": {name: info}, "errors": {name: message}}. Objects that are
+    missing or fail to read are listed in "errors"; the others are still returned.
+    """
+    try:
+        blender = get_blender_connection()
+        requests = [conditional_params("get_object_info", {"name": object_name}) for object_name in object_names]
+        results = blender.send_commands([("get_object_info", params) for _, params in requests],
+                                        return_exceptions=True)
+        objects = {}
+        errors = {}
+        for object_name, (key, _), result in zip(object_names, requests, results):
+            if isinstance(result, Exception):
+                errors[object_name] = str(result)
+            else:
+                objects[object_name] = resolve_conditional(key, result)
+        
+        return json.dumps({"objects": objects, "errors": errors}, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting objects info from Blender: {str(e)}")
+        return f"Error getting objects info: {str(e)}"
+
+@telemetry_tool("get_scene_changes")
+@mcp.tool()
+def get_scene_changes(ctx: Context, since_revision: int, session: str = None, include_values: bool = True) -> str:
+    """
+    Get what changed in the Blender scene since an earlier revision, instead of re-reading the whole scene.
+    
+    Parameters:
+    - since_revision: The "revision" returned by a previous call. 0 on the first call returns the current
+      revision with "full_resync" true; read the scene once with get_scene_info and pass that revision next time
+    - session: The "session" returned by a previous call, so revisions from a restarted Blender are rejected
+    - include_values: Include the current transform, material and animation values of changed objects (default: True)
+    
+    Returns added, removed and modified objects with the fields that changed. When "full_resync" is true,
+    the changes can no longer be reconstructed and the scene should be read again with get_scene_info.
+    """
+    try:
+        blender = get_blender_connection()
+        params = {"since_revision": since_revision, "include_values": include_values}
+        if session:
+            params["session"] = session
+        result = blender.send_command("get_scene_changes", params)
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting scene changes from Blender: {str(e)}")
+        return f"Error getting scene changes: {str(e)}"
+
+@telemetry_tool("get_job_status")
+@mcp.tool()
+def get_job_status(ctx: Context, job_id: str) -> str:
+    """
+    Get the progress or result of a background job.
+    
+    Long bakes, samples and imports (bake_animation, bake_armature_animation, bake_transforms,
+    sample_animation, import_animation_data) run as background jobs when started with
+    "background": true; they return a job_id right away.
+    
+    Parameters:
+    - job_id: The "job_id" returned when the job was started
+    
+    Returns the job state ("running", "completed", "cancelled") with its progress, and the command's
+    result once the job completed. A failed job is reported as an error.
+    """
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("get_job_status", {"job_id": job_id})
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting job status from Blender: {str(e)}")
+        return f"Error getting job status: {str(e)}"
+
+@telemetry_tool("cancel_job")
+@mcp.tool()
+def cancel_job(ctx: Context, job_id: str) -> str:
+    """
+    Cancel a running background job. It stops before its next frame window.
+    
+    Parameters:
+    - job_id: The "job_id" returned when the job was started
+    """
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("cancel_job", {"job_id": job_id})
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error cancelling job in Blender: {str(e)}")
+        return f"Error cancelling job: {str(e)}"
+
+@telemetry_tool("execute_batch")
+@mcp.tool()
+def execute_batch(ctx: Context, commands: List[Dict[str, Any]], stop_on_error: bool = True) -> str:
+    """
+    Run several Blender commands in one round trip, as a single undo step.
+    
+    Parameters:
+    - commands: List of {"type": <command name>, "params": {...}} objects, e.g.
+      [{"type": "create_light", "params": {"light_type": "POINT"}},
+       {"type": "create_keyframe", "params": {"object_name": "Cube", "frame": 1, "data_path": "location"}}]
+    - stop_on_error: Stop at the first failing command (default: True); otherwise run all of them
+    
+    Returns a per-command list of results or errors. Commands that already ran are not undone when a later one fails.
+    """
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("batch", {
+            "commands": commands,
+            "stop_on_error": stop_on_error
+        })
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error executing batch in Blender: {str(e)}")
+        return f"Error executing batch: {str(e)}"
+
 @telemetry_tool("get_viewport_screenshot")
 @mcp.tool()
 def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
@@ -0,0 +1,63 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import numpy as np
+import pytest
+from utils.bake_engine import axis_rotation_matrices, decompose, rotation_to_matrices
+
+
+def _random_rotations(count, seed=0):
+    quats = np.random.default_rng(seed).normal(size=(count, 4))
+    return rotation_to_matrices(quats, "QUATERNION")
+
+
+def _matrices(rotation, location, scale):
+    matrices = np.zeros((len(rotation), 4, 4))
+    matrices[:, :3, :3] = rotation * scale[:, None, :]
+    matrices[:, :3, 3] = location
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+@pytest.mark.parametrize("rotation_mode", ["QUATERNION", "AXIS_ANGLE", "XYZ"])
+def test_decompose_round_trip(rotation_mode):
+    rng = np.random.default_rng(1)
+    rotation = _random_rotations(50)
+    location = rng.normal(size=(50, 3))
+    scale = rng.uniform(0.5, 2.0, size=(50, 3))
+    channels = decompose(_matrices(rotation, location, scale), rotation_mode)
+
+    assert np.allclose(channels["location"], location)
+    assert np.allclose(channels["scale"], scale)
+    rotation_channel = next(values for name, values in channels.items() if name.startswith("rotation"))
+    assert np.allclose(rotation_to_matrices(rotation_channel, rotation_mode), rotation, atol=1e-9)
+
+
+def test_decompose_quaternions_are_continuous():
+    angles = np.linspace(0, 4 * np.pi, 100)
+    channels = decompose(_matrices(axis_rotation_matrices("Z", angles), np.zeros((100, 3)), np.ones((100, 3))),
+                         "QUATERNION")
+    quats = channels["rotation_quaternion"]
+    assert (np.sum(quats[1:] * quats[:-1], axis=1) > 0).all()
+
+
+def test_decompose_euler_is_unwrapped():
+    angles = np.linspace(0, 3 * np.pi, 60)
+    channels = decompose(_matrices(axis_rotation_matrices("X", angles), np.zeros((60, 3)), np.ones((60, 3))), "XYZ")
+    assert np.allclose(channels["rotation_euler"][:, 0], angles)
+
+
+def test_decompose_negative_scale():
+    rotation = _random_rotations(5)
+    scale = np.array([[-1.0, 2.0, 3.0]] * 5)
+    channels = decompose(_matrices(rotation, np.zeros((5, 3)), scale), "QUATERNION")
+    assert np.allclose(channels["scale"], scale)
+    assert np.allclose(rotation_to_matrices(channels["rotation_quaternion"], "QUATERNION"), rotation)
+
+
+@pytest.mark.parametrize("rotation_mode", ["XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX"])
+def test_euler_orders_apply_first_axis_first(rotation_mode):
+    values = np.array([[0.3, -0.7, 1.1]])
+    expected = np.eye(3)
+    for axis in rotation_mode:
+        expected = axis_rotation_matrices(axis, values[:, "XYZ".index(axis)])[0] @ expected
+    assert np.allclose(rotation_to_matrices(values, rotation_mode)[0], expected)
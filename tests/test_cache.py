@@ -0,0 +1,48 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+from utils.cache import CacheManager, NEVER_EXPIRE
+
+
+def test_lru_evicts_least_recently_used():
+    cache = CacheManager(max_entries=3)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert cache.get("a") == "A"  # a is now the most recently used
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+
+
+def test_byte_limit_and_oversized_values():
+    cache = CacheManager(max_bytes=1000)
+    cache.set("small", 1, size=400)
+    cache.set("other", 2, size=400)
+    cache.set("third", 3, size=400)
+    assert cache.get("small") is None and cache.get("third") == 3
+    cache.set("huge", 4, size=2000)
+    assert cache.get("huge") is None
+    assert cache.get_stats()["bytes"] == 800
+
+
+def test_namespace_quota():
+    cache = CacheManager()
+    cache.set_quota("mesh", max_entries=2)
+    for i in range(4):
+        cache.set(f"mesh:{i}", i)
+    cache.set("scene:info", "kept")
+    stats = cache.get_stats()["namespaces"]
+    assert stats["mesh"]["entries"] == 2 and stats["mesh"]["evictions"] == 2
+    assert cache.get("mesh:3") == 3 and cache.get("scene:info") == "kept"
+
+
+def test_ttl_and_tags():
+    cache = CacheManager()
+    cache.set("old", 1, ttl=-1)
+    assert cache.get("old") is None
+    cache.set("a", 1, ttl=NEVER_EXPIRE, tags=["OBJECT:Cube"])
+    cache.set("b", 2, ttl=NEVER_EXPIRE, tags=["OBJECT:Cube", "MATERIAL:Red"])
+    cache.set("c", 3, ttl=NEVER_EXPIRE, tags=["MATERIAL:Red"])
+    assert cache.invalidate_tags(["OBJECT:Cube"]) == 2
+    assert cache.get("c") == 3
+    assert cache.invalidate_tags(["MATERIAL:Red"]) == 1
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,44 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import numpy as np
+import pytest
+from utils.distance_skinning import MIN_WEIGHT, check_parameters, limit_and_normalize, segment_distances
+
+
+def test_limit_and_normalize():
+    rng = np.random.default_rng(2)
+    weights = rng.uniform(0.0, 1.0, size=(500, 8)).astype(np.float32)
+    weights[0] = [0.5, 0.5, 1e-5, 0, 0, 0, 0, 0]
+    result = limit_and_normalize(weights.copy(), 4)
+
+    assert ((result > 0).sum(axis=1) <= 4).all()
+    assert np.allclose(result.sum(axis=1), 1.0, atol=1e-6)
+    assert result[0].tolist() == [0.5, 0.5, 0, 0, 0, 0, 0, 0]
+    assert not ((result > 0) & (result < MIN_WEIGHT)).any()
+    # The kept influences are the largest ones
+    dropped = weights * (result == 0)
+    kept = np.where(result > 0, weights, np.inf)
+    assert (dropped.max(axis=1) <= kept.min(axis=1)).all()
+
+
+def test_limit_and_normalize_all_zero_row():
+    result = limit_and_normalize(np.zeros((2, 3), dtype=np.float32), 2)
+    assert not result.any()
+
+
+def test_segment_distances():
+    heads = np.array([[0.0, 0.0, 0.0]])
+    tails = np.array([[0.0, 0.0, 2.0]])
+    points = np.array([[1.0, 0.0, 1.0], [0.0, 0.0, -3.0], [0.0, 2.0, 5.0]])
+    assert np.allclose(segment_distances(points, heads, tails)[:, 0], [1.0, 3.0, np.sqrt(13.0)])
+
+
+@pytest.mark.parametrize("settings", [
+    {"falloff": 0.0}, {"falloff": -2.0}, {"smooth_factor": -0.1}, {"smooth_factor": 1.5},
+    {"smooth_iterations": -1}, {"max_influences": 0}
+])
+def test_check_parameters_rejects(settings):
+    valid = {"falloff": 4.0, "smooth_iterations": 4, "smooth_factor": 0.5, "max_influences": 4}
+    check_parameters(**valid)
+    with pytest.raises(ValueError):
+        check_parameters(**{**valid, **settings})
@@ -0,0 +1,94 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import base64
+import numpy as np
+import pytest
+from utils.fcurve_arrays import decode_array, encode_array, write_keyframes
+
+
+class FakeKeyframePoints:
+    """keyframe_points with the bulk accessors write_keyframes uses"""
+
+    _attributes = {"co": "co", "handle_left": "handle_left", "handle_right": "handle_right"}
+
+    def __init__(self):
+        self.co = np.zeros((0, 2))
+        self.handle_left = np.zeros((0, 2))
+        self.handle_right = np.zeros((0, 2))
+
+    def __len__(self):
+        return len(self.co)
+
+    def add(self, count):
+        for name in self._attributes.values():
+            setattr(self, name, np.vstack([getattr(self, name), np.zeros((count, 2))]))
+
+    def clear(self):
+        self.__init__()
+
+    def foreach_get(self, name, buffer):
+        buffer[:] = getattr(self, self._attributes[name]).ravel()
+
+    def foreach_set(self, name, buffer):
+        setattr(self, self._attributes[name], np.asarray(buffer, dtype=np.float64).reshape(-1, 2))
+
+
+class FakeFCurve:
+    def __init__(self):
+        self.keyframe_points = FakeKeyframePoints()
+
+    def update(self):
+        points = self.keyframe_points
+        order = np.argsort(points.co[:, 0], kind="stable")
+        for name in FakeKeyframePoints._attributes.values():
+            setattr(points, name, getattr(points, name)[order])
+
+
+def test_decode_array_list_and_ndarray():
+    assert decode_array([[1, 2], [3, 4]]).tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert decode_array(np.arange(3), dtype=np.int64).dtype == np.int64
+
+
+def test_decode_array_base64_round_trip():
+    values = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+    assert decode_array(encode_array(values)).tolist() == values.tolist()
+    encoded = {"dtype": "int32", "data": base64.b64encode(np.array([7, 8], dtype=np.int32).tobytes()).decode()}
+    assert decode_array(encoded, dtype=np.int64).tolist() == [7, 8]
+
+
+@pytest.mark.parametrize("value", [{"dtype": "float32"}, {"data": "AAAA"}, ["a", "b"]])
+def test_decode_array_rejects_bad_input(value):
+    with pytest.raises(ValueError):
+        decode_array(value)
+
+
+def test_write_keyframes_keeps_last_value_per_frame():
+    fcurve = FakeFCurve()
+    counts = write_keyframes(fcurve, [3.0, 1.0, 3.0, 2.0, 1.00001], [30.0, 10.0, 31.0, 20.0, 11.0])
+    assert counts == {"added": 3, "updated": 0, "total": 3}
+    # Frames within FRAME_TOLERANCE are one key
+    assert fcurve.keyframe_points.co[:, 1].tolist() == [11.0, 20.0, 31.0]
+    assert np.allclose(fcurve.keyframe_points.co[:, 0], [1.0, 2.0, 3.0], atol=1e-4)
+
+
+def test_write_keyframes_updates_existing_frames():
+    fcurve = FakeFCurve()
+    write_keyframes(fcurve, [1.0, 2.0, 3.0], [1.0, 2.0, 3.0])
+    counts = write_keyframes(fcurve, [2.0, 4.0], [5.0, 4.0])
+    assert counts == {"added": 1, "updated": 1, "total": 4}
+    assert fcurve.keyframe_points.co.tolist() == [[1.0, 1.0], [2.0, 5.0], [3.0, 3.0], [4.0, 4.0]]
+    # Handles move with an updated key
+    assert fcurve.keyframe_points.handle_left[1, 1] == 5.0
+
+
+def test_write_keyframes_replace():
+    fcurve = FakeFCurve()
+    write_keyframes(fcurve, [1.0, 2.0], [1.0, 2.0])
+    counts = write_keyframes(fcurve, [5.0], [9.0], replace=True)
+    assert counts == {"added": 1, "updated": 0, "total": 1}
+    assert fcurve.keyframe_points.co.tolist() == [[5.0, 9.0]]
+
+
+def test_write_keyframes_length_mismatch():
+    with pytest.raises(ValueError):
+        write_keyframes(FakeFCurve(), [1.0, 2.0], [1.0])
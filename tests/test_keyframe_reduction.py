@@ -0,0 +1,35 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import numpy as np
+from utils.keyframe_reduction import rdp_keep
+
+
+def _max_error(frames, values, keep):
+    return np.abs(np.interp(frames, frames[keep], values[keep]) - values).max()
+
+
+def test_rdp_keep_straight_line_keeps_endpoints():
+    frames = np.arange(20, dtype=np.float64)
+    keep = rdp_keep(frames, 2.0 * frames + 1.0, 1e-6)
+    assert keep.tolist() == [True] + [False] * 18 + [True]
+
+
+def test_rdp_keep_stays_within_tolerance():
+    frames = np.arange(200, dtype=np.float64)
+    values = np.sin(frames / 15.0)
+    for tolerance in (0.1, 0.01, 0.001):
+        keep = rdp_keep(frames, values, tolerance)
+        assert _max_error(frames, values, keep) <= tolerance
+        assert keep[0] and keep[-1]
+    assert rdp_keep(frames, values, 0.1).sum() < rdp_keep(frames, values, 0.001).sum()
+
+
+def test_rdp_keep_keeps_corner():
+    frames = np.arange(11, dtype=np.float64)
+    values = np.minimum(frames, 5.0)
+    assert np.flatnonzero(rdp_keep(frames, values, 1e-6)).tolist() == [0, 5, 10]
+
+
+def test_rdp_keep_short_series():
+    assert rdp_keep(np.array([]), np.array([]), 0.1).tolist() == []
+    assert rdp_keep(np.array([1.0]), np.array([3.0]), 0.1).tolist() == [True]
@@ -0,0 +1,28 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import numpy as np
+import pytest
+from utils.motion_generators import object_seeds, object_times
+
+
+def test_object_seeds():
+    assert object_seeds(7, 3).tolist() == [7, 8, 9]
+    assert object_seeds([5, 1], 2).tolist() == [5, 1]
+    with pytest.raises(ValueError):
+        object_seeds([1, 2, 3], 2)
+
+
+def test_negative_seeds_are_rejected():
+    with pytest.raises(ValueError):
+        object_seeds(-1, 3)
+    with pytest.raises(ValueError):
+        object_seeds([3, -2], 2)
+
+
+def test_random_offsets_are_seeded():
+    frames = np.arange(10, dtype=np.float64)
+    first = object_times(frames, object_seeds(4, 5), offset_random=3.0)
+    again = object_times(frames, object_seeds(4, 5), offset_random=3.0)
+    assert np.array_equal(first, again)
+    assert (np.abs(first[:, 0]) <= 3.0).all()
+    assert np.allclose(np.diff(first, axis=1), 1.0)
@@ -0,0 +1,40 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import pytest
+from core.protocol import (
+    PROTOCOL_FRAMED, PROTOCOL_LEGACY, PROTOCOL_MULTIPLEXED, MessageDecoder, ProtocolError, choose_protocol,
+    encode_message
+)
+
+
+def test_framed_messages_split_across_reads():
+    data = encode_message({"type": "a"}, PROTOCOL_FRAMED) + encode_message({"type": "b"}, PROTOCOL_FRAMED)
+    decoder = MessageDecoder(PROTOCOL_FRAMED)
+    messages = []
+    for i in range(len(data)):
+        messages.extend(decoder.feed(data[i:i + 1]))
+    assert messages == [{"type": "a"}, {"type": "b"}]
+    assert decoder.buffered == 0
+
+
+def test_framed_rejects_oversized_and_invalid_frames():
+    with pytest.raises(ProtocolError):
+        MessageDecoder(PROTOCOL_FRAMED, max_message_size=10).feed(encode_message({"data": "x" * 20}, PROTOCOL_FRAMED))
+    with pytest.raises(ProtocolError):
+        MessageDecoder(PROTOCOL_FRAMED).feed(b"\x00\x00\x00\x03{x}")
+    with pytest.raises(ProtocolError):
+        MessageDecoder(PROTOCOL_FRAMED).feed(b"\x00\x00\x00\x02\xff\xfe")
+
+
+def test_legacy_waits_for_complete_object():
+    decoder = MessageDecoder(PROTOCOL_LEGACY)
+    assert decoder.feed(b'{"type": "get_scene_info", "params": {}') == []
+    assert decoder.feed(b"}") == [{"type": "get_scene_info", "params": {}}]
+    with pytest.raises(ProtocolError):
+        MessageDecoder(PROTOCOL_LEGACY, max_message_size=4).feed(b'{"type": 1')
+
+
+def test_choose_protocol():
+    assert choose_protocol([1, 2, 3]) == PROTOCOL_MULTIPLEXED
+    assert choose_protocol(2) == PROTOCOL_FRAMED
+    assert choose_protocol([99]) == PROTOCOL_LEGACY
@@ -0,0 +1,145 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+
+import numpy as np
+import pytest
+from utils.vertex_weights import WeightEngine, add_weights, read_weight_matrix
+
+
+class FakeElement:
+    def __init__(self, group, weight):
+        self.group = group
+        self.weight = weight
+
+
+class FakeVertex:
+    def __init__(self):
+        self.groups = []
+
+
+class FakeVertexGroup:
+    def __init__(self, name, index, vertices):
+        self.name = name
+        self.index = index
+        self.lock_weight = False
+        self.vertices = vertices
+        self.calls = 0
+
+    def _element(self, vertex):
+        return next((e for e in self.vertices[vertex].groups if e.group == self.index), None)
+
+    def add(self, indices, weight, mode):
+        self.calls += 1
+        for vertex in indices:
+            element = self._element(vertex)
+            if element is None:
+                element = FakeElement(self.index, 0.0)
+                self.vertices[vertex].groups.append(element)
+            if mode == "REPLACE":
+                element.weight = weight
+            elif mode == "ADD":
+                element.weight = min(1.0, element.weight + weight)
+            else:
+                element.weight = max(0.0, element.weight - weight)
+
+    def remove(self, indices):
+        for vertex in indices:
+            self.vertices[vertex].groups = [e for e in self.vertices[vertex].groups if e.group != self.index]
+
+    def weight(self, vertex):
+        return self._element(vertex).weight
+
+
+class FakeVertexGroups(list):
+    def __contains__(self, name):
+        return any(vg.name == name for vg in self)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return next(vg for vg in self if vg.name == key)
+        return list.__getitem__(self, key)
+
+
+class FakeMeshObject:
+    def __init__(self, vertex_count, group_names):
+        vertices = [FakeVertex() for _ in range(vertex_count)]
+        self.data = type("Mesh", (), {"vertices": vertices})()
+        self.vertex_groups = FakeVertexGroups(
+            FakeVertexGroup(name, index, vertices) for index, name in enumerate(group_names)
+        )
+
+    def weights(self):
+        """(V, G) dense weights"""
+        result = np.zeros((len(self.data.vertices), len(self.vertex_groups)))
+        for row, vertex in enumerate(self.data.vertices):
+            for element in vertex.groups:
+                result[row, element.group] = element.weight
+        return result
+
+
+def test_add_weights_one_call_per_distinct_weight():
+    mesh = FakeMeshObject(1000, ["A"])
+    vg = mesh.vertex_groups[0]
+    weights = np.tile(np.array([0.25, 0.5, 1.0], dtype=np.float32), 334)[:1000]
+    counts = add_weights(vg, np.arange(1000), weights)
+    assert counts == {"vertices": 1000, "calls": 3}
+    assert vg.calls == 3
+    assert np.allclose(mesh.weights()[:, 0], weights)
+
+
+def test_add_weights_duplicates_and_quantize():
+    mesh = FakeMeshObject(3, ["A"])
+    vg = mesh.vertex_groups[0]
+    add_weights(vg, [0, 1, 0], [0.2, 0.4, 0.9])
+    assert vg.weight(0) == pytest.approx(0.9)
+    add_weights(vg, [2, 2], [0.3, 0.3], mode="ADD")
+    assert vg.weight(2) == pytest.approx(0.6)
+    counts = add_weights(vg, [0, 1, 2], [0.1234, 0.1236, 0.5], quantize=100)
+    assert counts["calls"] == 2
+    assert vg.weight(1) == pytest.approx(0.12)
+    assert add_weights(vg, [1, 1], None, mode="REMOVE") == {"vertices": 1, "calls": 1}
+    assert read_weight_matrix(mesh.data, 1).nnz == 2
+    with pytest.raises(ValueError):
+        add_weights(vg, [0], [1.0], mode="MULTIPLY")
+
+
+def _engine_mesh(rows, locked=()):
+    mesh = FakeMeshObject(len(rows), ["A", "B", "C", "D", "E"])
+    for vertex, row in enumerate(rows):
+        for group, weight in enumerate(row):
+            if weight:
+                mesh.vertex_groups[group].add([vertex], weight, "REPLACE")
+    for group in locked:
+        mesh.vertex_groups[group].lock_weight = True
+    return mesh
+
+
+def test_weight_engine_limit_drops_smallest_unlocked():
+    mesh = _engine_mesh([[0.5, 0.1, 0.3, 0.2, 0.05], [0.4, 0.6, 0, 0, 0]], locked=[1])
+    engine = WeightEngine(mesh)
+    assert engine.limit(3) == 2
+    engine.write()
+    weights = mesh.weights()
+    # The locked group keeps its slot even though its weight is small
+    assert weights[0].tolist() == pytest.approx([0.5, 0.1, 0.3, 0, 0])
+    assert weights[1].tolist() == pytest.approx([0.4, 0.6, 0, 0, 0])
+
+
+def test_weight_engine_normalize_respects_locked_weights():
+    mesh = _engine_mesh([[0.2, 0.2, 0, 0, 0], [0.5, 0, 0, 0, 0.5], [0, 0.9, 0.5, 0, 0]], locked=[1])
+    engine = WeightEngine(mesh)
+    assert engine.normalize() == 2
+    engine.write()
+    weights = mesh.weights()
+    assert weights[0].tolist() == pytest.approx([0.8, 0.2, 0, 0, 0])
+    assert weights[1].tolist() == pytest.approx([0.5, 0, 0, 0, 0.5])
+    assert weights[2].tolist() == pytest.approx([0, 0.9, 0.1, 0, 0])
+
+
+def test_weight_engine_group_scope():
+    mesh = _engine_mesh([[0.2, 0.2, 0.4, 0, 0]])
+    engine = WeightEngine(mesh, group_names=["A", "B"])
+    engine.normalize()
+    engine.write()
+    assert mesh.weights()[0].tolist() == pytest.approx([0.5, 0.5, 0.4, 0, 0])
+    with pytest.raises(ValueError):
+        WeightEngine(mesh, group_names=["Missing"])
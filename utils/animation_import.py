@@ -0,0 +1,455 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Streaming import of motion data (CSV, NPY, BVH) into F-curves, one window of frames at a time
+
+import os
+import numpy as np
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Union
+from utils.bake_engine import axis_rotation_matrices, decompose
+from utils.fcurve_arrays import find_or_create_fcurve, get_fcurves, write_keyframes
+
+FORMATS = ("CSV", "NPY", "BVH")
+DEFAULT_CHUNK_FRAMES = 5000  # Rows parsed per slice
+
+Column = Union[str, int]
+
+
+def detect_format(filepath: str, file_format: Optional[str] = None) -> str:
+    """Explicit format, or the one matching the file extension"""
+    name = (file_format or os.path.splitext(filepath)[1].lstrip(".")).upper()
+    if name not in FORMATS:
+        raise ValueError(f"Unsupported animation data format '{name}'. Use one of {list(FORMATS)}")
+    return name
+
+
+def _count_lines(path: str) -> int:
+    """Count lines in 1 MB blocks without keeping the file in memory"""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+class _TextRows:
+    """Numeric rows of a delimited text file, parsed one chunk at a time"""
+
+    def __init__(self, f, delimiter: Optional[str]):
+        self._file = f
+        self.delimiter = delimiter
+        self.width: Optional[int] = None
+        self.exhausted = False
+
+    def read(self, count: int) -> np.ndarray:
+        raw = list(islice(self._file, count))
+        self.exhausted = len(raw) < count
+        lines = [line for line in raw if line.strip()]
+        if not lines:
+            return np.empty((0, self.width or 0))
+        data = np.loadtxt(lines, delimiter=self.delimiter, dtype=np.float64, ndmin=2)
+        if self.width is not None and data.shape[1] != self.width:
+            raise ValueError(f"Expected {self.width} values per row, found {data.shape[1]}")
+        return data
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvSource:
+    """CSV with an optional header row naming the columns"""
+
+    def __init__(self, filepath: str, delimiter: str = ",", has_header: bool = True):
+        self.rows_total = _count_lines(filepath) - (1 if has_header else 0)
+        f = open(filepath, "r", newline="")
+        header = f.readline() if has_header else None
+        self._rows = _TextRows(f, delimiter)
+        if header is not None:
+            self.columns = [name.strip() for name in header.rstrip("\r\n").split(delimiter)]
+        else:
+            first = f.tell()
+            width = len(f.readline().split(delimiter))
+            f.seek(first)
+            self.columns = [str(i) for i in range(width)]
+        self._rows.width = len(self.columns)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._rows.exhausted
+
+    def read(self, count: int) -> np.ndarray:
+        return self._rows.read(count)
+
+    def close(self) -> None:
+        self._rows.close()
+
+
+class NpySource:
+    """A (frames, columns) .npy array, memory-mapped so only the current window is paged in"""
+
+    def __init__(self, filepath: str):
+        data = np.load(filepath, mmap_mode="r", allow_pickle=False)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        if data.ndim != 2:
+            raise ValueError(f"Expected a 1D or 2D array, got shape {data.shape}")
+        self._data = data
+        self._offset = 0
+        self.rows_total = data.shape[0]
+        self.columns = [str(i) for i in range(data.shape[1])]
+
+    @property
+    def exhausted(self) -> bool:
+        return self._offset >= self.rows_total
+
+    def read(self, count: int) -> np.ndarray:
+        chunk = np.asarray(self._data[self._offset:self._offset + count], dtype=np.float64)
+        self._offset += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self._data = None
+
+
+class BvhJoint:
+    """A ROOT or JOINT of a BVH hierarchy and the columns of its channels"""
+
+    __slots__ = ("name", "parent", "offset", "channels", "first_column")
+
+    def __init__(self, name: str, parent: Optional["BvhJoint"]):
+        self.name = name
+        self.parent = parent
+        self.offset = np.zeros(3)
+        self.channels: List[str] = []
+        self.first_column = 0
+
+
+class BvhSource:
+    """BVH hierarchy plus its MOTION section, parsed one window of frames at a time"""
+
+    def __init__(self, filepath: str):
+        f = open(filepath, "r")
+        self.joints: List[BvhJoint] = []
+        self.frame_time = None
+        stack: List[BvhJoint] = []
+        column = 0
+        rows_total = None
+        try:
+            for line in f:
+                tokens = line.split()
+                if not tokens:
+                    continue
+                keyword = tokens[0].upper()
+                if keyword in ("ROOT", "JOINT"):
+                    joint = BvhJoint(" ".join(tokens[1:]), stack[-1] if stack else None)
+                    self.joints.append(joint)
+                    stack.append(joint)
+                elif keyword == "END":
+                    stack.append(None)  # End Site: offset only
+                elif keyword == "}":
+                    stack.pop()
+                elif keyword == "OFFSET" and stack and stack[-1] is not None:
+                    stack[-1].offset = np.array([float(v) for v in tokens[1:4]])
+                elif keyword == "CHANNELS" and stack and stack[-1] is not None:
+                    stack[-1].channels = [name.upper() for name in tokens[2:2 + int(tokens[1])]]
+                    stack[-1].first_column = column
+                    column += len(stack[-1].channels)
+                elif keyword == "FRAMES:":
+                    rows_total = int(tokens[1])
+                elif keyword == "FRAME" and len(tokens) > 2 and tokens[1].upper() == "TIME:":
+                    self.frame_time = float(tokens[2])
+                    break
+        except (ValueError, IndexError) as e:
+            f.close()
+            raise ValueError(f"Invalid BVH header: {str(e)}")
+        if not self.joints or rows_total is None or self.frame_time is None:
+            f.close()
+            raise ValueError("Invalid BVH file: missing HIERARCHY or MOTION section")
+
+        self.rows_total = rows_total
+        self.columns = [f"{joint.name}.{channel}" for joint in self.joints for channel in joint.channels]
+        self._rows = _TextRows(f, None)
+        self._rows.width = column
+
+    @property
+    def exhausted(self) -> bool:
+        return self._rows.exhausted
+
+    def read(self, count: int) -> np.ndarray:
+        return self._rows.read(count)
+
+    def close(self) -> None:
+        self._rows.close()
+
+
+def open_source(filepath: str, file_format: str, delimiter: str = ",", has_header: bool = True):
+    if not os.path.isfile(filepath):
+        raise ValueError(f"File not found: {filepath}")
+    if file_format == "CSV":
+        return CsvSource(filepath, delimiter, has_header)
+    if file_format == "NPY":
+        return NpySource(filepath)
+    return BvhSource(filepath)
+
+
+class _KeyBuffer:
+    """Values of one F-curve collected window by window and written in one bulk write"""
+
+    __slots__ = ("fcurve", "chunks")
+
+    def __init__(self, fcurve):
+        self.fcurve = fcurve
+        self.chunks: List[np.ndarray] = []
+
+    def append(self, values: np.ndarray) -> None:
+        # A copy, so the window the values came from can be freed
+        self.chunks.append(np.array(values, dtype=np.float32))
+
+    def write(self, frames: np.ndarray) -> int:
+        """Write the collected values at frames; returns the number of keys written"""
+        if not self.chunks:
+            return 0
+        written = write_keyframes(self.fcurve, frames, np.concatenate(self.chunks))
+        self.chunks = []
+        return written["added"] + written["updated"]
+
+
+class _Channel:
+    """One column written to one F-curve"""
+
+    __slots__ = ("column", "buffer", "keys")
+
+    def __init__(self, column: int, fcurve):
+        self.column = column
+        self.buffer = _KeyBuffer(fcurve)
+        self.keys = 0
+
+
+class _BvhBone:
+    """A BVH joint mapped to a pose bone, with the rest data needed to convert its channels"""
+
+    __slots__ = ("joint", "bone_name", "rotation_mode", "rest", "rest_inv", "head", "scale", "fcurves",
+                 "previous", "keys")
+
+    def __init__(self, joint: BvhJoint, pose_bone, scale: float):
+        self.joint = joint
+        self.scale = scale
+        self.bone_name = pose_bone.name
+        self.rotation_mode = pose_bone.rotation_mode
+        rest = np.array(pose_bone.bone.matrix_local, dtype=np.float64)[:3, :3]
+        self.rest = rest
+        self.rest_inv = np.linalg.inv(rest)
+        self.head = np.array(pose_bone.bone.head_local, dtype=np.float64)
+        self.fcurves: Dict[str, List[_KeyBuffer]] = {}
+        self.previous: Optional[Dict[str, np.ndarray]] = None
+        self.keys = 0
+
+
+class AnimationImporter:
+    """
+    Reads a motion data file window by window, converts each window to key
+    values and writes every F-curve once, in bulk, after the last window.
+    Writing each window as it arrives would re-read and re-sort the growing
+    curves every time, which is quadratic in the capture length. Parsing
+    memory is bounded by the window size; the converted values are kept as
+    float32 until the write (4 bytes per key).
+
+    CSV and NPY columns are mapped explicitly to object or pose bone
+    channels. BVH joints are mapped by name (or bone_map) to the pose
+    bones of an armature built from the same hierarchy, e.g. by Blender's
+    BVH importer: rotations are converted into each bone's rest frame and
+    root positions into offsets from the bone's rest head.
+    """
+
+    def __init__(self, source, frame_start: float = 1.0, frame_step: float = 1.0,
+                 frame_column: Optional[Column] = None, replace: bool = False):
+        self.source = source
+        self.frame_start = frame_start
+        self.frame_step = frame_step
+        self.frame_column = self._column_index(frame_column) if frame_column is not None else None
+        self.replace = replace
+        self.rows_read = 0
+        self.done = False
+        self.first_frame: Optional[float] = None
+        self.last_frame: Optional[float] = None
+        self.channels: List[_Channel] = []
+        self.bvh_bones: List[_BvhBone] = []
+        self.skipped: List[str] = []
+        self._frames: List[np.ndarray] = []
+        self._actions = set()
+
+    def _column_index(self, column: Column) -> int:
+        if isinstance(column, int) and not isinstance(column, bool):
+            if not 0 <= column < len(self.source.columns):
+                raise ValueError(f"Column {column} out of range (file has {len(self.source.columns)} columns)")
+            return column
+        if column in self.source.columns:
+            return self.source.columns.index(column)
+        raise ValueError(f"Column '{column}' not found. Available: {', '.join(self.source.columns[:20])}"
+                         + (" ..." if len(self.source.columns) > 20 else ""))
+
+    def _fcurves(self, id_data):
+        action, fcurves = get_fcurves(id_data, create=True)
+        self._actions.add(action)
+        return fcurves
+
+    def map_columns(self, objects, mapping: Sequence[Dict[str, Any]]) -> None:
+        """Map columns to channels: [{column, object, bone?, data_path, index?}]"""
+        for entry in mapping:
+            obj = objects.get(entry.get("object", ""))
+            if obj is None:
+                raise ValueError(f"Object '{entry.get('object')}' not found")
+            if not entry.get("data_path"):
+                raise ValueError(f"Mapping for column '{entry.get('column')}' needs a data_path")
+            column = self._column_index(entry.get("column"))
+            data_path = entry["data_path"]
+            group = entry.get("group")
+            bone = entry.get("bone")
+            if bone:
+                if obj.type != 'ARMATURE' or obj.pose.bones.get(bone) is None:
+                    raise ValueError(f"Bone '{bone}' not found in '{obj.name}'")
+                data_path = f'pose.bones["{bone}"].{data_path}'
+                group = group or bone
+            fcurve = find_or_create_fcurve(self._fcurves(obj), data_path, entry.get("index", 0), group)
+            self.channels.append(_Channel(column, fcurve))
+
+    def map_bvh(self, armature, bone_map: Optional[Dict[str, str]] = None, scale: float = 1.0) -> None:
+        """
+        Map BVH joints to pose bones with the same name (or the name given in
+        bone_map). scale converts BVH positions to Blender units, as the
+        importer's scale option did when the armature was built.
+        """
+        fcurves = self._fcurves(armature)
+        for joint in self.source.joints:
+            pose_bone = armature.pose.bones.get((bone_map or {}).get(joint.name, joint.name))
+            if pose_bone is None:
+                self.skipped.append(joint.name)
+                continue
+            bone = _BvhBone(joint, pose_bone, scale)
+            prefix = f'pose.bones["{bone.bone_name}"].'
+            names = ["rotation_quaternion" if bone.rotation_mode == "QUATERNION" else
+                     "rotation_axis_angle" if bone.rotation_mode == "AXIS_ANGLE" else "rotation_euler"]
+            if joint.parent is None and any(c.endswith("POSITION") for c in joint.channels):
+                names.append("location")
+            for name in names:
+                size = 4 if name in ("rotation_quaternion", "rotation_axis_angle") else 3
+                bone.fcurves[name] = [
+                    _KeyBuffer(find_or_create_fcurve(fcurves, prefix + name, i, bone.bone_name))
+                    for i in range(size)
+                ]
+            self.bvh_bones.append(bone)
+
+    def step(self, max_frames: int = DEFAULT_CHUNK_FRAMES) -> int:
+        """
+        Read and convert the next window of frames; returns the number of
+        frames read. The keys are written when the last window has been read.
+        """
+        if self.done:
+            return 0
+        data = self.source.read(max_frames)
+        if len(data):
+            self._convert(data)
+        if self.source.exhausted:
+            self.done = True
+            self.source.close()
+            self._write()
+        return len(data)
+
+    def _convert(self, data: np.ndarray) -> None:
+        if self.frame_column is not None:
+            frames = data[:, self.frame_column]
+        else:
+            frames = self.frame_start + (self.rows_read + np.arange(len(data))) * self.frame_step
+        self.rows_read += len(data)
+        if self.first_frame is None:
+            self.first_frame = float(frames[0])
+        self.last_frame = float(frames[-1])
+        self._frames.append(np.array(frames, dtype=np.float64))
+
+        for channel in self.channels:
+            channel.buffer.append(data[:, channel.column])
+        for bone in self.bvh_bones:
+            self._convert_bvh_bone(bone, data)
+
+    def _write(self) -> None:
+        """
+        One bulk write per F-curve of everything read. With replace, the
+        curves are cleared only now, so a cancelled import leaves them as
+        they were.
+        """
+        if not self._frames:
+            return
+        frames = np.concatenate(self._frames)
+        self._frames = []
+        if self.replace:
+            buffers = [channel.buffer for channel in self.channels]
+            buffers += [buffer for bone in self.bvh_bones for group in bone.fcurves.values() for buffer in group]
+            for fcurve in {id(buffer.fcurve): buffer.fcurve for buffer in buffers}.values():
+                fcurve.keyframe_points.clear()
+        for channel in self.channels:
+            channel.keys += channel.buffer.write(frames)
+        for bone in self.bvh_bones:
+            for buffers in bone.fcurves.values():
+                bone.keys += sum(buffer.write(frames) for buffer in buffers)
+
+    def _convert_bvh_bone(self, bone: _BvhBone, data: np.ndarray) -> None:
+        joint = bone.joint
+        rotation = np.broadcast_to(np.eye(3), (len(data), 3, 3))
+        location = np.zeros((len(data), 3))
+        for i, channel in enumerate(joint.channels):
+            values = data[:, joint.first_column + i]
+            axis = channel[0]
+            if channel.endswith("ROTATION"):
+                # Channels are listed in the order the rotations apply from the parent down
+                rotation = rotation @ axis_rotation_matrices(axis, np.radians(values))
+            elif channel.endswith("POSITION"):
+                location[:, "XYZ".index(axis)] = values
+
+        matrices = np.zeros((len(data), 4, 4))
+        matrices[:, 3, 3] = 1.0
+        matrices[:, :3, :3] = bone.rest_inv @ rotation @ bone.rest
+        matrices[:, :3, 3] = (location * bone.scale - bone.head) @ bone.rest_inv.T
+
+        channels = decompose(matrices, bone.rotation_mode)
+        if bone.previous is not None:
+            self._continue_from(bone.previous, channels)
+        bone.previous = {name: values[-1].copy() for name, values in channels.items()}
+
+        for name, buffers in bone.fcurves.items():
+            values = channels[name]
+            for index, buffer in enumerate(buffers):
+                buffer.append(values[:, index])
+
+    @staticmethod
+    def _continue_from(previous: Dict[str, np.ndarray], channels: Dict[str, np.ndarray]) -> None:
+        """Keep rotations continuous across window boundaries (quaternion sign, Euler turns)"""
+        if "rotation_quaternion" in channels:
+            quats = channels["rotation_quaternion"]
+            if np.dot(quats[0], previous["rotation_quaternion"]) < 0:
+                quats *= -1.0
+        if "rotation_euler" in channels:
+            eulers = channels["rotation_euler"]
+            turns = np.round((previous["rotation_euler"] - eulers[0]) / (2 * np.pi))
+            eulers += turns * 2 * np.pi
+
+    def finish(self) -> Dict[str, Any]:
+        for action in self._actions:
+            action.update_tag()
+        keys = sum(c.keys for c in self.channels) + sum(b.keys for b in self.bvh_bones)
+        result = {
+            "frames_imported": self.rows_read,
+            "frame_range": [self.first_frame, self.last_frame] if self.first_frame is not None else None,
+            "channels": len(self.channels) + sum(len(f) for b in self.bvh_bones for f in b.fcurves.values()),
+            "keys_written": keys
+        }
+        if self.bvh_bones:
+            result["bones"] = [b.bone_name for b in self.bvh_bones]
+        if self.skipped:
+            result["skipped_joints"] = self.skipped
+        return result
+
+    def close(self) -> None:
+        if not self.done:
+            self.done = True
+            self.source.close()
@@ -0,0 +1,379 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Operator-free baking: step the depsgraph per frame, capture matrices into arrays, write keys in bulk
+
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+from utils.fcurve_arrays import (
+    find_or_create_fcurve, get_fcurves, interpolation_names, read_interpolation, read_keyframes, write_keyframes
+)
+from utils.keyframe_reduction import reduce_fcurve
+
+BAKE_TYPES = ("LOCATION", "ROTATION", "SCALE")
+
+
+def _column_major(flat: np.ndarray, count: int) -> np.ndarray:
+    """foreach_get returns 4x4 matrices column by column; return (count, 4, 4) row-major"""
+    return flat.reshape(count, 4, 4).swapaxes(1, 2)
+
+
+def matrices_to_quaternions(rotation: np.ndarray) -> np.ndarray:
+    """(..., 3, 3) rotation matrices -> (..., 4) unit quaternions (w, x, y, z)"""
+    r = rotation
+    m00, m11, m22 = r[..., 0, 0], r[..., 1, 1], r[..., 2, 2]
+    trace = m00 + m11 + m22
+    candidates = []
+    for s, w, x, y, z in (
+        (np.sqrt(np.maximum(trace + 1.0, 1e-12)) * 2, None, r[..., 2, 1] - r[..., 1, 2], r[..., 0, 2] - r[..., 2, 0], r[..., 1, 0] - r[..., 0, 1]),
+        (np.sqrt(np.maximum(1.0 + m00 - m11 - m22, 1e-12)) * 2, r[..., 2, 1] - r[..., 1, 2], None, r[..., 0, 1] + r[..., 1, 0], r[..., 0, 2] + r[..., 2, 0]),
+        (np.sqrt(np.maximum(1.0 + m11 - m00 - m22, 1e-12)) * 2, r[..., 0, 2] - r[..., 2, 0], r[..., 0, 1] + r[..., 1, 0], None, r[..., 1, 2] + r[..., 2, 1]),
+        (np.sqrt(np.maximum(1.0 + m22 - m00 - m11, 1e-12)) * 2, r[..., 1, 0] - r[..., 0, 1], r[..., 0, 2] + r[..., 2, 0], r[..., 1, 2] + r[..., 2, 1], None),
+    ):
+        # The component marked None is the dominant one: s / 4
+        parts = [0.25 * s if c is None else c / s for c in (w, x, y, z)]
+        candidates.append(np.stack(parts, axis=-1))
+    conditions = [
+        trace > 0,
+        (m00 > m11) & (m00 > m22),
+        m11 > m22,
+        np.ones_like(trace, dtype=bool)
+    ]
+    quats = np.select([c[..., None] for c in conditions], candidates)
+    return quats / np.linalg.norm(quats, axis=-1, keepdims=True)
+
+
+def make_quaternions_continuous(quats: np.ndarray) -> np.ndarray:
+    """Flip signs along the frame axis (0) so consecutive quaternions never jump to the far side"""
+    if len(quats) < 2:
+        return quats
+    signs = np.where(np.sum(quats[1:] * quats[:-1], axis=-1) < 0, -1.0, 1.0)
+    cumulative = np.concatenate([np.ones((1,) + signs.shape[1:]), np.cumprod(signs, axis=0)])
+    return quats * cumulative[..., None]
+
+
+def matrices_to_euler_xyz(rotation: np.ndarray) -> np.ndarray:
+    """(F, ..., 3, 3) -> (F, ..., 3) XYZ Euler angles, unwrapped along frames"""
+    r = rotation
+    cy = np.sqrt(r[..., 0, 0] ** 2 + r[..., 1, 0] ** 2)
+    gimbal = cy < 1e-6
+    x = np.where(gimbal, np.arctan2(-r[..., 1, 2], r[..., 1, 1]), np.arctan2(r[..., 2, 1], r[..., 2, 2]))
+    y = np.arctan2(-r[..., 2, 0], cy)
+    z = np.where(gimbal, 0.0, np.arctan2(r[..., 1, 0], r[..., 0, 0]))
+    return np.unwrap(np.stack([x, y, z], axis=-1), axis=0)
+
+
+def axis_rotation_matrices(axis: str, angles: np.ndarray) -> np.ndarray:
+    """(F,) angles in radians about X, Y or Z -> (F, 3, 3)"""
+    c, s = np.cos(angles), np.sin(angles)
+    result = np.zeros((len(angles), 3, 3))
+    i, j = {"X": (1, 2), "Y": (2, 0), "Z": (0, 1)}[axis]
+    k = 3 - i - j
+    result[:, k, k] = 1.0
+    result[:, i, i] = c
+    result[:, j, j] = c
+    result[:, i, j] = -s
+    result[:, j, i] = s
+    return result
+
+
+def quaternions_to_matrices(quats: np.ndarray) -> np.ndarray:
+    """(F, 4) quaternions (w, x, y, z), normalized first -> (F, 3, 3)"""
+    norm = np.linalg.norm(quats, axis=1, keepdims=True)
+    w, x, y, z = (quats / np.where(norm == 0, 1.0, norm)).T
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=-1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=-1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=-1)
+    ], axis=1)
+
+
+def rotation_to_matrices(values: np.ndarray, rotation_mode: str) -> np.ndarray:
+    """(F, 3 or 4) rotation channel values in rotation_mode -> (F, 3, 3); inverse of the rotation part of decompose"""
+    if rotation_mode == "QUATERNION":
+        return quaternions_to_matrices(values)
+    if rotation_mode == "AXIS_ANGLE":
+        axis = values[:, 1:] / np.maximum(np.linalg.norm(values[:, 1:], axis=1, keepdims=True), 1e-12)
+        half = values[:, 0:1] / 2
+        return quaternions_to_matrices(np.column_stack([np.cos(half), axis * np.sin(half)]))
+    # An Euler order names the axes in the order they are applied: XYZ is Z @ Y @ X
+    result = axis_rotation_matrices(rotation_mode[0], values[:, "XYZ".index(rotation_mode[0])])
+    for axis in rotation_mode[1:]:
+        result = axis_rotation_matrices(axis, values[:, "XYZ".index(axis)]) @ result
+    return result
+
+
+def decompose(matrices: np.ndarray, rotation_mode: str) -> Dict[str, np.ndarray]:
+    """
+    (F, 4, 4) local matrices of one target -> channel arrays:
+    location (F, 3), scale (F, 3) and the rotation for rotation_mode.
+    """
+    location = matrices[:, :3, 3]
+    basis = matrices[:, :3, :3]
+    scale = np.linalg.norm(basis, axis=1)
+    negative = np.linalg.det(basis) < 0
+    scale[negative, 0] *= -1
+    rotation = basis / np.where(scale == 0, 1.0, scale)[:, None, :]
+
+    channels = {"location": location, "scale": scale}
+    if rotation_mode == "QUATERNION":
+        channels["rotation_quaternion"] = make_quaternions_continuous(matrices_to_quaternions(rotation))
+    elif rotation_mode == "AXIS_ANGLE":
+        quats = make_quaternions_continuous(matrices_to_quaternions(rotation))
+        angle = 2 * np.arccos(np.clip(quats[:, 0], -1.0, 1.0))
+        sin_half = np.sqrt(np.maximum(1.0 - quats[:, 0] ** 2, 0.0))
+        axis = np.where(sin_half[:, None] > 1e-8, quats[:, 1:] / np.maximum(sin_half, 1e-8)[:, None], [0.0, 1.0, 0.0])
+        channels["rotation_axis_angle"] = np.column_stack([angle, axis])
+    elif rotation_mode == "XYZ":
+        channels["rotation_euler"] = matrices_to_euler_xyz(rotation)
+    else:
+        # Other Euler orders: mathutils keeps each frame compatible with the previous one
+        import mathutils
+        eulers = np.empty((len(rotation), 3))
+        previous = None
+        for i, r in enumerate(rotation):
+            matrix = mathutils.Matrix(r.tolist())
+            euler = matrix.to_euler(rotation_mode) if previous is None else matrix.to_euler(rotation_mode, previous)
+            eulers[i] = euler
+            previous = euler
+        channels["rotation_euler"] = eulers
+    return channels
+
+
+class _BoneSet:
+    """Capture buffers and rest data for the pose bones of one armature"""
+
+    def __init__(self, armature, bone_names: Optional[Sequence[str]], frame_count: int, visual: bool = True):
+        self.armature = armature
+        self.visual = visual
+        bones = armature.pose.bones
+        self.all_names = bones.keys()
+        index = {name: i for i, name in enumerate(self.all_names)}
+        if bone_names is None:
+            bone_names = self.all_names
+        missing = [name for name in bone_names if name not in index]
+        if missing:
+            raise ValueError(f"Bones not found in '{armature.name}': {', '.join(missing)}")
+        self.names = list(bone_names)
+        self.indices = np.array([index[name] for name in self.names], dtype=np.int64)
+        self.count = len(self.all_names)
+        self.pose = np.empty((frame_count, self.count, 4, 4), dtype=np.float32)
+        self._flat = np.empty(self.count * 16, dtype=np.float32)
+
+        rest_flat = np.empty(self.count * 16, dtype=np.float32)
+        armature.data.bones.foreach_get("matrix_local", rest_flat)
+        rest_index = {name: i for i, name in enumerate(armature.data.bones.keys())}
+        rest = _column_major(rest_flat, self.count).astype(np.float64)
+        self.rest = rest[[rest_index[name] for name in self.all_names]]
+        self.parents = np.array([
+            index[bones[name].parent.name] if bones[name].parent else -1 for name in self.all_names
+        ], dtype=np.int64)
+
+        # Bones whose inheritance the closed form below does not model are converted by Blender
+        self.fallback = {
+            i for i in self.indices.tolist()
+            if visual and self.parents[i] >= 0 and (
+                not bones[i].bone.use_inherit_rotation
+                or getattr(bones[i].bone, "inherit_scale", "FULL") != "FULL"
+                or not bones[i].bone.use_local_location
+            )
+        }
+        self.fallback_basis = {i: np.empty((frame_count, 4, 4)) for i in self.fallback}
+
+    def capture(self, frame_index: int) -> None:
+        bones = self.armature.pose.bones
+        bones.foreach_get("matrix" if self.visual else "matrix_basis", self._flat)
+        self.pose[frame_index] = _column_major(self._flat, self.count)
+        for i in self.fallback:
+            pose_bone = bones[i]
+            self.fallback_basis[i][frame_index] = np.array(self.armature.convert_space(
+                pose_bone=pose_bone, matrix=pose_bone.matrix, from_space='POSE', to_space='LOCAL'
+            ))
+
+    def basis(self, frames: slice) -> np.ndarray:
+        """(F, len(names), 4, 4) bone-local matrices from captured pose-space matrices"""
+        pose = self.pose[frames].astype(np.float64)
+        if not self.visual:
+            return pose[:, self.indices]
+        result = np.empty((pose.shape[0], len(self.indices), 4, 4))
+        for column, i in enumerate(self.indices.tolist()):
+            if i in self.fallback:
+                result[:, column] = self.fallback_basis[i][frames]
+                continue
+            parent = self.parents[i]
+            rest_inv = np.linalg.inv(self.rest[i])
+            if parent < 0:
+                result[:, column] = rest_inv @ pose[:, i]
+            else:
+                result[:, column] = rest_inv @ self.rest[parent] @ np.linalg.inv(pose[:, parent]) @ pose[:, i]
+        return result
+
+
+class BakeEngine:
+    """
+    Bake object transforms and pose bones without bpy.ops.nla.bake.
+
+    Each frame is evaluated once with scene.frame_set(); world matrices of
+    objects and pose-space matrices of every bone of each armature (one
+    foreach_get per armature) are copied into preallocated arrays. After
+    capture, matrices are converted to local channels with NumPy and each
+    F-curve is written in one bulk operation, optionally followed by
+    error-bounded key reduction.
+
+    Capture can run in slices (capture(budget_s=...) or capture(max_frames=...))
+    so callers can spread a long bake over several main-thread ticks.
+    Nothing is keyed before write(), so every slice reads the original
+    animation. With visual_keying False the channels' own (unconstrained)
+    values are baked, as with the bake operator.
+    """
+
+    def __init__(self, scene, objects: List[Any], frames: np.ndarray,
+                 bone_names: Optional[Dict[str, Optional[Sequence[str]]]] = None,
+                 bake_types: Sequence[str] = BAKE_TYPES, clear_parents: bool = False,
+                 clear_constraints: bool = False, visual_keying: bool = True):
+        self.scene = scene
+        self.frames = np.asarray(frames, dtype=np.float64)
+        self.bake_types = {t.upper() for t in bake_types}
+        unknown = self.bake_types - set(BAKE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown bake types: {', '.join(sorted(unknown))}. Use {list(BAKE_TYPES)}")
+        self.clear_parents = clear_parents
+        self.clear_constraints = clear_constraints
+        self.visual_keying = visual_keying
+        self.next_index = 0
+        self.capture_seconds = 0.0
+
+        # Armatures bake their pose bones (all unless bone_names lists some); other objects their transform
+        count = len(self.frames)
+        bone_names = bone_names or {}
+        self.objects = [obj for obj in objects if obj.type != 'ARMATURE']
+        self.object_matrices = np.empty((count, len(self.objects), 4, 4), dtype=np.float64)
+        self.bone_sets = [
+            _BoneSet(obj, bone_names.get(obj.name), count, visual_keying)
+            for obj in objects if obj.type == 'ARMATURE'
+        ]
+
+    @property
+    def done(self) -> bool:
+        return self.next_index >= len(self.frames)
+
+    def capture(self, budget_s: Optional[float] = None, max_frames: Optional[int] = None) -> int:
+        """Capture frames until done, the time budget is spent or max_frames were captured; returns frames captured"""
+        original_frame = self.scene.frame_current
+        original_subframe = self.scene.frame_subframe
+        start = time.perf_counter()
+        captured = 0
+        try:
+            while not self.done:
+                frame = self.frames[self.next_index]
+                whole = int(np.floor(frame))
+                self.scene.frame_set(whole, subframe=float(frame - whole))
+                self._capture_frame(self.next_index)
+                self.next_index += 1
+                captured += 1
+                if budget_s is not None and time.perf_counter() - start >= budget_s:
+                    break
+                if max_frames is not None and captured >= max_frames:
+                    break
+        finally:
+            self.scene.frame_set(original_frame, subframe=original_subframe)
+            self.capture_seconds += time.perf_counter() - start
+        return captured
+
+    def _capture_frame(self, index: int) -> None:
+        for column, obj in enumerate(self.objects):
+            if not self.visual_keying and not self.clear_parents:
+                self.object_matrices[index, column] = np.array(obj.matrix_basis)
+            elif self.clear_parents or obj.parent is None:
+                self.object_matrices[index, column] = np.array(obj.matrix_world)
+            else:
+                # Visual transform relative to the parent, before the parent inverse
+                self.object_matrices[index, column] = (
+                    np.array(obj.matrix_parent_inverse.inverted_safe()) @ np.array(obj.matrix_local)
+                )
+        for bone_set in self.bone_sets:
+            bone_set.capture(index)
+
+    def write(self, reduce_tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """Write captured frames as keys, replacing keys inside the baked range"""
+        captured = slice(0, self.next_index)
+        frames = self.frames[captured]
+        start = time.perf_counter()
+        channels = []
+        if not len(frames):
+            return {"frames_baked": 0, "channels": channels, "keys_written": 0,
+                    "capture_ms": round(self.capture_seconds * 1000, 2), "write_ms": 0.0}
+
+        for column, obj in enumerate(self.objects):
+            matrices = self.object_matrices[captured, column]
+            channels.extend(self._write_target(obj, "", "Object Transforms", matrices, obj.rotation_mode,
+                                               frames, reduce_tolerance))
+            if self.clear_parents and obj.parent is not None:
+                world = obj.matrix_world.copy()
+                obj.parent = None
+                obj.matrix_world = world
+            if self.clear_constraints:
+                _clear_constraints(obj.constraints)
+
+        for bone_set in self.bone_sets:
+            basis = bone_set.basis(captured)
+            pose_bones = bone_set.armature.pose.bones
+            for column, name in enumerate(bone_set.names):
+                channels.extend(self._write_target(
+                    bone_set.armature, f'pose.bones["{name}"].', name, basis[:, column],
+                    pose_bones[name].rotation_mode, frames, reduce_tolerance
+                ))
+                if self.clear_constraints:
+                    _clear_constraints(pose_bones[name].constraints)
+
+        return {
+            "frames_baked": len(frames),
+            "channels": channels,
+            "keys_written": sum(c["keys"] for c in channels),
+            "capture_ms": round(self.capture_seconds * 1000, 2),
+            "write_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    def _write_target(self, id_data, prefix: str, group: str, matrices: np.ndarray, rotation_mode: str,
+                      frames: np.ndarray, reduce_tolerance: Optional[float]) -> List[Dict[str, Any]]:
+        action, fcurves = get_fcurves(id_data, create=True)
+        results = []
+        for name, values in decompose(matrices, rotation_mode).items():
+            bake_type = "ROTATION" if name.startswith("rotation") else name.upper()
+            if bake_type not in self.bake_types:
+                continue
+            for index in range(values.shape[1]):
+                fcurve = find_or_create_fcurve(fcurves, prefix + name, index, group)
+                _write_range(fcurve, frames, values[:, index])
+                result = {"data_path": prefix + name, "array_index": index, "keys": len(frames)}
+                if reduce_tolerance is not None:
+                    # Keys outside the baked range were not baked and stay as they are
+                    reduction = reduce_fcurve(fcurve, reduce_tolerance, frame_range=(frames[0], frames[-1]))
+                    outside = reduction["original_keys"] - len(frames)
+                    result.update(keys=reduction["kept_keys"] - outside, max_error=reduction["max_error"])
+                results.append(result)
+        action.update_tag()
+        return results
+
+
+def _clear_constraints(constraints) -> None:
+    """The baked keys already contain the constraint result"""
+    for constraint in list(constraints):
+        constraints.remove(constraint)
+
+
+def _write_range(fcurve, frames: np.ndarray, values: np.ndarray) -> None:
+    """Replace the keys between the first and last baked frame, keeping keys outside"""
+    if len(fcurve.keyframe_points) == 0:
+        write_keyframes(fcurve, frames, values)
+        return
+    old_frames, old_values = read_keyframes(fcurve)
+    outside = (old_frames < frames[0]) | (old_frames > frames[-1])
+    names = interpolation_names()
+    old_interpolation = [names[code] for code in read_interpolation(fcurve.keyframe_points)[outside].tolist()]
+    write_keyframes(
+        fcurve,
+        np.concatenate([old_frames[outside], frames]),
+        np.concatenate([old_values[outside], values]),
+        interpolation=old_interpolation + ["BEZIER"] * len(frames),
+        replace=True
+    )
@@ -1,67 +1,280 @@
 # Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
 
+import sys
+import threading
 import time
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Dict, Set
 from utils.logger import logger
 
+NEVER_EXPIRE = float("inf")  # TTL for entries that live until explicitly invalidated
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory used by a JSON-like payload, in bytes"""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            stack.extend(item)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "namespace", "tags")
+
+    def __init__(self, value: Any, expires_at: float, size: int, namespace: str, tags: Set[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.namespace = namespace
+        self.tags = tags
+
+
+class _Namespace:
+    """LRU order, quota and counters for one group of keys"""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.keys: "OrderedDict[str, None]" = OrderedDict()
+        self.bytes = 0
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
 class CacheManager:
-    """Simple TTL-based cache manager"""
-    
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
-        self._ttl: Dict[str, float] = {}
+    """
+    Size-bounded LRU cache with TTLs, namespaces and tag invalidation.
+
+    Keys are grouped into namespaces (the part of the key before the first
+    ':' unless given explicitly), each with optional entry and byte quotas
+    on top of the global limits. Every limit is enforced by evicting the
+    least recently used entry, which is O(1).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._tags: Dict[str, Set[str]] = {}  # tag -> keys depending on it
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self._default_ttl = 60  # Default TTL in seconds
-    
+
+    @staticmethod
+    def namespace_of(key: str) -> str:
+        """Default namespace of a key: the part before the first ':'"""
+        return key.split(":", 1)[0] if ":" in key else "default"
+
+    def set_quota(self, namespace: str, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """Limit how many entries and bytes one namespace may hold"""
+        with self._lock:
+            ns = self._get_namespace(namespace)
+            ns.max_entries = max_entries
+            ns.max_bytes = max_bytes
+            self._enforce_limits(ns)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from cache if not expired"""
-        if key in self._cache:
-            if time.time() < self._ttl.get(key, 0):
-                logger.debug(f"Cache hit: {key}")
-                return self._cache[key]
-            else:
-                # Expired, remove it
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._get_namespace(self.namespace_of(key)).misses += 1
+                return default
+
+            ns = self._namespaces[entry.namespace]
+            if time.time() >= entry.expires_at:
                 logger.debug(f"Cache expired: {key}")
-                del self._cache[key]
-                del self._ttl[key]
-        return default
-    
-    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        """Set value in cache with TTL"""
+                self._remove(key)
+                ns.expirations += 1
+                ns.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            ns.keys.move_to_end(key)
+            ns.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, tags: Optional[Iterable[str]] = None,
+            namespace: Optional[str] = None, size: Optional[int] = None) -> None:
+        """
+        Set value in cache with TTL. Tags name the data the value depends on.
+        size overrides estimate_size(), which only walks JSON-like payloads,
+        for values such as objects holding arrays.
+        """
         ttl = ttl or self._default_ttl
-        self._cache[key] = value
-        self._ttl[key] = time.time() + ttl
-        logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
-    
+        namespace = namespace or self.namespace_of(key)
+        if size is None:
+            size = estimate_size(value)
+
+        with self._lock:
+            ns = self._get_namespace(namespace)
+            if size > self.max_bytes or (ns.max_bytes is not None and size > ns.max_bytes):
+                logger.debug(f"Cache skip: {key} ({size} bytes exceeds quota)")
+                self._remove(key)
+                return
+
+            self._remove(key)
+            tag_set = set(tags or ())
+            self._entries[key] = _Entry(value, time.time() + ttl, size, namespace, tag_set)
+            ns.keys[key] = None
+            ns.bytes += size
+            self._bytes += size
+            for tag in tag_set:
+                self._tags.setdefault(tag, set()).add(key)
+
+            self._enforce_limits(ns)
+        logger.debug(f"Cache set: {key} (TTL: {ttl}s, {size} bytes)")
+
     def invalidate(self, pattern: Optional[str] = None) -> int:
         """Invalidate cache entries. If pattern provided, only invalidate matching keys."""
-        if pattern is None:
-            count = len(self._cache)
-            self._cache.clear()
-            self._ttl.clear()
-            logger.debug(f"Cache cleared: {count} entries")
-            return count
-        
-        # Pattern matching
+        with self._lock:
+            if pattern is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._tags.clear()
+                for ns in self._namespaces.values():
+                    ns.keys.clear()
+                    ns.bytes = 0
+                self._bytes = 0
+                logger.debug(f"Cache cleared: {count} entries")
+                return count
+
+            # Pattern matching
+            keys_to_remove = [k for k in self._entries if pattern in k]
+            for key in keys_to_remove:
+                self._remove(key)
+
+        logger.debug(f"Cache invalidated: {len(keys_to_remove)} entries matching '{pattern}'")
+        return len(keys_to_remove)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Invalidate entries whose key starts with prefix"""
+        with self._lock:
+            namespace = self.namespace_of(prefix)
+            ns = self._namespaces.get(namespace)
+            if ns is None:
+                return 0
+            # Keys sharing a prefix share a namespace, so only that namespace is scanned
+            keys_to_remove = [k for k in ns.keys if k.startswith(prefix)]
+            for key in keys_to_remove:
+                self._remove(key)
+        logger.debug(f"Cache invalidated: {len(keys_to_remove)} entries with prefix '{prefix}'")
+        return len(keys_to_remove)
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """Invalidate every entry in a namespace"""
+        with self._lock:
+            ns = self._namespaces.get(namespace)
+            if ns is None:
+                return 0
+            keys_to_remove = list(ns.keys)
+            for key in keys_to_remove:
+                self._remove(key)
+        return len(keys_to_remove)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate every entry that was stored with any of the given tags"""
         count = 0
-        keys_to_remove = [k for k in self._cache.keys() if pattern in k]
-        for key in keys_to_remove:
-            del self._cache[key]
-            del self._ttl[key]
-            count += 1
-        
-        logger.debug(f"Cache invalidated: {count} entries matching '{pattern}'")
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    if self._remove(key):
+                        count += 1
+        if count:
+            logger.debug(f"Cache invalidated: {count} entries by tag")
         return count
-    
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry"""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, entry in self._entries.items() if now >= entry.expires_at]
+            for key in expired:
+                namespace = self._entries[key].namespace
+                self._remove(key)
+                self._namespaces[namespace].expirations += 1
+        return len(expired)
+
     def clear(self) -> None:
         """Clear all cache entries"""
         self.invalidate()
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return {
-            "entries": len(self._cache),
-            "keys": list(self._cache.keys())
-        }
+        with self._lock:
+            namespaces = {}
+            for name, ns in self._namespaces.items():
+                lookups = ns.hits + ns.misses
+                namespaces[name] = {
+                    "entries": len(ns.keys),
+                    "bytes": ns.bytes,
+                    "max_entries": ns.max_entries,
+                    "max_bytes": ns.max_bytes,
+                    "hits": ns.hits,
+                    "misses": ns.misses,
+                    "hit_rate": round(ns.hits / lookups, 3) if lookups else 0.0,
+                    "evictions": ns.evictions,
+                    "expirations": ns.expirations
+                }
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "namespaces": namespaces
+            }
+
+    def _get_namespace(self, namespace: str) -> _Namespace:
+        ns = self._namespaces.get(namespace)
+        if ns is None:
+            ns = self._namespaces[namespace] = _Namespace()
+        return ns
+
+    def _remove(self, key: str) -> bool:
+        """Remove one entry and its bookkeeping, including its key in every tag set"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        ns = self._namespaces[entry.namespace]
+        del ns.keys[key]
+        ns.bytes -= entry.size
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def _enforce_limits(self, ns: _Namespace) -> None:
+        """Evict least recently used entries until every quota holds"""
+        while ns.keys and (
+            (ns.max_entries is not None and len(ns.keys) > ns.max_entries) or
+            (ns.max_bytes is not None and ns.bytes > ns.max_bytes)
+        ):
+            self._evict(next(iter(ns.keys)))
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        namespace = self._entries[key].namespace
+        self._remove(key)
+        self._namespaces[namespace].evictions += 1
+        logger.debug(f"Cache evicted: {key}")
 
 # Global cache instance
 cache = CacheManager()
@@ -0,0 +1,163 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Operator-free automatic skinning from distances to bone segments, smoothed over the mesh graph
+
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from utils.vertex_weights import add_weights
+
+DEFAULT_FALLOFF = 4.0
+DEFAULT_SMOOTH_ITERATIONS = 4
+DEFAULT_SMOOTH_FACTOR = 0.5
+DEFAULT_MAX_INFLUENCES = 4
+DEFAULT_QUANTIZE = 1000
+MIN_WEIGHT = 1e-3  # Smaller influences are dropped before normalizing
+_CHUNK_VERTICES = 8192
+_CHUNK_BONES = 16
+
+
+def bone_segments(armature_obj, deform_only: bool = True) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Bone names and (B, 3) world-space heads and tails"""
+    bones = [bone for bone in armature_obj.data.bones if bone.use_deform or not deform_only]
+    world = np.array(armature_obj.matrix_world, dtype=np.float64)
+    heads = np.array([tuple(bone.head_local) for bone in bones], dtype=np.float64).reshape(-1, 3)
+    tails = np.array([tuple(bone.tail_local) for bone in bones], dtype=np.float64).reshape(-1, 3)
+    return ([bone.name for bone in bones],
+            heads @ world[:3, :3].T + world[:3, 3],
+            tails @ world[:3, :3].T + world[:3, 3])
+
+
+def segment_distances(points: np.ndarray, heads: np.ndarray, tails: np.ndarray) -> np.ndarray:
+    """(V, B) distance from every point to every bone segment, in vertex chunks to bound memory"""
+    axis = tails - heads
+    length2 = np.maximum(np.einsum("ij,ij->i", axis, axis), 1e-12)
+    result = np.empty((len(points), len(heads)), dtype=np.float32)
+    for start in range(0, len(points), _CHUNK_VERTICES):
+        chunk = points[start:start + _CHUNK_VERTICES, None, :] - heads
+        t = np.clip(np.einsum("vbi,bi->vb", chunk, axis) / length2, 0.0, 1.0)
+        result[start:start + len(chunk)] = np.linalg.norm(chunk - t[..., None] * axis, axis=2)
+    return result
+
+
+def vertex_neighbours(mesh) -> Tuple[np.ndarray, np.ndarray]:
+    """Mesh adjacency in CSR form: neighbours of vertex v are neighbours[indptr[v]:indptr[v + 1]]"""
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+    source = np.concatenate([edges[:, 0], edges[:, 1]])
+    target = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.argsort(source, kind="stable")
+    indptr = np.zeros(len(mesh.vertices) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source, minlength=len(mesh.vertices)), out=indptr[1:])
+    return indptr, target[order]
+
+
+def smooth(weights: np.ndarray, indptr: np.ndarray, neighbours: np.ndarray,
+           iterations: int, factor: float) -> np.ndarray:
+    """
+    Laplacian smoothing: each iteration moves every vertex's weights factor
+    of the way towards the mean of its neighbours. Works on any mesh
+    topology, including non-manifold and disconnected parts.
+    """
+    counts = np.diff(indptr)
+    connected = counts > 0
+    starts = indptr[:-1][connected]
+    divisor = counts[connected, None].astype(np.float32)
+    for _ in range(iterations):
+        smoothed = weights.copy()
+        for column in range(0, weights.shape[1], _CHUNK_BONES):
+            block = weights[:, column:column + _CHUNK_BONES]
+            sums = np.add.reduceat(block[neighbours], starts, axis=0) if len(starts) else block[:0]
+            smoothed[connected, column:column + _CHUNK_BONES] = (
+                (1.0 - factor) * block[connected] + factor * sums / divisor
+            )
+        weights = smoothed
+    return weights
+
+
+def limit_and_normalize(weights: np.ndarray, max_influences: int) -> np.ndarray:
+    """Keep the max_influences largest weights per vertex, drop tiny ones and make each row sum to 1"""
+    if weights.shape[1] > max_influences:
+        smallest = np.argpartition(weights, weights.shape[1] - max_influences, axis=1)
+        np.put_along_axis(weights, smallest[:, :weights.shape[1] - max_influences], 0.0, axis=1)
+    totals = weights.sum(axis=1, keepdims=True)
+    weights /= np.maximum(totals, 1e-12)
+    weights[weights < MIN_WEIGHT] = 0.0
+    totals = weights.sum(axis=1, keepdims=True)
+    return weights / np.maximum(totals, 1e-12)
+
+
+def check_parameters(falloff: float = DEFAULT_FALLOFF, smooth_iterations: int = DEFAULT_SMOOTH_ITERATIONS,
+                     smooth_factor: float = DEFAULT_SMOOTH_FACTOR, max_influences: int = DEFAULT_MAX_INFLUENCES):
+    """Raise ValueError for settings distance_skin cannot use"""
+    if falloff <= 0:
+        raise ValueError("falloff must be positive")
+    if smooth_iterations < 0:
+        raise ValueError("smooth_iterations must not be negative")
+    if not 0.0 <= smooth_factor <= 1.0:
+        raise ValueError("smooth_factor must be in [0, 1]")
+    if max_influences < 1:
+        raise ValueError("max_influences must be at least 1")
+
+
+def distance_skin(mesh_obj, armature_obj, falloff: float = DEFAULT_FALLOFF,
+                  smooth_iterations: int = DEFAULT_SMOOTH_ITERATIONS, smooth_factor: float = DEFAULT_SMOOTH_FACTOR,
+                  max_influences: int = DEFAULT_MAX_INFLUENCES,
+                  quantize: Optional[int] = DEFAULT_QUANTIZE) -> Dict[str, Any]:
+    """
+    Weight a mesh to the deform bones of an armature without operators.
+
+    Each vertex starts with (nearest distance / distance to bone) ** falloff
+    per bone, so the closest bone gets 1 and farther bones fade quickly.
+    The weights are then smoothed over the mesh edges, limited to
+    max_influences per vertex and normalized. One vertex group per bone
+    is replaced. quantize rounds weights to 1/quantize so the write needs
+    about that many add() calls per group (None writes exact weights).
+    """
+    # Imported here: the spatial index module needs mathutils, the array helpers above do not
+    from utils.weight_transfer import world_coordinates
+
+    check_parameters(falloff, smooth_iterations, smooth_factor, max_influences)
+    timings = {}
+    start = time.perf_counter()
+    names, heads, tails = bone_segments(armature_obj)
+    if not names:
+        raise ValueError(f"Armature '{armature_obj.name}' has no deform bones")
+    points = world_coordinates(mesh_obj)
+
+    distances = segment_distances(points, heads, tails)
+    nearest = distances.min(axis=1, keepdims=True)
+    weights = (np.maximum(nearest, 1e-6) / np.maximum(distances, 1e-6)) ** falloff
+    weights[weights < MIN_WEIGHT] = 0.0
+    timings["distance_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    if smooth_iterations > 0 and len(mesh_obj.data.edges):
+        indptr, neighbours = vertex_neighbours(mesh_obj.data)
+        weights = smooth(weights, indptr, neighbours, smooth_iterations, smooth_factor)
+    weights = limit_and_normalize(weights, max_influences)
+    timings["smooth_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    vertex_groups = mesh_obj.vertex_groups
+    all_vertices = list(range(len(points)))
+    weights_written = 0
+    for column, name in enumerate(names):
+        members = np.flatnonzero(weights[:, column])
+        vg = vertex_groups.get(name)
+        if vg is None:
+            vg = vertex_groups.new(name=name)
+        else:
+            vg.remove(all_vertices)
+        add_weights(vg, members, weights[members, column], "REPLACE", quantize)
+        weights_written += len(members)
+    timings["write_ms"] = (time.perf_counter() - start) * 1000
+
+    return {
+        "bones": len(names),
+        "vertices": len(points),
+        "weights_written": weights_written,
+        "max_influences": max_influences,
+        **{key: round(value, 2) for key, value in timings.items()},
+        "elapsed_ms": round(sum(timings.values()), 2)
+    }
@@ -41,6 +41,7 @@ class ErrorCode(Enum):
     # Network
     CONNECTION_ERROR = "CONNECTION_ERROR"
     TIMEOUT = "TIMEOUT"
+    SERVER_BUSY = "SERVER_BUSY"
     
     # Integration
     API_KEY_MISSING = "API_KEY_MISSING"
@@ -0,0 +1,388 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Array-based F-curve access: read and write whole keyframe sets with foreach_get/foreach_set
+# bpy is imported where needed, so the array helpers also import outside Blender
+
+import base64
+import re
+import numpy as np
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+ArrayLike = Union[Sequence[float], Dict[str, Any], np.ndarray]
+
+FRAME_TOLERANCE = 1e-4  # Keys closer than this are the same frame
+
+
+def decode_array(value: ArrayLike, dtype=np.float64, name: str = "array") -> np.ndarray:
+    """
+    Accept a JSON list or a {"dtype": "float32", "data": "<base64>"} object
+    and return a flat NumPy array.
+    """
+    if isinstance(value, np.ndarray):
+        return value.astype(dtype, copy=False).ravel()
+    if isinstance(value, dict):
+        try:
+            raw = base64.b64decode(value["data"])
+            return np.frombuffer(raw, dtype=np.dtype(value.get("dtype", "float32"))).astype(dtype)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid encoded {name}: {str(e)}")
+    try:
+        return np.asarray(value, dtype=dtype).ravel()
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {name}: {str(e)}")
+
+
+def encode_array(array: np.ndarray) -> Dict[str, Any]:
+    """Pack an array as little-endian base64 for binary responses"""
+    array = np.ascontiguousarray(array)
+    little = array.astype(array.dtype.newbyteorder("<"), copy=False)
+    return {
+        "dtype": array.dtype.name,
+        "shape": list(array.shape),
+        "data": base64.b64encode(little.tobytes()).decode("ascii")
+    }
+
+
+def get_fcurves(id_data, create: bool = False):
+    """
+    Return (action, fcurve collection) for a data-block, creating the action
+    when create is True. Works with slotted actions, where F-curves live in
+    a channelbag instead of action.fcurves.
+    """
+    anim = id_data.animation_data
+    if anim is None:
+        if not create:
+            return None, None
+        anim = id_data.animation_data_create()
+
+    action = anim.action
+    if action is None:
+        if not create:
+            return None, None
+        import bpy
+        action = bpy.data.actions.new(name=f"{id_data.name}Action")
+        anim.action = action
+
+    if hasattr(action, "fcurves"):
+        return action, action.fcurves
+
+    from bpy_extras import anim_utils
+    slot = anim.action_slot
+    if slot is None:
+        if not create:
+            return action, None
+        slot = action.slots.new(id_type=id_data.id_type, name=id_data.name)
+        anim.action_slot = slot
+    if create:
+        channelbag = anim_utils.action_ensure_channelbag_for_slot(action, slot)
+    else:
+        channelbag = anim_utils.action_get_channelbag_for_slot(action, slot)
+    return action, channelbag.fcurves if channelbag else None
+
+
+def action_fcurves(action):
+    """F-curves of an action that need not be assigned; for slotted actions those of its first slot"""
+    if hasattr(action, "fcurves"):
+        return action.fcurves
+    from bpy_extras import anim_utils
+    if not len(action.slots):
+        return []
+    channelbag = anim_utils.action_get_channelbag_for_slot(action, action.slots[0])
+    return channelbag.fcurves if channelbag else []
+
+
+def data_path_matcher(patterns: Optional[Iterable[str]]) -> Callable[[Any], bool]:
+    """
+    Build a predicate for F-curves whose data path (or "path[index]") matches
+    any glob. Only * and ? are wildcards, since data paths contain brackets,
+    e.g. 'pose.bones["Hip*"].*'.
+    """
+    if not patterns:
+        return lambda fcurve: True
+    regex = re.compile("(?:" + "|".join(
+        re.escape(pattern).replace(r"\*", ".*").replace(r"\?", ".") for pattern in patterns
+    ) + ")$")
+
+    def matches(fcurve) -> bool:
+        return bool(regex.match(fcurve.data_path) or regex.match(f"{fcurve.data_path}[{fcurve.array_index}]"))
+    return matches
+
+
+def find_or_create_fcurve(fcurves, data_path: str, index: int = 0, group: Optional[str] = None):
+    fcurve = fcurves.find(data_path, index=index)
+    if fcurve is not None:
+        return fcurve
+    if group:
+        try:
+            return fcurves.new(data_path, index=index, action_group=group)
+        except TypeError:
+            pass  # Channelbag F-curves take no group argument
+    return fcurves.new(data_path, index=index)
+
+
+def interpolation_codes(interpolation: Union[str, Sequence[str]], count: int) -> np.ndarray:
+    """Map interpolation names ('BEZIER', 'LINEAR', ...) to their enum values"""
+    lookup = {name: value for value, name in interpolation_names().items()}
+    names = [interpolation] * count if isinstance(interpolation, str) else list(interpolation)
+    if len(names) != count:
+        raise ValueError(f"Expected {count} interpolation values, got {len(names)}")
+    try:
+        return np.array([lookup[name.upper()] for name in names], dtype=np.int32)
+    except KeyError as e:
+        raise ValueError(f"Unknown interpolation: {e.args[0]}. Use one of {sorted(lookup)}")
+
+
+def read_keyframes(fcurve) -> Tuple[np.ndarray, np.ndarray]:
+    """Frames and values of every key, as float64 arrays"""
+    points = fcurve.keyframe_points
+    co = np.empty(len(points) * 2, dtype=np.float32)
+    points.foreach_get("co", co)
+    return co[0::2].astype(np.float64), co[1::2].astype(np.float64)
+
+
+def keyframe_enum_names(prop: str) -> Dict[int, str]:
+    """Enum value -> name of a keyframe enum property such as 'interpolation' or 'handle_left_type'"""
+    import bpy
+    items = bpy.types.Keyframe.bl_rna.properties[prop].enum_items
+    return {item.value: item.identifier for item in items}
+
+
+def interpolation_names() -> Dict[int, str]:
+    """Enum value -> interpolation name, for decoding interpolation arrays"""
+    return keyframe_enum_names("interpolation")
+
+
+def read_keyframe_enum(points, prop: str) -> np.ndarray:
+    """Enum value of a keyframe enum property for every key"""
+    codes = np.empty(len(points), dtype=np.int32)
+    try:
+        points.foreach_get(prop, codes)
+    except (TypeError, RuntimeError, AttributeError):
+        # Older builds cannot bulk-access enum properties
+        lookup = {name: value for value, name in keyframe_enum_names(prop).items()}
+        codes[:] = [lookup[getattr(point, prop)] for point in points]
+    return codes
+
+
+def write_keyframe_enum(points, prop: str, codes: np.ndarray) -> None:
+    """Set a keyframe enum property on every key from enum values"""
+    try:
+        points.foreach_set(prop, np.asarray(codes, dtype=np.int32))
+    except (TypeError, RuntimeError, AttributeError):
+        names = keyframe_enum_names(prop)
+        for point, code in zip(points, np.asarray(codes).tolist()):
+            setattr(point, prop, names[code])
+
+
+def read_interpolation(points) -> np.ndarray:
+    """Interpolation enum value of every key"""
+    return read_keyframe_enum(points, "interpolation")
+
+
+def read_keyframe_arrays(fcurve, include_handles: bool = True) -> Dict[str, np.ndarray]:
+    """Every key of an F-curve as parallel arrays: frames, values, (N, 2) handles, interpolation"""
+    points = fcurve.keyframe_points
+    count = len(points)
+    co = np.empty(count * 2, dtype=np.float32)
+    points.foreach_get("co", co)
+    arrays = {
+        "frames": co[0::2],
+        "values": co[1::2],
+        "interpolation": read_interpolation(points)
+    }
+    if include_handles:
+        for prop in ("handle_left", "handle_right"):
+            handles = np.empty(count * 2, dtype=np.float32)
+            points.foreach_get(prop, handles)
+            arrays[prop] = handles.reshape(count, 2)
+    return arrays
+
+
+def _set_interpolation(points, indices: np.ndarray, codes: np.ndarray) -> None:
+    """Set the interpolation of the keys at the given indices"""
+    try:
+        current = np.empty(len(points), dtype=np.int32)
+        points.foreach_get("interpolation", current)
+        current[indices] = codes
+        points.foreach_set("interpolation", current)
+    except (TypeError, RuntimeError, AttributeError):
+        # Older builds cannot bulk-access enum properties
+        names = interpolation_names()
+        for index, code in zip(indices.tolist(), codes.tolist()):
+            points[index].interpolation = names[code]
+
+
+def write_keyframes(fcurve, frames: np.ndarray, values: np.ndarray,
+                    interpolation: Optional[Union[str, Sequence[str]]] = None,
+                    replace: bool = False) -> Dict[str, int]:
+    """
+    Write keys in bulk: one keyframe_points.add() and a few foreach_set calls.
+
+    Existing keys on the same frame get the new value and keep their handle
+    types; other new keys are appended and the curve is re-sorted. With
+    replace=True every existing key is removed first.
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if frames.shape != values.shape:
+        raise ValueError(f"frames and values differ in length ({len(frames)} vs {len(values)})")
+    codes = interpolation_codes(interpolation, len(frames)) if interpolation is not None else None
+
+    # Sort and keep the last value given for any frame
+    order = np.argsort(frames, kind="stable")
+    frames, values = frames[order], values[order]
+    if codes is not None:
+        codes = codes[order]
+    if len(frames) > 1:
+        last = np.append(np.diff(frames) > FRAME_TOLERANCE, True)
+        frames, values = frames[last], values[last]
+        if codes is not None:
+            codes = codes[last]
+
+    points = fcurve.keyframe_points
+    if replace and len(points):
+        points.clear()
+    existing = len(points)
+
+    co = np.empty(existing * 2, dtype=np.float32)
+    new = np.ones(len(frames), dtype=bool)
+    updated = 0
+    if existing:
+        points.foreach_get("co", co)
+        old_frames = co[0::2].astype(np.float64)
+        pos = np.clip(np.searchsorted(old_frames, frames - FRAME_TOLERANCE), 0, existing - 1)
+        match = np.abs(old_frames[pos] - frames) <= FRAME_TOLERANCE
+        new = ~match
+        updated = int(match.sum())
+        if updated:
+            handle_left = np.empty_like(co)
+            handle_right = np.empty_like(co)
+            points.foreach_get("handle_left", handle_left)
+            points.foreach_get("handle_right", handle_right)
+            # Move handles with their key so the curve keeps its shape
+            delta = values[match] - co[2 * pos[match] + 1]
+            co[2 * pos[match] + 1] = values[match]
+            handle_left[2 * pos[match] + 1] += delta
+            handle_right[2 * pos[match] + 1] += delta
+
+    added = int(new.sum())
+    if added:
+        points.add(added)
+    total = existing + added
+
+    new_co = np.empty(added * 2, dtype=np.float32)
+    new_co[0::2] = frames[new]
+    new_co[1::2] = values[new]
+    full_co = np.concatenate([co, new_co])
+    points.foreach_set("co", full_co)
+
+    if existing and updated:
+        points.foreach_set("handle_left", np.concatenate([handle_left, new_co]))
+        points.foreach_set("handle_right", np.concatenate([handle_right, new_co]))
+    elif added:
+        # New keys start with handles on the key; update() recalculates auto handles
+        left = np.empty(total * 2, dtype=np.float32)
+        right = np.empty(total * 2, dtype=np.float32)
+        points.foreach_get("handle_left", left)
+        points.foreach_get("handle_right", right)
+        left[existing * 2:] = new_co
+        right[existing * 2:] = new_co
+        points.foreach_set("handle_left", left)
+        points.foreach_set("handle_right", right)
+
+    if codes is not None:
+        indices = np.empty(len(frames), dtype=np.int64)
+        indices[new] = np.arange(existing, total)
+        if updated:
+            indices[~new] = pos[~new]
+        _set_interpolation(points, indices, codes)
+
+    fcurve.update()
+    return {"added": added, "updated": updated, "total": total}
+
+
+def _bezier_segments(frames: np.ndarray, k0: np.ndarray, h0: np.ndarray, h1: np.ndarray, k1: np.ndarray) -> np.ndarray:
+    """
+    Evaluate Bezier segments (one per frame) given as (M, 2) key and handle
+    arrays. Handles are clamped like BKE_fcurve_correct_bezpart, then the
+    curve parameter for each frame is found by bisection on x(t).
+    """
+    length = k1[:, 0] - k0[:, 0]
+    for key, handle in ((k0, h0), (k1, h1)):
+        delta = key - handle
+        handle_length = np.abs(delta[:, 0])
+        too_long = handle_length > length
+        fac = np.where(too_long, length / np.where(too_long, handle_length, 1.0), 1.0)
+        handle[:] = key - fac[:, None] * delta
+
+    def cubic(p0, p1, p2, p3, t):
+        u = 1.0 - t
+        return u * u * u * p0 + 3.0 * u * u * t * p1 + 3.0 * u * t * t * p2 + t * t * t * p3
+
+    low = np.zeros(len(frames))
+    high = np.ones(len(frames))
+    for _ in range(32):
+        mid = 0.5 * (low + high)
+        below = cubic(k0[:, 0], h0[:, 0], h1[:, 0], k1[:, 0], mid) < frames
+        low = np.where(below, mid, low)
+        high = np.where(below, high, mid)
+    return cubic(k0[:, 1], h0[:, 1], h1[:, 1], k1[:, 1], 0.5 * (low + high))
+
+
+def evaluate_fcurve(fcurve, frames: np.ndarray) -> Tuple[np.ndarray, bool]:
+    """
+    Evaluate an F-curve at many frames without changing the scene frame.
+    Returns (values, vectorized). Curves with modifiers, sampled points or
+    easing interpolations are evaluated per frame with fcurve.evaluate().
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    points = fcurve.keyframe_points
+    count = len(points)
+    lookup = {name: value for value, name in interpolation_names().items()}
+    supported = {lookup["CONSTANT"], lookup["LINEAR"], lookup["BEZIER"]}
+
+    arrays = read_keyframe_arrays(fcurve) if count else None
+    if (count == 0 or len(fcurve.modifiers) or len(getattr(fcurve, "sampled_points", ()))
+            or not np.isin(arrays["interpolation"], list(supported)).all()):
+        return np.fromiter((fcurve.evaluate(frame) for frame in frames), dtype=np.float64, count=len(frames)), False
+
+    keys = np.stack([arrays["frames"], arrays["values"]], axis=1).astype(np.float64)
+    left = arrays["handle_left"].astype(np.float64)
+    right = arrays["handle_right"].astype(np.float64)
+    ipo = arrays["interpolation"]
+    values = np.empty(len(frames))
+
+    # Inside the key range: pick each frame's segment
+    inside = (frames >= keys[0, 0]) & (frames < keys[-1, 0])
+    if count > 1 and inside.any():
+        f = frames[inside]
+        seg = np.clip(np.searchsorted(keys[:, 0], f, side="right") - 1, 0, count - 2)
+        k0, k1 = keys[seg], keys[seg + 1]
+        result = k0[:, 1].copy()  # CONSTANT
+        linear = ipo[seg] == lookup["LINEAR"]
+        span = k1[linear, 0] - k0[linear, 0]
+        result[linear] = k0[linear, 1] + (f[linear] - k0[linear, 0]) / span * (k1[linear, 1] - k0[linear, 1])
+        bezier = ipo[seg] == lookup["BEZIER"]
+        if bezier.any():
+            result[bezier] = _bezier_segments(
+                f[bezier], k0[bezier], right[seg[bezier]].copy(), left[seg[bezier] + 1].copy(), k1[bezier]
+            )
+        values[inside] = result
+
+    # Outside the key range: extrapolate from the first or last key
+    linear_extend = fcurve.extrapolation == 'LINEAR'
+    for side, mask in ((0, frames < keys[0, 0]), (-1, frames >= keys[-1, 0])):
+        if not mask.any():
+            continue
+        key = keys[side]
+        values[mask] = key[1]
+        if not linear_extend or count == 1 or ipo[side] == lookup["CONSTANT"]:
+            continue
+        if ipo[side] == lookup["LINEAR"]:
+            neighbour = keys[1] if side == 0 else keys[-2]
+            dx, dy = neighbour[0] - key[0], neighbour[1] - key[1]
+        else:
+            handle = left[0] if side == 0 else right[-1]
+            dx, dy = key[0] - handle[0], key[1] - handle[1]
+        if dx != 0:
+            values[mask] = key[1] + (frames[mask] - key[0]) * dy / dx
+    return values, True
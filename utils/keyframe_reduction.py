@@ -0,0 +1,120 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Error-bounded keyframe reduction for dense baked or motion capture curves
+
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+from utils.fcurve_arrays import (
+    evaluate_fcurve, interpolation_names, keyframe_enum_names, read_keyframe_arrays, read_keyframe_enum,
+    write_keyframe_enum, write_keyframes
+)
+
+MAX_REFINEMENTS = 8
+FIXED_HANDLE_TYPES = ("FREE", "ALIGNED")  # Handle types whose positions are not recalculated
+
+
+def rdp_keep(frames: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker on a time series. Returns a mask of keys to keep so
+    that linear interpolation between kept keys stays within tolerance of
+    every original value. Distances are measured along the value axis.
+    """
+    count = len(frames)
+    keep = np.zeros(count, dtype=bool)
+    if count == 0:
+        return keep
+    keep[0] = keep[-1] = True
+
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        inner_frames = frames[first + 1:last]
+        slope = (values[last] - values[first]) / (frames[last] - frames[first])
+        error = np.abs(values[first + 1:last] - (values[first] + (inner_frames - frames[first]) * slope))
+        worst = int(np.argmax(error))
+        if error[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def reduce_fcurve(fcurve, tolerance: float, max_refinements: int = MAX_REFINEMENTS,
+                  frame_range: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+    """
+    Simplify an F-curve in place and report the result.
+
+    Keys are chosen with RDP, written back in one bulk rebuild, and the new
+    curve (with its real interpolation and handles) is evaluated at every
+    original key. Where it still misses by more than the tolerance, the
+    worst key of each offending span is restored and the curve is rebuilt,
+    up to max_refinements times. Kept keys keep their interpolation and
+    handle types; FREE and ALIGNED handles also keep their positions.
+    With frame_range, only keys inside it may be removed.
+    """
+    arrays = read_keyframe_arrays(fcurve)
+    frames = arrays["frames"].astype(np.float64)
+    values = arrays["values"].astype(np.float64)
+    original = len(frames)
+    report = {
+        "data_path": fcurve.data_path,
+        "array_index": fcurve.array_index,
+        "original_keys": original
+    }
+    inside = np.ones(original, dtype=bool)
+    if frame_range is not None:
+        inside = (frames >= frame_range[0]) & (frames <= frame_range[1])
+    if inside.sum() < 3:
+        return {**report, "kept_keys": original, "compression_ratio": 1.0, "max_error": 0.0,
+                "within_tolerance": True}
+
+    names = interpolation_names()
+    codes = arrays["interpolation"]
+    handles = {side: (read_keyframe_enum(fcurve.keyframe_points, f"handle_{side}_type"), arrays[f"handle_{side}"])
+               for side in ("left", "right")}
+    keep = ~inside
+    keep[inside] = rdp_keep(frames[inside], values[inside], tolerance)
+    for attempt in range(max_refinements + 1):
+        kept = np.flatnonzero(keep)
+        write_keyframes(fcurve, frames[kept], values[kept],
+                        interpolation=[names[code] for code in codes[kept].tolist()], replace=True)
+        _restore_handles(fcurve, kept, handles)
+        error = np.abs(evaluate_fcurve(fcurve, frames)[0] - values)
+        bad = np.flatnonzero(error > tolerance)
+        if not len(bad) or attempt == max_refinements:
+            break
+        # Restore the worst key between each pair of kept keys that is off
+        span = np.searchsorted(kept, bad, side="right")
+        order = np.argsort(-error[bad], kind="stable")
+        _, first = np.unique(span[order], return_index=True)
+        keep[bad[order][first]] = True
+
+    kept_count = len(kept)
+    max_error = float(error.max())
+    return {
+        **report,
+        "kept_keys": kept_count,
+        "compression_ratio": round(original / kept_count, 3),
+        "max_error": max_error,
+        "within_tolerance": max_error <= tolerance
+    }
+
+
+def _restore_handles(fcurve, kept: np.ndarray, handles: Dict[str, Any]) -> None:
+    """Give the rebuilt keys their original handle types, and positions where those are fixed"""
+    points = fcurve.keyframe_points
+    for side, (types, positions) in handles.items():
+        fixed_codes = [code for code, name in keyframe_enum_names(f"handle_{side}_type").items()
+                       if name in FIXED_HANDLE_TYPES]
+        write_keyframe_enum(points, f"handle_{side}_type", types[kept])
+        fixed = np.isin(types[kept], fixed_codes)
+        if fixed.any():
+            current = np.empty(len(kept) * 2, dtype=np.float32)
+            points.foreach_get(f"handle_{side}", current)
+            current = current.reshape(-1, 2)
+            current[fixed] = positions[kept[fixed]]
+            points.foreach_set(f"handle_{side}", current.ravel())
+    # Recalculate automatic and vector handles for the restored types
+    fcurve.update()
@@ -2,7 +2,6 @@
 
 import logging
 import os
-import bpy
 from datetime import datetime
 
 class BlenderMCPLogger:
@@ -40,6 +39,7 @@ class BlenderMCPLogger:
         
         # File handler
         try:
+            import bpy
             log_dir = os.path.join(bpy.app.tempdir, "blendermcp")
             os.makedirs(log_dir, exist_ok=True)
             log_file = os.path.join(log_dir, f"blendermcp_{datetime.now().strftime('%Y%m%d')}.log")
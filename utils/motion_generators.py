@@ -0,0 +1,157 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Vectorized procedural motion: every generator evaluates all objects and frames in one NumPy pass
+
+import numpy as np
+from typing import Sequence, Tuple, Union
+
+GENERATORS = ("noise", "sine", "orbit", "spring", "bounce", "cycle")
+ORBIT_AXES = {"X": (1, 2), "Y": (2, 0), "Z": (0, 1)}  # Orbit axis -> the two components that move
+MAX_BOUNCES = 64
+
+Scalars = Union[float, Sequence[float]]
+
+
+def per_object(value: Scalars, count: int, name: str) -> np.ndarray:
+    """A scalar for every object, or one value per object"""
+    array = np.asarray(value, dtype=np.float64)
+    if array.ndim == 0:
+        return np.full(count, float(array))
+    if array.shape != (count,):
+        raise ValueError(f"{name} needs one value or {count} values (one per object), got {array.size}")
+    return array
+
+
+def per_axis(value: Scalars, count: int, name: str) -> np.ndarray:
+    """A scalar for every channel, or one value per channel"""
+    array = np.asarray(value, dtype=np.float64)
+    if array.ndim == 0:
+        return np.full(count, float(array))
+    if array.shape != (count,):
+        raise ValueError(f"{name} needs one value or {count} values (one per index), got {array.size}")
+    return array
+
+
+def object_seeds(seed: Union[int, Sequence[int]], count: int) -> np.ndarray:
+    """Object i gets seed + i, unless one seed per object is given. Seeds must not be negative."""
+    if isinstance(seed, (list, tuple)):
+        if len(seed) != count:
+            raise ValueError(f"seed needs one value or {count} values (one per object), got {len(seed)}")
+        if any(value < 0 for value in seed):
+            raise ValueError("seed values must not be negative")
+        return np.asarray(seed, dtype=np.uint64)
+    if seed < 0:
+        raise ValueError("seed must not be negative")
+    return np.uint64(seed) + np.arange(count, dtype=np.uint64)
+
+
+def object_times(frames: np.ndarray, seeds: np.ndarray, time_offset: Scalars = 0.0, offset_step: float = 0.0,
+                 offset_random: float = 0.0) -> np.ndarray:
+    """
+    (objects, frames) generator time: frames since the first frame, shifted
+    per object by time_offset, by offset_step times the object's position
+    in the list and by a seeded random amount in [-offset_random, offset_random].
+    """
+    count = len(seeds)
+    offsets = per_object(time_offset, count, "time_offset") + offset_step * np.arange(count)
+    if offset_random:
+        offsets = offsets + offset_random * _hash_uniform(np.zeros(count, dtype=np.int64), seeds, 0xA5)
+    return (frames - frames[0])[None, :] + offsets[:, None]
+
+
+def _hash_uniform(points: np.ndarray, seeds: np.ndarray, stream: int) -> np.ndarray:
+    """Deterministic values in [-1, 1] for integer lattice points (SplitMix64 finalizer)"""
+    with np.errstate(over="ignore"):
+        x = points.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        x ^= np.asarray(seeds, dtype=np.uint64) * np.uint64(0xBF58476D1CE4E5B9) + np.uint64(stream)
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 52) - 1.0
+
+
+def noise(times: np.ndarray, seeds: np.ndarray, amplitude: np.ndarray, period: float,
+          octaves: int = 1, roughness: float = 0.5) -> np.ndarray:
+    """
+    Smooth value noise with one independent curve per object and channel.
+    period is the distance in frames between random control values of the
+    first octave; each further octave halves it and scales by roughness.
+    The lattice is hashed, so a curve does not change when the frame range does.
+    """
+    axes = len(amplitude)
+    result = np.zeros(times.shape + (axes,))
+    seeds = seeds[:, None]
+    total = 0.0
+    for octave in range(octaves):
+        weight = roughness ** octave
+        position = times / (period / 2 ** octave)
+        cell = np.floor(position)
+        fraction = position - cell
+        blend = fraction * fraction * fraction * (fraction * (fraction * 6 - 15) + 10)
+        cell = cell.astype(np.int64)
+        for axis in range(axes):
+            stream = octave * 16 + axis
+            low = _hash_uniform(cell, seeds, stream)
+            high = _hash_uniform(cell + 1, seeds, stream)
+            result[:, :, axis] += weight * (low + (high - low) * blend)
+        total += weight
+    return result * (amplitude / total)
+
+
+def sine(times: np.ndarray, amplitude: np.ndarray, period: float, axis_phase: np.ndarray) -> np.ndarray:
+    """amplitude * sin(2*pi*t / period + axis_phase) per channel"""
+    angle = 2 * np.pi * times[:, :, None] / period + axis_phase
+    return amplitude * np.sin(angle)
+
+
+def orbit(times: np.ndarray, radius: np.ndarray, period: float) -> np.ndarray:
+    """
+    Circle of the given radius (per object) through the starting point:
+    (objects, frames, 2) offsets of the two in-plane components, with the
+    centre radius back along the first one. A negative period orbits the
+    other way.
+    """
+    angle = 2 * np.pi * times / period
+    result = np.empty(times.shape + (2,))
+    result[:, :, 0] = radius[:, None] * (np.cos(angle) - 1.0)
+    result[:, :, 1] = radius[:, None] * np.sin(angle)
+    return result
+
+
+def spring(times: np.ndarray, amplitude: np.ndarray, period: float, damping: float) -> np.ndarray:
+    """Damped oscillation released at t = 0 (at rest before): amplitude * e^(-damping*t) * sin(2*pi*t / period)"""
+    t = np.maximum(times, 0.0)[:, :, None]
+    return amplitude * np.exp(-damping * t) * np.sin(2 * np.pi * t / period)
+
+
+def bounce(times: np.ndarray, height: np.ndarray, period: float, restitution: float) -> np.ndarray:
+    """
+    Parabolic hops starting from the ground at t = 0. Each hop reaches
+    restitution^2 of the previous height and lasts restitution times as
+    long, as for a ball losing speed on every impact; restitution 1 bounces
+    forever.
+    """
+    hops = np.arange(MAX_BOUNCES)
+    durations = period * restitution ** hops
+    starts = np.concatenate([[0.0], np.cumsum(durations)])
+    t = times[:, :, None]
+    if restitution >= 1.0:
+        hop = np.floor(np.maximum(t, 0.0) / period)
+        u = np.maximum(t, 0.0) / period - hop
+        peak = np.ones_like(u)
+    else:
+        index = np.clip(np.searchsorted(starts, np.maximum(t, 0.0), side="right") - 1, 0, MAX_BOUNCES - 1)
+        u = np.clip((t - starts[index]) / durations[index], 0.0, 1.0)
+        peak = restitution ** (2 * index)
+        peak = np.where(t >= starts[-1], 0.0, peak)
+    return np.where(t >= 0.0, height * peak * 4.0 * u * (1.0 - u), 0.0)
+
+
+def cycle_frames(times: np.ndarray, source_range: Tuple[float, float]) -> np.ndarray:
+    """Source frames that loop source_range, e.g. a walk cycle, for every object and frame"""
+    start, end = source_range
+    length = end - start
+    if length <= 0:
+        raise ValueError("The cycle's source frame range is empty")
+    return start + np.mod(times, length)
@@ -0,0 +1,192 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Vectorized retargeting of bone animation between armatures with different rest poses
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from utils.bake_engine import rotation_to_matrices
+from utils.fcurve_arrays import evaluate_fcurve
+
+
+def _rotation_part(matrix: np.ndarray) -> np.ndarray:
+    """Rotation of a (..., 4, 4) or (..., 3, 3) matrix with its scale divided out"""
+    basis = matrix[..., :3, :3]
+    return basis / np.maximum(np.linalg.norm(basis, axis=-2, keepdims=True), 1e-12)
+
+
+class RigData:
+    """Rest matrices and hierarchy of an armature, with bones ordered parents first"""
+
+    def __init__(self, armature):
+        pose_bones = armature.pose.bones
+        depth = {}
+        for pose_bone in pose_bones:
+            level, parent = 0, pose_bone.parent
+            while parent is not None:
+                level, parent = level + 1, parent.parent
+            depth[pose_bone.name] = level
+        self.names = sorted(depth, key=depth.get)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.pose_bones = [pose_bones[name] for name in self.names]
+        self.parents = [
+            self.index[pb.parent.name] if pb.parent is not None else -1 for pb in self.pose_bones
+        ]
+        self.rest = np.array([np.array(pb.bone.matrix_local, dtype=np.float64) for pb in self.pose_bones])
+        # Rest matrix relative to the parent's rest matrix
+        self.relative = np.array([
+            self.rest[i] if parent < 0 else np.linalg.inv(self.rest[parent]) @ self.rest[i]
+            for i, parent in enumerate(self.parents)
+        ])
+        self.world = np.array(armature.matrix_world, dtype=np.float64)
+
+    def world_scale(self) -> float:
+        return float(np.mean(np.linalg.norm(self.world[:3, :3], axis=0)))
+
+
+def evaluate_bases(rig: RigData, fcurves, frames: np.ndarray) -> np.ndarray:
+    """
+    (F, bones, 4, 4) local pose matrices from an action's F-curves.
+    Channels without an F-curve keep the bone's current pose value.
+    """
+    by_path = {(fc.data_path, fc.array_index): fc for fc in fcurves}
+    count = len(frames)
+
+    def channel(pose_bone, name: str, size: int) -> np.ndarray:
+        values = np.empty((count, size))
+        current = list(getattr(pose_bone, name))
+        for index in range(size):
+            fcurve = by_path.get((f'pose.bones["{pose_bone.name}"].{name}', index))
+            values[:, index] = evaluate_fcurve(fcurve, frames)[0] if fcurve is not None else current[index]
+        return values
+
+    bases = np.zeros((count, len(rig.names), 4, 4))
+    bases[:, :, 3, 3] = 1.0
+    for i, pose_bone in enumerate(rig.pose_bones):
+        mode = pose_bone.rotation_mode
+        if mode == "QUATERNION":
+            rotation = channel(pose_bone, "rotation_quaternion", 4)
+        elif mode == "AXIS_ANGLE":
+            rotation = channel(pose_bone, "rotation_axis_angle", 4)
+        else:
+            rotation = channel(pose_bone, "rotation_euler", 3)
+        scale = channel(pose_bone, "scale", 3)
+        bases[:, i, :3, :3] = rotation_to_matrices(rotation, mode) * scale[:, None, :]
+        bases[:, i, :3, 3] = channel(pose_bone, "location", 3)
+    return bases
+
+
+def forward_kinematics(rig: RigData, bases: np.ndarray) -> np.ndarray:
+    """(F, bones, 4, 4) armature-space pose matrices from local bases (standard inheritance)"""
+    pose = np.empty_like(bases)
+    for i, parent in enumerate(rig.parents):
+        parent_matrix = rig.relative[i] if parent < 0 else pose[:, parent] @ rig.relative[i]
+        pose[:, i] = parent_matrix @ bases[:, i]
+    return pose
+
+
+class Retargeter:
+    """
+    Transfers the motion of mapped source bones onto target bones.
+
+    Each target bone gets the same rotation away from its rest pose as its
+    source bone, measured in world space, so rigs with different bone
+    rolls, rest orientations or object rotations line up. The correction
+    matrices for that are computed once per bone pair; every frame is
+    then processed at once with NumPy. Translation is transferred for
+    location bones only (by default the mapped bones without a mapped
+    ancestor, e.g. the hips), scaled by the ratio of their rest heights.
+    Bones with non-default inheritance settings are treated as inheriting
+    everything.
+    """
+
+    def __init__(self, source, target, bone_mapping: Dict[str, str],
+                 location_bones: Optional[Sequence[str]] = None, location_scale: Optional[float] = None):
+        self.source = RigData(source)
+        self.target = RigData(target)
+        self.pairs: List[Tuple[int, int]] = []
+        self.missing: List[str] = []
+        for source_name, target_name in bone_mapping.items():
+            if source_name in self.source.index and target_name in self.target.index:
+                self.pairs.append((self.source.index[source_name], self.target.index[target_name]))
+            else:
+                self.missing.append(f"{source_name} -> {target_name}")
+        if not self.pairs:
+            raise ValueError("No bone of the mapping exists in both armatures")
+
+        mapped = {s for s, _ in self.pairs}
+        if location_bones is None:
+            self.location_sources = {s for s in mapped if not self._has_mapped_ancestor(s, mapped)}
+        else:
+            self.location_sources = {self.source.index[name] for name in location_bones if name in self.source.index}
+
+        # World-space rotation from the source armature's space to the target's
+        self.space = _rotation_part(self.target.world).T @ _rotation_part(self.source.world)
+        self.corrections = {
+            t: _rotation_part(self.source.rest[s]).T @ self.space.T @ _rotation_part(self.target.rest[t])
+            for s, t in self.pairs
+        }
+        self.location_factor = self._location_factor(location_scale)
+
+    def _has_mapped_ancestor(self, bone: int, mapped: set) -> bool:
+        parent = self.source.parents[bone]
+        while parent >= 0:
+            if parent in mapped:
+                return True
+            parent = self.source.parents[parent]
+        return False
+
+    def _location_factor(self, location_scale: Optional[float]) -> float:
+        """Multiplier from source to target armature-space offsets"""
+        if location_scale is not None:
+            return location_scale * self.source.world_scale() / max(self.target.world_scale(), 1e-12)
+        for s, t in self.pairs:
+            if s in self.location_sources:
+                source_height = self.source.rest[s][2, 3]
+                target_height = self.target.rest[t][2, 3]
+                if abs(source_height) > 1e-6 and abs(target_height) > 1e-6:
+                    return float(target_height / source_height)
+        return 1.0
+
+    @property
+    def location_targets(self) -> set:
+        return {self.target.names[t] for s, t in self.pairs if s in self.location_sources}
+
+    def retarget(self, fcurves, frames: np.ndarray) -> Dict[str, np.ndarray]:
+        """Target bone name -> (F, 4, 4) local pose matrices for every frame"""
+        source_bases = evaluate_bases(self.source, fcurves, frames)
+        source_pose = forward_kinematics(self.source, source_bases)
+        source_of = {t: s for s, t in self.pairs}
+
+        count = len(frames)
+        target = self.target
+        pose = np.empty((count, len(target.names), 4, 4))
+        result = {}
+        for i, parent in enumerate(target.parents):
+            base = np.broadcast_to(target.relative[i], (count, 4, 4)) if parent < 0 else pose[:, parent] @ target.relative[i]
+            s = source_of.get(i)
+            if s is None:
+                # Unmapped bones stay in their rest pose relative to their parent
+                pose[:, i] = base
+                continue
+
+            matrix = np.zeros((count, 4, 4))
+            matrix[:, 3, 3] = 1.0
+            matrix[:, :3, :3] = self.space @ _rotation_part(source_pose[:, s]) @ self.corrections[i]
+            matrix[:, :3, 3] = base[:, :3, 3]
+            if s in self.location_sources:
+                # The source bone's own offset from where its parent chain puts it
+                source_parent = self.source.parents[s]
+                unmoved = (self.source.relative[s][:3, 3] if source_parent < 0 else
+                           (source_pose[:, source_parent] @ self.source.relative[s])[:, :3, 3])
+                offset = source_pose[:, s, :3, 3] - unmoved
+                matrix[:, :3, 3] += (offset @ self.space.T) * self.location_factor
+            pose[:, i] = matrix
+            result[target.names[i]] = np.linalg.inv(base) @ matrix
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "bones_mapped": len(self.pairs),
+            "location_bones": sorted(self.location_targets),
+            "location_factor": round(self.location_factor, 6),
+            "missing": self.missing
+        }
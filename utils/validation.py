@@ -94,6 +94,22 @@ def validate_range(value: Union[int, float], min_val: Union[int, float], max_val
     if value < min_val or value > max_val:
         raise ValidationError(f"Value must be between {min_val} and {max_val}")
 
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 5000
+
+def validate_page_size(value: int) -> None:
+    """Validate a page size"""
+    if value < 1 or value > MAX_PAGE_SIZE:
+        raise ValidationError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+DEFAULT_VERTEX_PAGE_SIZE = 100000
+MAX_VERTEX_PAGE_SIZE = 1000000
+
+def validate_vertex_page_size(value: int) -> None:
+    """Validate a page size counted in vertices"""
+    if value < 1 or value > MAX_VERTEX_PAGE_SIZE:
+        raise ValidationError(f"Page size must be between 1 and {MAX_VERTEX_PAGE_SIZE} vertices")
+
 def validate_enum(value: Any, allowed_values: List[Any]) -> None:
     """Validate that a value is in allowed list"""
     if value not in allowed_values:
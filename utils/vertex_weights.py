@@ -0,0 +1,274 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Array-based vertex group access: bulk weight writes without one call per vertex
+
+import numpy as np
+from typing import Any, Dict, Iterable, Optional, Sequence
+from utils.fcurve_arrays import decode_array
+
+WEIGHT_MODES = ("REPLACE", "ADD", "SUBTRACT", "REMOVE")
+
+
+class WeightMatrix:
+    """
+    Vertex weights as a sparse CSR matrix over a range of vertices: vertex
+    start + row belongs to groups[indptr[row]:indptr[row + 1]] with the
+    matching weights. Group indices are vertex group indices.
+    """
+
+    __slots__ = ("start", "indptr", "groups", "weights")
+
+    def __init__(self, start: int, indptr: np.ndarray, groups: np.ndarray, weights: np.ndarray):
+        self.start = start
+        self.indptr = indptr
+        self.groups = groups
+        self.weights = weights
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self) -> int:
+        return len(self.groups)
+
+    def rows(self) -> np.ndarray:
+        """Row of every stored weight"""
+        return np.repeat(np.arange(self.vertex_count), np.diff(self.indptr))
+
+    def select(self, mask: np.ndarray) -> "WeightMatrix":
+        """Matrix with only the stored weights where mask is True"""
+        counts = np.bincount(self.rows()[mask], minlength=self.vertex_count)
+        indptr = np.zeros(self.vertex_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return WeightMatrix(self.start, indptr, self.groups[mask], self.weights[mask])
+
+    def column(self, group_index: int) -> Dict[int, float]:
+        """{vertex_index: weight} of one group"""
+        mask = self.groups == group_index
+        vertices = self.rows()[mask] + self.start
+        return dict(zip(vertices.tolist(), self.weights[mask].tolist()))
+
+
+def read_weight_matrix(mesh, group_count: int, start: int = 0, stop: Optional[int] = None) -> WeightMatrix:
+    """
+    Read the weights of vertices [start, stop) in one pass over each
+    vertex's group memberships, instead of one vertex_group.weight() call
+    (and exception for non-members) per vertex and group. Memberships of
+    groups that no longer exist (index >= group_count) are skipped.
+    """
+    vertices = mesh.vertices
+    stop = len(vertices) if stop is None else min(stop, len(vertices))
+    counts = []
+    groups = []
+    weights = []
+    for vertex in vertices[start:stop]:
+        elements = vertex.groups
+        counts.append(len(elements))
+        for element in elements:
+            groups.append(element.group)
+            weights.append(element.weight)
+
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    matrix = WeightMatrix(start, indptr, np.array(groups, dtype=np.int32), np.array(weights, dtype=np.float32))
+    if matrix.nnz and matrix.groups.max() >= group_count:
+        matrix = matrix.select(matrix.groups < group_count)
+    return matrix
+
+
+def decode_weights(indices: Any, weights: Any, vertex_count: int, name: str = "weights"):
+    """
+    Parallel (int64 indices, float32 weights) arrays from JSON lists, base64
+    arrays or a legacy {vertex_index: weight} dict. A single number as
+    weights applies to every index.
+    """
+    if isinstance(weights, dict) and "data" not in weights:
+        if indices is not None:
+            raise ValueError(f"Give {name} either as a {{vertex_index: weight}} object or together with indices")
+        try:
+            index_array = np.fromiter((int(key) for key in weights), dtype=np.int64, count=len(weights))
+            weight_array = np.fromiter((float(value) for value in weights.values()), dtype=np.float32,
+                                       count=len(weights))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid {name}: {str(e)}")
+    else:
+        if indices is None:
+            raise ValueError(f"{name} given as an array needs indices")
+        index_array = decode_array(indices, dtype=np.int64, name="indices")
+        if isinstance(weights, (int, float)):
+            weight_array = np.full(len(index_array), weights, dtype=np.float32)
+        else:
+            weight_array = decode_array(weights, dtype=np.float32, name=name)
+        if len(weight_array) != len(index_array):
+            raise ValueError(f"{len(index_array)} indices but {len(weight_array)} {name}")
+
+    if len(index_array) and (index_array.min() < 0 or index_array.max() >= vertex_count):
+        raise ValueError(f"Vertex indices must be in [0, {vertex_count - 1}]")
+    return index_array, weight_array
+
+
+def add_weights(vertex_group, indices: np.ndarray, weights: np.ndarray, mode: str = "REPLACE",
+                quantize: Optional[int] = None) -> Dict[str, int]:
+    """
+    Write weights with one vertex_group.add() per distinct weight instead of
+    one per vertex. quantize rounds weights to 1/quantize first, which
+    bounds the number of calls (e.g. 1000 -> at most 1001) for smooth
+    gradients where nearly every weight differs. A vertex listed twice
+    keeps its last weight, or the sum of its weights in ADD/SUBTRACT mode.
+    """
+    if mode not in WEIGHT_MODES:
+        raise ValueError(f"Unknown mode '{mode}'. Use one of {list(WEIGHT_MODES)}")
+    indices = np.asarray(indices, dtype=np.int64)
+    if mode == "REMOVE":
+        unique = np.unique(indices)
+        if len(unique):
+            vertex_group.remove(unique.tolist())
+        return {"vertices": len(unique), "calls": 1 if len(unique) else 0}
+
+    weights = np.asarray(weights, dtype=np.float32)
+    if mode == "REPLACE":
+        # Last occurrence wins
+        reverse_unique, reverse_first = np.unique(indices[::-1], return_index=True)
+        indices, weights = reverse_unique, weights[::-1][reverse_first]
+    else:
+        indices, inverse = np.unique(indices, return_inverse=True)
+        weights = np.bincount(inverse, weights=weights, minlength=len(indices)).astype(np.float32)
+    weights = np.clip(weights, 0.0, 1.0)
+    if quantize:
+        weights = (np.round(weights * quantize) / quantize).astype(np.float32)
+
+    order = np.argsort(weights, kind="stable")
+    sorted_weights = weights[order]
+    values, starts = np.unique(sorted_weights, return_index=True)
+    ends = np.append(starts[1:], len(order))
+    for value, start, end in zip(values.tolist(), starts.tolist(), ends.tolist()):
+        vertex_group.add(indices[order[start:end]].tolist(), value, mode)
+    return {"vertices": len(indices), "calls": len(values)}
+
+
+class WeightEngine:
+    """
+    Normalize, clamp, prune and limit vertex weights in NumPy, without
+    operators or mode changes.
+
+    The weights of the mesh are read once into a WeightMatrix. Each
+    operation then works on all vertices at once. Groups with lock_weight
+    (plus any extra locked_groups) are never changed, but locked weights
+    still count towards normalization totals and influence limits.
+    Operations apply only to the groups in group_names when it is given;
+    other groups are neither changed nor counted. write() stores the
+    changed weights and removes pruned memberships.
+    """
+
+    def __init__(self, mesh_obj, group_names: Optional[Sequence[str]] = None,
+                 locked_groups: Iterable[int] = ()):
+        self.mesh_obj = mesh_obj
+        vertex_groups = mesh_obj.vertex_groups
+        self.matrix = read_weight_matrix(mesh_obj.data, len(vertex_groups))
+        groups = self.matrix.groups
+        self.rows = self.matrix.rows()
+        self.weights = self.matrix.weights.copy()
+        self.keep = np.ones(self.matrix.nnz, dtype=bool)
+
+        locked = {vg.index for vg in vertex_groups if vg.lock_weight} | set(locked_groups)
+        if group_names is None:
+            self.scope = np.ones(self.matrix.nnz, dtype=bool)
+        else:
+            missing = [name for name in group_names if name not in vertex_groups]
+            if missing:
+                raise ValueError(f"Vertex groups not found: {', '.join(missing)}")
+            self.scope = np.isin(groups, [vertex_groups[name].index for name in group_names])
+        self.locked = np.isin(groups, list(locked)) if locked else np.zeros(self.matrix.nnz, dtype=bool)
+
+    @property
+    def editable(self) -> np.ndarray:
+        return self.scope & ~self.locked & self.keep
+
+    def _row_sums(self, mask: np.ndarray) -> np.ndarray:
+        return np.bincount(self.rows[mask], weights=self.weights[mask], minlength=self.matrix.vertex_count)
+
+    def clamp(self, low: float = 0.0, high: float = 1.0) -> int:
+        """Clamp editable weights to [low, high]; returns how many changed"""
+        mask = self.editable
+        clamped = np.clip(self.weights[mask], low, high)
+        changed = int(np.count_nonzero(clamped != self.weights[mask]))
+        self.weights[mask] = clamped
+        return changed
+
+    def prune(self, threshold: float = 0.0) -> int:
+        """Remove editable memberships with a weight at or below threshold; returns how many"""
+        remove = self.editable & (self.weights <= threshold)
+        self.keep &= ~remove
+        return int(remove.sum())
+
+    def limit(self, max_influences: int) -> int:
+        """
+        Keep at most max_influences groups per vertex, dropping the smallest
+        editable weights first. Locked weights always stay and use up slots.
+        """
+        candidates = np.nonzero(self.scope & self.keep)[0]
+        if not len(candidates):
+            return 0
+        rows = self.rows[candidates]
+        # Per vertex: locked first, then by falling weight
+        order = np.lexsort((-self.weights[candidates], ~self.locked[candidates], rows))
+        candidates, rows = candidates[order], rows[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows, side="left")
+        remove = candidates[(rank >= max_influences) & ~self.locked[candidates]]
+        self.keep[remove] = False
+        return len(remove)
+
+    def normalize(self) -> int:
+        """
+        Scale editable weights so every vertex's weights sum to 1. Locked
+        weights are subtracted from the total first; if they reach 1 the
+        editable weights become 0. Vertices without editable weight are
+        left alone. Returns how many vertices changed.
+        """
+        editable = self.editable
+        unlocked = self._row_sums(editable)
+        locked = self._row_sums(self.scope & self.locked & self.keep)
+        target = np.maximum(1.0 - locked, 0.0)
+        scalable = (unlocked > 0) & (np.abs(unlocked - target) > 1e-6)
+        factors = np.ones(self.matrix.vertex_count)
+        factors[scalable] = target[scalable] / unlocked[scalable]
+        self.weights[editable] = (self.weights[editable] * factors[self.rows[editable]]).astype(np.float32)
+        return int(scalable.sum())
+
+    def normalize_group(self, group_index: int) -> bool:
+        """Scale one group so its largest weight is 1 (like vertex_group_normalize); False if locked or empty"""
+        mask = self.editable & (self.matrix.groups == group_index)
+        if not mask.any():
+            return False
+        peak = self.weights[mask].max()
+        if peak <= 0:
+            return False
+        self.weights[mask] /= peak
+        return True
+
+    def influence_counts(self) -> np.ndarray:
+        return np.bincount(self.rows[self.scope & self.keep], minlength=self.matrix.vertex_count)
+
+    def write(self) -> Dict[str, int]:
+        """Store changed weights on the vertex group elements and remove dropped memberships"""
+        matrix = self.matrix
+        vertices = self.mesh_obj.data.vertices
+        vertex_groups = self.mesh_obj.vertex_groups
+
+        changed = np.nonzero(self.keep & (self.weights != matrix.weights))[0]
+        current = -1
+        elements = {}
+        for vertex, group, weight in zip((self.rows[changed] + matrix.start).tolist(),
+                                         matrix.groups[changed].tolist(), self.weights[changed].tolist()):
+            if vertex != current:
+                elements = {element.group: element for element in vertices[vertex].groups}
+                current = vertex
+            elements[group].weight = weight
+
+        removed = np.nonzero(~self.keep)[0]
+        removed_groups = matrix.groups[removed]
+        removed_vertices = self.rows[removed] + matrix.start
+        for group in np.unique(removed_groups).tolist():
+            vertex_groups[group].remove(removed_vertices[removed_groups == group].tolist())
+
+        return {"weights_changed": len(changed), "weights_removed": len(removed)}
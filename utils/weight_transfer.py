@@ -0,0 +1,177 @@
+# Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
+# Direct vertex weight transfer between meshes through cached spatial indices
+
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+from mathutils.kdtree import KDTree
+from typing import Dict, List, Optional, Sequence, Tuple
+from core.revisions import revisions
+from core.scene_events import scene_events
+from utils.cache import NEVER_EXPIRE, cache
+from utils.vertex_weights import read_weight_matrix
+
+TRANSFER_METHODS = ("NEAREST", "INVERSE_DISTANCE", "SURFACE")
+DEFAULT_NEIGHBOURS = 4
+_TREE_BYTES_PER_ELEMENT = 64  # Rough cost of a vertex in the KD-tree or a triangle in the BVH
+
+cache.set_quota("weight_source", max_entries=8)
+
+
+def world_coordinates(mesh_obj) -> np.ndarray:
+    """(V, 3) vertex positions in world space"""
+    vertices = mesh_obj.data.vertices
+    coords = np.empty(len(vertices) * 3, dtype=np.float64)
+    vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3)
+    world = np.array(mesh_obj.matrix_world, dtype=np.float64)
+    return coords @ world[:3, :3].T + world[:3, 3]
+
+
+def _barycentric(points: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """(N, 3) barycentric coordinates of points on triangles abc, clamped into the triangle"""
+    v0, v1, v2 = b - a, c - a, points - a
+    d00 = np.einsum("ij,ij->i", v0, v0)
+    d01 = np.einsum("ij,ij->i", v0, v1)
+    d11 = np.einsum("ij,ij->i", v1, v1)
+    d20 = np.einsum("ij,ij->i", v2, v0)
+    d21 = np.einsum("ij,ij->i", v2, v1)
+    denominator = d00 * d11 - d01 * d01
+    degenerate = np.abs(denominator) < 1e-20
+    denominator[degenerate] = 1.0
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+    result = np.clip(np.stack([1.0 - v - w, v, w], axis=1), 0.0, 1.0)
+    result[degenerate] = (1.0, 0.0, 0.0)
+    return result / result.sum(axis=1, keepdims=True)
+
+
+class SourceIndex:
+    """
+    Spatial index and weights of a source mesh, built once per source mesh
+    revision and shared by every target. Weights stay in sparse form; only
+    the transferred groups are expanded. The KD-tree over world-space
+    vertices and the BVH over its triangles are built on first use.
+    """
+
+    def __init__(self, mesh_obj, revision: int = 0):
+        self.name = mesh_obj.name
+        self.revision = revision
+        self.coords = world_coordinates(mesh_obj)
+        self.group_names = [vg.name for vg in mesh_obj.vertex_groups]
+        self.matrix = read_weight_matrix(mesh_obj.data, len(self.group_names))
+        self.rows = self.matrix.rows()
+
+        mesh = mesh_obj.data
+        mesh.calc_loop_triangles()
+        triangles = mesh.loop_triangles
+        self.triangles = np.empty(len(triangles) * 3, dtype=np.int32)
+        triangles.foreach_get("vertices", self.triangles)
+        self.triangles = self.triangles.reshape(-1, 3)
+        self._kd: Optional[KDTree] = None
+        self._bvh: Optional[BVHTree] = None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the index, counting the spatial trees as if built"""
+        matrix = self.matrix
+        arrays = (self.coords, self.triangles, self.rows, matrix.indptr, matrix.groups, matrix.weights)
+        return (sum(array.nbytes for array in arrays)
+                + (len(self.coords) + len(self.triangles)) * _TREE_BYTES_PER_ELEMENT)
+
+    @property
+    def kd(self) -> KDTree:
+        if self._kd is None:
+            kd = KDTree(len(self.coords))
+            for index, co in enumerate(self.coords.tolist()):
+                kd.insert(co, index)
+            kd.balance()
+            self._kd = kd
+        return self._kd
+
+    @property
+    def bvh(self) -> BVHTree:
+        if self._bvh is None:
+            self._bvh = BVHTree.FromPolygons(self.coords.tolist(), self.triangles.tolist())
+        return self._bvh
+
+    def contributions(self, points: np.ndarray, method: str,
+                      neighbours: int = DEFAULT_NEIGHBOURS) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        For (N, 3) world-space points: (N, K) source vertex indices and
+        (N, K) blend factors summing to 1.
+        """
+        if method == "SURFACE" and len(self.triangles):
+            return self._surface(points)
+        if method == "INVERSE_DISTANCE" and neighbours > 1:
+            return self._inverse_distance(points, min(neighbours, len(self.coords)))
+        find = self.kd.find
+        indices = np.fromiter((find(co)[1] for co in points.tolist()), dtype=np.int64, count=len(points))
+        return indices[:, None], np.ones((len(points), 1))
+
+    def _inverse_distance(self, points: np.ndarray, neighbours: int) -> Tuple[np.ndarray, np.ndarray]:
+        indices = np.empty((len(points), neighbours), dtype=np.int64)
+        distances = np.empty((len(points), neighbours))
+        find_n = self.kd.find_n
+        for row, co in enumerate(points.tolist()):
+            found = find_n(co, neighbours)
+            indices[row] = [index for _, index, _ in found]
+            distances[row] = [distance for _, _, distance in found]
+        factors = 1.0 / np.maximum(distances, 1e-8) ** 2
+        return indices, factors / factors.sum(axis=1, keepdims=True)
+
+    def _surface(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Barycentric blend of the closest triangle's corners"""
+        find_nearest = self.bvh.find_nearest
+        hits = np.empty((len(points), 3))
+        faces = np.empty(len(points), dtype=np.int64)
+        for row, co in enumerate(points.tolist()):
+            location, _, face, _ = find_nearest(Vector(co))
+            hits[row] = location
+            faces[row] = face
+        corners = self.triangles[faces]
+        factors = _barycentric(hits, self.coords[corners[:, 0]], self.coords[corners[:, 1]], self.coords[corners[:, 2]])
+        return corners.astype(np.int64), factors
+
+    def transfer(self, points: np.ndarray, groups: Sequence[int], method: str,
+                 neighbours: int = DEFAULT_NEIGHBOURS) -> np.ndarray:
+        """(N, len(groups)) weights interpolated at the points"""
+        indices, factors = self.contributions(points, method, neighbours)
+        return np.einsum("nk,nkg->ng", factors, self.group_weights(groups)[indices]).astype(np.float32)
+
+    def group_weights(self, groups: Sequence[int]) -> np.ndarray:
+        """(V, len(groups)) dense weights of the given source groups"""
+        columns = np.full(len(self.group_names), -1, dtype=np.int64)
+        columns[list(groups)] = np.arange(len(groups))
+        selected = columns[self.matrix.groups]
+        mask = selected >= 0
+        weights = np.zeros((len(self.coords), len(groups)), dtype=np.float32)
+        weights[self.rows[mask], selected[mask]] = self.matrix.weights[mask]
+        return weights
+
+
+def get_source_index(mesh_obj) -> Tuple[SourceIndex, bool]:
+    """
+    (index, cached) for a source mesh. One entry per source, rebuilt in place
+    when the object's revision moves on, so stale indices never pile up.
+    """
+    key = f"weight_source:{mesh_obj.name}"
+    revision = revisions.object_revision(mesh_obj.name)
+    index = cache.get(key)
+    if index is not None and index.revision == revision:
+        return index, True
+    index = SourceIndex(mesh_obj, revision)
+    ttl = NEVER_EXPIRE if scene_events.active else 5
+    cache.set(key, index, ttl=ttl, tags=[f"OBJECT:{mesh_obj.name}", f"MESH:{mesh_obj.data.name}"],
+              size=index.nbytes)
+    return index, False
+
+
+def source_groups(index: SourceIndex, names: Optional[List[str]]) -> Dict[str, int]:
+    """Name -> source group index of the groups to transfer (all by default)"""
+    if names is None:
+        return {name: i for i, name in enumerate(index.group_names)}
+    missing = [name for name in names if name not in index.group_names]
+    if missing:
+        raise ValueError(f"Vertex groups not found on '{index.name}': {', '.join(missing)}")
+    return {name: index.group_names.index(name) for name in names}